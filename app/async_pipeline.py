@@ -0,0 +1,156 @@
+# app/async_pipeline.py
+'''
+Moduł udostępniający rozpoznawanie gestów jako asynchroniczny strumień wyników.
+
+Pozwala osadzić potok CameraHandler w usłudze asyncio bez okna Tk:
+
+    async with AsyncGesturePipeline() as pipeline:
+        async for output in pipeline.outputs():
+            ...
+
+Klatki czyta wątek kamery (FrameGrabber), a detekcja działa w jednowątkowym wykonawcy,
+więc pętla zdarzeń nigdy nie blokuje się na urządzeniu ani na modelu. Wykonawca czeka
+na nową klatkę (bez odpytywania) i przekazuje wynik do ograniczonej kolejki; gdy
+konsument nie nadąża, najstarszy wynik jest odrzucany, aby strumień pozostawał aktualny.
+'''
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import TYPE_CHECKING, Final
+
+from camera_handler import CameraHandler, CameraOutput
+
+if TYPE_CHECKING:
+    from app.state import Gesture
+
+DEFAULT_QUEUE_SIZE: Final[int] = 4
+# Najdłuższe jednorazowe oczekiwanie wykonawcy na klatkę; ogranicza też czas zamykania
+POLL_INTERVAL_S: Final[float] = 0.1
+
+
+class AsyncGesturePipeline:
+    '''
+    Asynchroniczny strumień wyników CameraHandler dla jednego konsumenta.
+
+    Wyniki są niezależne od buforów potoku (punkty dłoni skopiowane), więc można je
+    przechowywać dowolnie długo. Klatki podglądu są kopiowane tylko przy `include_frames`;
+    domyślnie pole `frame` jest puste. Wyniki bez klatki (brak kamery, błąd odczytu)
+    są przekazywane tylko przy zmianie stanu.
+    '''
+
+    def __init__(
+        self,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        include_frames: bool = False,
+        handler_factory: Callable[[], CameraHandler] = CameraHandler,
+        poll_interval_s: float = POLL_INTERVAL_S,
+    ) -> None:
+        if queue_size < 1:
+            raise ValueError(f'Queue size must be positive: {queue_size}')
+        self.include_frames = include_frames
+        self.poll_interval_s = poll_interval_s
+        self.dropped_outputs = 0
+        self._handler_factory = handler_factory
+        self._handler: CameraHandler | None = None
+        # None w kolejce oznacza koniec strumienia
+        self._queue: asyncio.Queue[CameraOutput | None] = asyncio.Queue(queue_size)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='GesturePipeline')
+        self._producer: asyncio.Task[None] | None = None
+        self._error: BaseException | None = None
+        self._last_status: Gesture | None = None
+        self._stopped = False
+
+    async def __aenter__(self) -> 'AsyncGesturePipeline':
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        '''Tworzy CameraHandler w wykonawcy i uruchamia zadanie producenta.'''
+        if self._stopped:
+            raise RuntimeError('Pipeline has been stopped')
+        if self._producer is not None:
+            return
+        loop = asyncio.get_running_loop()
+        self._handler = await loop.run_in_executor(self._executor, self._handler_factory)
+        self._producer = asyncio.create_task(self._produce(self._handler))
+
+    async def stop(self) -> None:
+        '''Kończy strumień i zwalnia kamerę; bieżąca detekcja jest dokańczana w wykonawcy.'''
+        if self._stopped:
+            return
+        self._stopped = True
+        if self._producer is not None:
+            self._producer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._producer
+        else:
+            self._publish(None)
+        if self._handler is not None:
+            # Jednowątkowy wykonawca zwolni kamerę dopiero po zakończeniu trwającej detekcji
+            await asyncio.get_running_loop().run_in_executor(self._executor, self._handler.release)
+        self._executor.shutdown(wait=False)
+
+    async def outputs(self) -> AsyncIterator[CameraOutput]:
+        '''
+        Zwraca kolejne wyniki aż do zatrzymania potoku lub końca skończonego źródła.
+        Błąd potoku jest zgłaszany konsumentowi po odebraniu wcześniejszych wyników.
+        '''
+        await self.start()
+        while (output := await self._queue.get()) is not None:
+            yield output
+        if self._error is not None:
+            raise self._error
+
+    async def _produce(self, handler: CameraHandler) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while not handler.source_finished:
+                output = await loop.run_in_executor(self._executor, self._next_output, handler)
+                if output is not None:
+                    self._publish(output)
+        except Exception as exc:
+            logging.exception("Gesture pipeline failed.")
+            self._error = exc
+        finally:
+            self._publish(None)
+
+    def _next_output(self, handler: CameraHandler) -> CameraOutput | None:
+        '''Czeka na klatkę i przetwarza ją; wywoływane wyłącznie w wątku wykonawcy.'''
+        handler.wait_for_frame(self.poll_interval_s)
+        output = handler.process_frame()
+        if output.frame is not None:
+            if not output.fresh:
+                # Brak nowej klatki - process_frame zwrócił poprzedni wynik
+                return None
+            self._last_status = None
+            return self._detached(output)
+        if output.gesture is self._last_status:
+            return None
+        self._last_status = output.gesture
+        return output
+
+    def _detached(self, output: CameraOutput) -> CameraOutput:
+        '''Kopiuje dane z buforów współdzielonych, nadpisywanych przy następnej klatce.'''
+        hands = tuple(hand._replace(landmarks=hand.landmarks.copy()) for hand in output.hands)
+        frame = output.frame.copy() if self.include_frames and output.frame is not None else None
+        return output._replace(
+            frame=frame, landmarks=hands[0].landmarks if hands else None, hands=hands
+        )
+
+    def _publish(self, output: CameraOutput | None) -> None:
+        '''Wstawia wynik do kolejki, odrzucając najstarszy, gdy kolejka jest pełna.'''
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped_outputs += 1
+        self._queue.put_nowait(output)
@@ -0,0 +1,133 @@
+# app/capture.py
+'''
+Moduł odpowiedzialny za pobieranie klatek z kamery w osobnym wątku.
+Wątek producenta zapisuje zawsze tylko najnowszą klatkę, więc konsument
+nigdy nie czeka na urządzenie i nie przetwarza nieaktualnych klatek.
+'''
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Final
+
+import numpy as np
+import numpy.typing as npt
+
+from app.latency import LATENCY, STAGE_CAPTURE
+
+Frame = npt.NDArray[np.uint8]
+ReadFunction = Callable[[], tuple[bool, Frame | None]]
+
+RATE_WINDOW: Final[int] = 30
+STOP_TIMEOUT_S: Final[float] = 1.0
+
+
+class RateMeter:
+    '''Mierzy częstotliwość zdarzeń (Hz) w przesuwnym oknie ostatnich znaczników czasu.'''
+
+    def __init__(self, window: int = RATE_WINDOW) -> None:
+        self._timestamps: deque[float] = deque(maxlen=window)
+
+    def tick(self, timestamp: float | None = None) -> None:
+        self._timestamps.append(time.perf_counter() if timestamp is None else timestamp)
+
+    @property
+    def rate(self) -> float:
+        if len(self._timestamps) < 2:
+            return 0.0
+        elapsed = self._timestamps[-1] - self._timestamps[0]
+        return (len(self._timestamps) - 1) / elapsed if elapsed > 0 else 0.0
+
+
+class LatestFrameSlot:
+    '''
+    Chroniona blokadą "szczelina" na jedną klatkę.
+    Nowa klatka nadpisuje poprzednią, jeśli ta nie została jeszcze odebrana.
+    '''
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        self._frame: Frame | None = None
+        self._closed = False
+        self.dropped_frames = 0
+
+    def put(self, frame: Frame) -> None:
+        with self._lock:
+            if self._frame is not None:
+                self.dropped_frames += 1
+            self._frame = frame
+            self._ready.notify_all()
+
+    def close(self) -> None:
+        '''Oznacza koniec dostaw klatek i budzi oczekujących konsumentów.'''
+        with self._lock:
+            self._closed = True
+            self._ready.notify_all()
+
+    def wait(self, timeout: float) -> bool:
+        '''
+        Blokuje najwyżej `timeout` s, aż pojawi się nieodebrana klatka lub producent
+        zakończy pracę. Zwraca False po upływie czasu.
+        '''
+        with self._ready:
+            return self._ready.wait_for(lambda: self._frame is not None or self._closed, timeout)
+
+    def take(self) -> Frame | None:
+        '''Zwraca najnowszą nieodebraną klatkę lub None, nie blokując.'''
+        with self._lock:
+            frame, self._frame = self._frame, None
+        return frame
+
+
+class FrameGrabber:
+    '''
+    Wątek producenta, który w pętli czyta klatki funkcją `read` i umieszcza je
+    w LatestFrameSlot. Nieudany odczyt lub wyjątek kończy pętlę i ustawia flagę `failed`.
+    '''
+
+    def __init__(self, read: ReadFunction) -> None:
+        self._read = read
+        self.slot = LatestFrameSlot()
+        self.meter = RateMeter()
+        self.failed = False
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='FrameGrabber', daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(STOP_TIMEOUT_S)
+            if self._thread.is_alive():
+                logging.warning("Capture thread did not stop within %.1f s.", STOP_TIMEOUT_S)
+
+    @property
+    def capture_fps(self) -> float:
+        return self.meter.rate
+
+    def take(self) -> Frame | None:
+        return self.slot.take()
+
+    def _run(self) -> None:
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    with LATENCY.span(STAGE_CAPTURE):
+                        ret, frame = self._read()
+                except Exception:
+                    logging.exception("Capture thread failed while reading a frame.")
+                    self.failed = True
+                    return
+                if not ret or frame is None:
+                    if not self._stop_event.is_set():
+                        logging.warning("Capture thread could not read frame from camera.")
+                        self.failed = True
+                    return
+                self.meter.tick()
+                self.slot.put(frame)
+        finally:
+            self.slot.close()
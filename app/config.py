@@ -5,7 +5,7 @@ Centralny moduł konfiguracyjny aplikacji.
 Zawiera wszystkie parametry, które można dostosować,
 aby zmienić zachowanie aplikacji bez modyfikacji jej głównej logiki.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -16,14 +16,101 @@ class CameraConfig:
     finger_straight_angle_threshold: float = 160.0
     finger_bent_angle_threshold: float = 100.0
     thumb_straight_angle_threshold: float = 150.0
+    # Źródło klatek: 'camera', 'video' (plik), 'images' (katalog) lub 'synthetic'
+    source: str = 'camera'
+    source_path: str = ''
+    # Tempo dla obrazów i generatora syntetycznego (plik wideo używa własnego FPS)
+    source_fps: float = 30.0
+    # False = odtwarzanie tak szybko, jak się da (do pomiarów warto wyłączyć threaded_capture,
+    # aby żadna klatka nie była pomijana)
+    source_realtime: bool = True
+    source_loop: bool = True
     camera_index: int = 0
+    frame_width: int = 640
+    frame_height: int = 480
+    # Liczba śledzonych dłoni; każda dostaje stabilny identyfikator w CameraOutput.hands
+    max_num_hands: int = 1
+    # Maksymalne przesunięcie nadgarstka (we współrzędnych znormalizowanych) między klatkami,
+    # przy którym dłoń zachowuje swój identyfikator
+    hand_track_max_distance: float = 0.15
+    # Odczyt z kamery w osobnym wątku - process_frame nigdy nie czeka na urządzenie
+    threaded_capture: bool = True
+    # Gdzie działa detekcja dłoni: 'inline' (wątek UI) lub 'process' (osobny proces roboczy)
+    inference_backend: str = 'inline'
+    # Tryb adaptacyjny (tylko 'inline'): pełna detekcja co N klatek, a pomiędzy nimi
+    # przesuwanie punktów przepływem optycznym; N dobierane z budżetu czasu na klatkę
+    adaptive_inference: bool = False
+    inference_budget_ms: float = 8.0
+    max_detection_interval: int = 6
+    # Średnie przesunięcie punktów (część szerokości/wysokości kadru na klatkę),
+    # powyżej którego następna klatka przechodzi pełną detekcję
+    redetect_motion_threshold: float = 0.03
+    # Detekcja (tylko 'inline') na przyciętym i pomniejszonym obszarze wokół ostatniej dłoni;
+    # co roi_full_frame_interval klatek oraz po zgubieniu dłoni używana jest cała klatka
+    roi_inference: bool = False
+    roi_padding: float = 0.5
+    # Bok kwadratu (w pikselach), do którego skalowane jest ROI przed detekcją
+    roi_inference_size: int = 256
+    roi_full_frame_interval: int = 30
+    # Ponowne łączenie z kamerą w tle: opóźnienie rośnie wykładniczo od initial do max,
+    # z losowym rozrzutem +/- jitter (ułamek opóźnienia). Po reconnect_max_attempts
+    # nieudanych próbach stan zmienia się na "failed", ale próby trwają co max opóźnienie
+    reconnect_initial_delay_s: float = 0.5
+    reconnect_max_delay_s: float = 10.0
+    reconnect_backoff: float = 2.0
+    reconnect_jitter: float = 0.2
+    reconnect_max_attempts: int = 5
+
+
+@dataclass
+class GestureConfig:
+    """
+    Definicje gestów statycznych.
+
+    Każdy gest to stany palców w kolejności: kciuk, wskazujący, środkowy, serdeczny, mały.
+    Dozwolone stany to 'straight', 'bent' oraz 'any'. Kolejność wpisów wyznacza priorytet,
+    gdy ten sam układ palców pasuje do kilku definicji.
+    """
+    definitions: dict[str, tuple[str, str, str, str, str]] = field(
+        default_factory=lambda: {
+            'OPEN_HAND': ('straight', 'straight', 'straight', 'straight', 'straight'),
+            'THUMBS_UP': ('straight', 'bent', 'bent', 'bent', 'bent'),
+            'POINTING': ('bent', 'straight', 'bent', 'bent', 'bent'),
+            'VICTORY': ('bent', 'straight', 'straight', 'bent', 'bent'),
+            'FIST': ('bent', 'bent', 'bent', 'bent', 'bent'),
+        }
+    )
 
 
 @dataclass
 class AnimationConfig:
     """Konfiguracja parametrów animacji i logiki."""
+    # Wygładzanie obrotu zależne od czasu, nie od liczby klatek: smoothing_factor to część
+    # pozostałej drogi do celu pokonywana w czasie smoothing_reference_s
     smoothing_factor: float = 0.08
+    smoothing_reference_s: float = 0.015
+    # Docelowe częstotliwości (Hz) etapów pętli: kamera z detekcją gestów, animacja i rysowanie
+    camera_rate_hz: float = 30.0
+    animation_rate_hz: float = 60.0
+    render_rate_hz: float = 60.0
+    # Zmiana kąta (w stopniach) względem ostatnio narysowanej klatki, poniżej której
+    # scena 3D nie jest przerysowywana; w tej odległości od celu animacja kończy się
+    redraw_angle_epsilon: float = 0.05
+    # Maksymalna częstotliwość odświeżania podglądu kamery (0 = przy każdej nowej klatce);
+    # nie wpływa na częstotliwość detekcji gestów
+    preview_max_fps: float = 0.0
+    # Stabilizacja gestów statycznych: okno głosowania (klatki) i histereza - gest staje się
+    # aktywny po gesture_enter_votes głosach w oknie, o ile poprzedni ma ich mniej niż
+    # gesture_exit_votes
     gesture_history_length: int = 5
+    gesture_enter_votes: int = 3
+    gesture_exit_votes: int = 3
+    # Machnięcia: przemieszczenie nadgarstka (część szerokości/wysokości obrazu) w ostatnich
+    # swipe_history_length klatkach, minimalna prędkość (na sekundę) i przerwa po machnięciu
+    swipe_history_length: int = 8
+    swipe_min_distance: float = 0.25
+    swipe_min_speed: float = 1.0
+    swipe_cooldown_s: float = 0.6
 
 
 @dataclass
@@ -37,9 +124,19 @@ class ObjectConfig:
     color_names: tuple[str, ...] = (
         'Cyjan', 'Czerwony', 'Zielony', 'Żółty', 'Magenta', 'Biały'
     )
+    # Backend widoku 3D: 'matplotlib' (osie i siatka) lub 'software' (rasteryzer NumPy/OpenCV,
+    # obraz wyświetlany jak podgląd kamery); render_size to (szerokość, wysokość) obrazu
+    render_backend: str = 'matplotlib'
+    render_size: tuple[int, int] = (480, 480)
+    # Modele z plików OBJ/STL: nazwa kształtu -> ścieżka. Kształt trzeba też dopisać do
+    # shapes i shape_names, np. shapes=(..., 'PRODUCT'), model_paths={'PRODUCT': 'produkt.stl'}
+    model_paths: dict[str, str] = field(default_factory=dict)
+    # Modele o większej liczbie ścian są upraszczane (LOD), aby obrót pozostał płynny
+    max_model_faces: int = 5000
 
 
 # Inicjalizacja instancji konfiguracji
 CAMERA_CONFIG = CameraConfig()
+GESTURE_CONFIG = GestureConfig()
 ANIMATION_CONFIG = AnimationConfig()
 OBJECT_CONFIG = ObjectConfig()
@@ -0,0 +1,168 @@
+# app/controller.py
+'''
+Moduł z logiką aplikacji niezależną od Tk.
+
+AppController zamienia wyniki kamery na akcje na AppState (przez GestureStabilizer
+i słownik gesture_actions), animuje obrót i rysuje scenę tylko po zmianie. Okno
+MainWindow dokłada do niego widżety, a bez okna - np. w pomiarach opóźnienia gestów
+(app.latency_harness) - można go uruchomić z własnym zegarem i widokiem.
+'''
+import logging
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Final, Protocol
+
+from app.config import ANIMATION_CONFIG, AnimationConfig
+from app.gesture_stabilizer import GestureStabilizer
+from app.latency import LATENCY, STAGE_DRAW, STAGE_STABILIZATION
+from app.render_scheduler import RenderScheduler
+from app.scheduler import MultiRateScheduler, StageCallback
+from app.state import AppState, Gesture
+
+if TYPE_CHECKING:
+    from app.session_log import SessionRecorder
+    from camera_handler import CameraOutput
+
+# Wartości OBJECT_CONFIG.render_backend
+RENDER_BACKEND_MATPLOTLIB: Final[str] = 'matplotlib'
+RENDER_BACKEND_SOFTWARE: Final[str] = 'software'
+
+class SceneView(Protocol):
+    '''Wspólny interfejs backendów widoku 3D.'''
+
+    def draw(self, state: AppState) -> None: ...
+
+
+def smoothing_step(elapsed_s: float, config: AnimationConfig) -> float:
+    '''
+    Część pozostałej drogi do celu pokonywana w czasie `elapsed_s` - wygładzanie
+    wykładnicze niezależne od częstotliwości wywołań.
+    '''
+    remaining = 1.0 - config.smoothing_factor
+    return 1.0 - float(remaining ** (elapsed_s / config.smoothing_reference_s))
+
+
+def _approach(angle: float, target: float, step: float, epsilon: float) -> float:
+    '''Krok wygładzania kąta; w odległości `epsilon` od celu animacja się kończy.'''
+    if abs(target - angle) <= epsilon:
+        return target
+    return angle + (target - angle) * step
+
+
+class AppController:
+    '''Gesty, animacja i rysowanie sceny w pętli MultiRateScheduler.'''
+
+    def __init__(
+        self,
+        state: AppState,
+        view: SceneView,
+        present_scene: Callable[[], None],
+        clock: Callable[[], float] = time.perf_counter,
+        config: AnimationConfig = ANIMATION_CONFIG,
+    ) -> None:
+        self.state = state
+        self.config = config
+        self.view = view
+        self._present_scene = present_scene
+        self._clock = clock
+
+        # Słownik akcji powiązanych z gestami
+        self.gesture_actions: dict[Gesture, Callable[[], None]] = {
+            Gesture.POINTING: self.next_color,
+            Gesture.THUMBS_UP: self.next_shape,
+            Gesture.VICTORY: self.reset_view,
+            Gesture.FIST: self.stop_rotation,
+            Gesture.SWIPE_RIGHT: self.next_shape,
+            Gesture.SWIPE_LEFT: self.previous_shape,
+            Gesture.SWIPE_UP: self.next_color,
+            Gesture.SWIPE_DOWN: self.previous_color,
+        }
+        self.gesture_stabilizer = GestureStabilizer(config)
+        self.render_scheduler = RenderScheduler(config.redraw_angle_epsilon)
+        self.scheduler = MultiRateScheduler(clock)
+        # Opcjonalny zapis klatek sesji do późniejszego odtworzenia (app.session_log)
+        self.session_recorder: SessionRecorder | None = None
+
+    def add_stages(self, camera_stage: StageCallback) -> None:
+        '''Rejestruje etapy kamery, animacji i rysowania z częstotliwościami z konfiguracji.'''
+        self.scheduler.add_stage('camera', self.config.camera_rate_hz, camera_stage)
+        self.scheduler.add_stage('animation', self.config.animation_rate_hz, self.animate)
+        self.scheduler.add_stage('render', self.config.render_rate_hz, self.render)
+
+    def tick(self) -> float:
+        '''
+        Wykonuje etapy, których termin minął, i ogłasza zebrane zmiany stanu.
+        Zwraca sekundy do najbliższego terminu.
+        '''
+        delay_s = self.scheduler.run_due()
+        # Wszystkie zmiany z tej pobudki trafiają do subskrybentów jednym rzutem
+        self.state.flush_changes()
+        return delay_s
+
+    def animate(self, elapsed_s: float) -> None:
+        step = smoothing_step(elapsed_s, self.config)
+        epsilon = self.config.redraw_angle_epsilon
+        state = self.state
+        state.angle_x = _approach(state.angle_x, state.target_angle_x, step, epsilon)
+        state.angle_y = _approach(state.angle_y, state.target_angle_y, step, epsilon)
+
+    def render(self, _elapsed_s: float) -> None:
+        # Scena jest rysowana tylko po zmianie
+        if self.render_scheduler.needs_redraw(self.state):
+            with LATENCY.span(STAGE_DRAW):
+                self.view.draw(self.state)
+            self._present_scene()
+            self.render_scheduler.mark_drawn(self.state)
+
+    def process_gestures(self, camera_output: 'CameraOutput') -> None:
+        # Powtórzony wynik tej samej klatki (kamera wolniejsza niż etap) nie jest nowym głosem
+        if not camera_output.fresh:
+            return
+        timestamp = self._clock()
+        with LATENCY.span(STAGE_STABILIZATION):
+            event = self.gesture_stabilizer.update(
+                camera_output.gesture, camera_output.landmarks, timestamp
+            )
+        stable_gesture = self.gesture_stabilizer.stable_gesture
+        if self.session_recorder is not None:
+            self.session_recorder.record(
+                timestamp, camera_output.gesture, stable_gesture, event, camera_output.landmarks
+            )
+        self.state.set_stable_gesture(stable_gesture)
+
+        if stable_gesture is Gesture.OPEN_HAND and camera_output.coords:
+            self.state.target_angle_y = (camera_output.coords[0] - 0.5) * -360
+            self.state.target_angle_x = (camera_output.coords[1] - 0.5) * 180
+
+        if event is not None:
+            action = self.gesture_actions.get(event)
+            if action:
+                action()
+            else:
+                logging.debug("No action for gesture: %s", event.value)
+            self.state.last_action_gesture = event
+
+    def next_color(self) -> None:
+        self.state.next_color()
+        logging.info("Color changed to %s.", self.state.color_names[self.state.color_index])
+
+    def previous_color(self) -> None:
+        self.state.previous_color()
+        logging.info("Color changed to %s.", self.state.color_names[self.state.color_index])
+
+    def next_shape(self) -> None:
+        self.state.next_shape()
+        logging.info("Shape changed to %s.", self.state.shape_names[self.state.shape_index])
+
+    def previous_shape(self) -> None:
+        self.state.previous_shape()
+        logging.info("Shape changed to %s.", self.state.shape_names[self.state.shape_index])
+
+    def reset_view(self) -> None:
+        self.state.target_angle_x, self.state.target_angle_y = 30.0, 45.0
+        logging.info("View has been reset.")
+
+    def stop_rotation(self) -> None:
+        self.state.target_angle_x = self.state.angle_x
+        self.state.target_angle_y = self.state.angle_y
+        logging.info("Rotation stopped.")
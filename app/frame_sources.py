@@ -0,0 +1,246 @@
+# app/frame_sources.py
+'''
+Moduł definiujący źródła klatek dla CameraHandler.
+
+Oprócz kamery dostępne są: plik wideo, katalog z obrazami oraz syntetyczny generator.
+Źródła plikowe i syntetyczne mogą odtwarzać klatki w tempie rzeczywistym albo
+"tak szybko, jak się da", co pozwala mierzyć przepustowość bez kamery.
+'''
+import logging
+import time
+from pathlib import Path
+from typing import Final, Protocol
+
+import cv2
+import numpy as np
+import numpy.typing as npt
+
+from app.config import CameraConfig
+
+Frame = npt.NDArray[np.uint8]
+
+SOURCE_CAMERA: Final[str] = 'camera'
+SOURCE_VIDEO: Final[str] = 'video'
+SOURCE_IMAGES: Final[str] = 'images'
+SOURCE_SYNTHETIC: Final[str] = 'synthetic'
+IMAGE_SUFFIXES: Final[frozenset[str]] = frozenset({'.png', '.jpg', '.jpeg', '.bmp'})
+
+
+class FrameSource(Protocol):
+    '''Wspólny interfejs źródeł klatek BGR.'''
+
+    @property
+    def finished(self) -> bool:
+        '''Czy skończone źródło (bez zapętlenia) dotarło do końca.'''
+
+    def open(self) -> bool: ...
+
+    def read(self) -> tuple[bool, Frame | None]: ...
+
+    def release(self) -> None: ...
+
+
+class Pacer:
+    '''Odmierza czas między klatkami tak, aby zachować zadaną liczbę klatek na sekundę.'''
+
+    def __init__(self, fps: float) -> None:
+        self.period = 1.0 / fps if fps > 0 else 0.0
+        self._next_time: float | None = None
+
+    def wait(self) -> None:
+        if self.period == 0.0:
+            return
+        now = time.perf_counter()
+        if self._next_time is None or now - self._next_time > self.period:
+            # Pierwsza klatka albo duże opóźnienie - nie nadrabiamy zaległości seriami klatek
+            self._next_time = now
+        elif self._next_time > now:
+            time.sleep(self._next_time - now)
+        self._next_time += self.period
+
+    def reset(self) -> None:
+        self._next_time = None
+
+
+class CameraSource:
+    '''Kamera obsługiwana przez cv2.VideoCapture.'''
+
+    def __init__(self, camera_index: int, width: int, height: int) -> None:
+        self.camera_index = camera_index
+        self.width = width
+        self.height = height
+        self._capture: cv2.VideoCapture | None = None
+
+    @property
+    def finished(self) -> bool:
+        return False
+
+    def open(self) -> bool:
+        logging.info("Attempting to initialize camera at index %s...", self.camera_index)
+        capture = cv2.VideoCapture(self.camera_index)
+        if not capture.isOpened():
+            logging.error("Failed to open camera.")
+            capture.release()
+            return False
+        capture.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+        capture.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        self._capture = capture
+        return True
+
+    def read(self) -> tuple[bool, Frame | None]:
+        if self._capture is None:
+            return False, None
+        ok, frame = self._capture.read()
+        if not ok:
+            return False, None
+        return True, np.asarray(frame, dtype=np.uint8)
+
+    def release(self) -> None:
+        if self._capture and self._capture.isOpened():
+            self._capture.release()
+            logging.info("Camera resource released.")
+        self._capture = None
+
+
+class VideoFileSource:
+    '''Nagranie wideo odtwarzane z pliku (opcjonalnie w pętli).'''
+
+    def __init__(self, path: Path, realtime: bool, loop: bool) -> None:
+        self.path = path
+        self.realtime = realtime
+        self.loop = loop
+        self._capture: cv2.VideoCapture | None = None
+        self._pacer = Pacer(0.0)
+        self._finished = False
+
+    @property
+    def finished(self) -> bool:
+        return self._finished
+
+    def open(self) -> bool:
+        capture = cv2.VideoCapture(str(self.path))
+        if not capture.isOpened():
+            logging.error("Failed to open video file %s.", self.path)
+            capture.release()
+            return False
+        self._capture = capture
+        self._pacer = Pacer(capture.get(cv2.CAP_PROP_FPS) if self.realtime else 0.0)
+        self._finished = False
+        return True
+
+    def read(self) -> tuple[bool, Frame | None]:
+        if self._capture is None or self._finished:
+            return False, None
+        ret, frame = self._capture.read()
+        if not ret and self.loop:
+            self._capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self._capture.read()
+        if not ret:
+            self._finished = True
+            return False, None
+        self._pacer.wait()
+        return True, np.asarray(frame, dtype=np.uint8)
+
+    def release(self) -> None:
+        if self._capture:
+            self._capture.release()
+        self._capture = None
+
+
+class ImageDirectorySource:
+    '''Sekwencja obrazów z katalogu, odtwarzana w kolejności nazw plików.'''
+
+    def __init__(self, path: Path, fps: float, realtime: bool, loop: bool) -> None:
+        self.path = path
+        self.loop = loop
+        self._files: list[Path] = []
+        self._index = 0
+        self._pacer = Pacer(fps if realtime else 0.0)
+
+    @property
+    def finished(self) -> bool:
+        return not self.loop and bool(self._files) and self._index >= len(self._files)
+
+    def open(self) -> bool:
+        if not self.path.is_dir():
+            logging.error("Image directory %s does not exist.", self.path)
+            return False
+        self._files = sorted(
+            p for p in self.path.iterdir() if p.suffix.lower() in IMAGE_SUFFIXES
+        )
+        if not self._files:
+            logging.error("No images found in %s.", self.path)
+            return False
+        self._index = 0
+        self._pacer.reset()
+        return True
+
+    def read(self) -> tuple[bool, Frame | None]:
+        # Nieczytelny plik jest pomijany (i usuwany z listy), a nie traktowany jak utrata źródła
+        while self._files and not self.finished:
+            if self._index >= len(self._files):
+                self._index = 0
+            frame = cv2.imread(str(self._files[self._index]), cv2.IMREAD_COLOR)
+            if frame is None:
+                logging.warning("Skipping unreadable image %s.", self._files.pop(self._index))
+                continue
+            self._index += 1
+            self._pacer.wait()
+            return True, np.asarray(frame, dtype=np.uint8)
+        return False, None
+
+    def release(self) -> None:
+        self._files = []
+
+
+class SyntheticSource:
+    '''
+    Generator klatek bez żadnego wejścia: przesuwający się gradient z szumem.
+    Służy do pomiarów przepustowości i testów bez kamery.
+    '''
+
+    def __init__(self, width: int, height: int, fps: float, realtime: bool) -> None:
+        rng = np.random.default_rng(0)
+        gradient = np.linspace(0, 255, width, dtype=np.float32)
+        base = np.broadcast_to(gradient, (height, width))
+        noise = rng.normal(0.0, 12.0, (height, width)).astype(np.float32)
+        gray = np.clip(base + noise, 0, 255).astype(np.uint8)
+        self._pattern = np.dstack([gray, np.roll(gray, width // 3, axis=1), gray[::-1]])
+        self._frame_number = 0
+        self._pacer = Pacer(fps if realtime else 0.0)
+
+    @property
+    def finished(self) -> bool:
+        return False
+
+    def open(self) -> bool:
+        self._frame_number = 0
+        self._pacer.reset()
+        return True
+
+    def read(self) -> tuple[bool, Frame | None]:
+        frame = np.roll(self._pattern, self._frame_number * 4, axis=1)
+        self._frame_number += 1
+        self._pacer.wait()
+        return True, frame
+
+    def release(self) -> None:
+        pass
+
+
+def create_frame_source(config: CameraConfig) -> FrameSource:
+    '''Tworzy źródło klatek wybrane w konfiguracji.'''
+    if config.source == SOURCE_CAMERA:
+        return CameraSource(config.camera_index, config.frame_width, config.frame_height)
+    if config.source == SOURCE_VIDEO:
+        return VideoFileSource(Path(config.source_path), config.source_realtime, config.source_loop)
+    if config.source == SOURCE_IMAGES:
+        return ImageDirectorySource(
+            Path(config.source_path), config.source_fps, config.source_realtime, config.source_loop
+        )
+    if config.source == SOURCE_SYNTHETIC:
+        return SyntheticSource(
+            config.frame_width, config.frame_height, config.source_fps, config.source_realtime
+        )
+    raise ValueError(f'Unknown frame source: {config.source!r}')
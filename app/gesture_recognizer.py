@@ -1,16 +1,96 @@
 # app/gesture_recognizer.py
 """Moduł odpowiedzialny za rozpoznawanie gestów na podstawie punktów orientacyjnych dłoni."""
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Final, TypeAlias
 
 import numpy as np
 import numpy.typing as npt
-from mediapipe.framework.formats.landmark_pb2 import NormalizedLandmark
 
-from app.config import CAMERA_CONFIG
+from app.config import CAMERA_CONFIG, GESTURE_CONFIG, CameraConfig, GestureConfig
 from app.state import Gesture
 
-LandmarkSequence = Sequence[NormalizedLandmark]
-LandmarkPoint = NormalizedLandmark | Sequence[float]
+# mediapipe jest ładowany dopiero przy punktach w jego formacie - moduł (i stabilizator,
+# który go importuje) nie spowalnia importu interfejsu
+if TYPE_CHECKING:
+    from mediapipe.framework.formats.landmark_pb2 import NormalizedLandmark
+
+LandmarkSequence: TypeAlias = Sequence['NormalizedLandmark']
+LandmarkPoint: TypeAlias = 'NormalizedLandmark | Sequence[float]'
+LandmarkArray = npt.NDArray[np.floating]
+
+NUM_LANDMARKS: Final[int] = 21
+
+# Kody gestów zwracane przez recognize_batch to indeksy w tej krotce
+GESTURES: Final[tuple[Gesture, ...]] = tuple(Gesture)
+GESTURE_CODES: Final[dict[Gesture, int]] = {g: code for code, g in enumerate(GESTURES)}
+
+# Stany palców w tablicach zwracanych przez _finger_states_batch
+FINGER_BENT: Final[int] = 0
+FINGER_STRAIGHT: Final[int] = 1
+FINGER_UNKNOWN: Final[int] = 2
+FINGER_STATE_NAMES: Final[dict[str, int]] = {'bent': FINGER_BENT, 'straight': FINGER_STRAIGHT}
+FINGER_ANY: Final[str] = 'any'
+
+# Stan każdego palca zajmuje 2 bity maski, więc tablica gestów ma 4^5 = 1024 pozycje
+NUM_FINGERS: Final[int] = 5
+FINGER_BITS: Final[int] = 2
+MASK_WEIGHTS: Final[npt.NDArray[np.int16]] = (
+    1 << (FINGER_BITS * np.arange(NUM_FINGERS))
+).astype(np.int16)
+
+# Trójki punktów (początek, wierzchołek kąta, koniec) dla kciuka i kolejnych palców
+FINGER_JOINTS: Final[npt.NDArray[np.intp]] = np.array(
+    [(0, 2, 4), (5, 6, 8), (9, 10, 12), (13, 14, 16), (17, 18, 20)], dtype=np.intp
+)
+
+
+def fill_landmark_array(
+    landmarks: LandmarkSequence, out: npt.NDArray[np.float32]
+) -> npt.NDArray[np.float32]:
+    """
+    Wypełnia istniejącą tablicę (21, 3) współrzędnymi punktów MediaPipe w jednym przejściu,
+    bez tworzenia pośrednich krotek ani nowych tablic.
+    """
+    flat = out.reshape(-1)
+    for i, point in enumerate(landmarks):
+        j = 3 * i
+        flat[j] = point.x
+        flat[j + 1] = point.y
+        flat[j + 2] = point.z
+    return out
+
+
+def compile_gesture_table(
+    definitions: Mapping[str, Sequence[str]],
+) -> npt.NDArray[np.int8]:
+    """
+    Kompiluje definicje gestów do tablicy kodów indeksowanej maską stanów palców.
+    Wcześniejsze definicje mają pierwszeństwo; maski bez dopasowania dają UNKNOWN.
+    """
+    masks = np.arange(1 << (FINGER_BITS * NUM_FINGERS))
+    mask_states = (masks[:, np.newaxis] // MASK_WEIGHTS) % (1 << FINGER_BITS)
+
+    table = np.full(len(masks), GESTURE_CODES[Gesture.UNKNOWN], dtype=np.int8)
+    assigned = np.zeros(len(masks), dtype=bool)
+    for name, pattern in definitions.items():
+        try:
+            gesture = Gesture[name]
+        except KeyError:
+            raise ValueError(f'Unknown gesture in definitions: {name!r}') from None
+        if len(pattern) != NUM_FINGERS:
+            raise ValueError(f'Gesture {name!r} must define exactly {NUM_FINGERS} fingers')
+
+        matches = ~assigned
+        for finger, finger_state in enumerate(pattern):
+            if finger_state == FINGER_ANY:
+                continue
+            if finger_state not in FINGER_STATE_NAMES:
+                raise ValueError(f'Unknown finger state {finger_state!r} in gesture {name!r}')
+            matches &= mask_states[:, finger] == FINGER_STATE_NAMES[finger_state]
+
+        table[matches] = GESTURE_CODES[gesture]
+        assigned |= matches
+    return table
 
 
 class GestureRecognizer:
@@ -18,94 +98,97 @@ class GestureRecognizer:
     Klasa do rozpoznawania gestów na podstawie punktów orientacyjnych dłoni.
     """
 
-    def __init__(self) -> None:
-        self.config = CAMERA_CONFIG
+    def __init__(
+        self,
+        config: CameraConfig | None = None,
+        gesture_config: GestureConfig | None = None,
+    ) -> None:
+        self.config = config or CAMERA_CONFIG
+        self.gesture_config = gesture_config or GESTURE_CONFIG
+        self._straight_thresholds = np.array(
+            [self.config.thumb_straight_angle_threshold]
+            + [self.config.finger_straight_angle_threshold] * 4
+        )
+        # Kciuk nie ma stanu pośredniego - jeśli nie jest prosty, to jest zgięty
+        self._bent_thresholds = np.array(
+            [np.inf] + [self.config.finger_bent_angle_threshold] * 4
+        )
+        self._gesture_table = compile_gesture_table(self.gesture_config.definitions)
 
-    def recognize(self, landmarks: LandmarkSequence) -> Gesture:
+    def recognize(self, landmarks: LandmarkSequence | LandmarkArray) -> Gesture:
         """
         Rozpoznaje gest na podstawie dostarczonych punktów orientacyjnych.
         """
-        if not landmarks:
+        if len(landmarks) == 0:
             return Gesture.UNKNOWN
 
-        finger_states = self._get_finger_states(landmarks)
-        return self._map_states_to_gesture(finger_states)
+        batch = self._to_array(landmarks)[np.newaxis]
+        return GESTURES[int(self.recognize_batch(batch)[0])]
+
+    def recognize_batch(self, landmarks: LandmarkArray) -> npt.NDArray[np.int8]:
+        """
+        Rozpoznaje gesty dla N dłoni naraz na podstawie tablicy o kształcie (N, 21, 3).
+        Zwraca tablicę kodów gestów (indeksów w GESTURES).
+        """
+        states = self._finger_states_batch(landmarks)
+        return self._map_states_to_gestures(states)
 
-    def _get_finger_states(self, landmarks: LandmarkSequence) -> dict[str, str]:
+    def _finger_states_batch(self, landmarks: LandmarkArray) -> npt.NDArray[np.int8]:
         """
-        Określa stan każdego palca (zgięty, prosty, nieznany).
+        Określa stan każdego palca (zgięty, prosty, nieznany) dla N dłoni.
+        Zwraca tablicę (N, 5) w kolejności: kciuk, wskazujący, środkowy, serdeczny, mały.
         """
-        states = {}
-        thumb_angle = self._calculate_angle(landmarks[0], landmarks[2], landmarks[4])
-
-        is_thumb_straight = thumb_angle > self.config.thumb_straight_angle_threshold
-        states['thumb'] = 'straight' if is_thumb_straight else 'bent'
-
-        finger_indices = {
-            'index': (5, 6, 8),
-            'middle': (9, 10, 12),
-            'ring': (13, 14, 16),
-            'pinky': (17, 18, 20),
-        }
-        for finger, indices in finger_indices.items():
-            angle = self._calculate_angle(
-                landmarks[indices[0]], landmarks[indices[1]], landmarks[indices[2]]
-            )
-            if angle > self.config.finger_straight_angle_threshold:
-                states[finger] = 'straight'
-            elif angle < self.config.finger_bent_angle_threshold:
-                states[finger] = 'bent'
-            else:
-                states[finger] = 'unknown'
+        angles = self._joint_angles(landmarks)
+        states = np.full(angles.shape, FINGER_UNKNOWN, dtype=np.int8)
+        states[angles < self._bent_thresholds] = FINGER_BENT
+        states[angles > self._straight_thresholds] = FINGER_STRAIGHT
         return states
 
-    def _map_states_to_gesture(self, states: dict[str, str]) -> Gesture:
+    def _map_states_to_gestures(self, states: npt.NDArray[np.int8]) -> npt.NDArray[np.int8]:
         """
-        Mapuje stany palców na konkretny gest.
+        Mapuje stany palców (N, 5) na kody gestów jednym odczytem z tablicy masek.
         """
-        if all(s == 'straight' for s in states.values()):
-            return Gesture.OPEN_HAND
-        if (
-            states['thumb'] == 'straight' and
-            all(states[f] == 'bent' for f in ['index', 'middle', 'ring', 'pinky'])
-        ):
-            return Gesture.THUMBS_UP
-        if (
-            states['index'] == 'straight' and
-            all(states[f] == 'bent' for f in ['thumb', 'middle', 'ring', 'pinky'])
-        ):
-            return Gesture.POINTING
-        if (
-            states['index'] == 'straight' and
-            states['middle'] == 'straight' and
-            all(states[f] == 'bent' for f in ['thumb', 'ring', 'pinky'])
-        ):
-            return Gesture.VICTORY
-        if all(s == 'bent' for s in states.values()):
-            return Gesture.FIST
-        return Gesture.UNKNOWN
+        masks = states @ MASK_WEIGHTS
+        return np.asarray(self._gesture_table[masks], dtype=np.int8)
 
     @staticmethod
-    def _calculate_angle(p1: LandmarkPoint, p2: LandmarkPoint, p3: LandmarkPoint) -> float:
+    def _joint_angles(landmarks: LandmarkArray) -> npt.NDArray[np.float64]:
         """
-        Oblicza kąt pomiędzy trzema punktami.
+        Oblicza kąty (w stopniach) w stawach pięciu palców dla tablicy (N, 21, 3).
         """
-        p1_arr = GestureRecognizer._point_to_array(p1)
-        p2_arr = GestureRecognizer._point_to_array(p2)
-        p3_arr = GestureRecognizer._point_to_array(p3)
-        v1 = p1_arr - p2_arr
-        v2 = p3_arr - p2_arr
-        dot_product = np.dot(v1, v2)
-        norm_product = np.linalg.norm(v1) * np.linalg.norm(v2)
-        if norm_product == 0:
-            return 0.0
-        cos_angle = np.clip(dot_product / norm_product, -1.0, 1.0)
-        angle = np.arccos(cos_angle)
-        return float(np.degrees(angle))
+        points = np.asarray(landmarks)[:, FINGER_JOINTS]  # (N, 5, 3, 3)
+        v1 = points[:, :, 0] - points[:, :, 1]
+        v2 = points[:, :, 2] - points[:, :, 1]
+        dot_product = np.einsum('nfk,nfk->nf', v1, v2, dtype=np.float64)
+        norm_product = np.linalg.norm(v1, axis=-1) * np.linalg.norm(v2, axis=-1)
+
+        cos_angle = np.divide(
+            dot_product,
+            norm_product,
+            out=np.ones_like(dot_product),
+            where=norm_product != 0,
+        )
+        # Zdegenerowany kąt (punkty pokrywają się) traktujemy jak 0 stopni
+        return np.asarray(np.degrees(np.arccos(np.clip(cos_angle, -1.0, 1.0))), dtype=np.float64)
+
+    @staticmethod
+    def _to_array(landmarks: LandmarkSequence | LandmarkArray) -> LandmarkArray:
+        """
+        Konwertuje punkty orientacyjne do tablicy (21, 3).
+        """
+        if isinstance(landmarks, np.ndarray):
+            return landmarks
+        from mediapipe.framework.formats.landmark_pb2 import NormalizedLandmark
+
+        return np.stack(
+            [GestureRecognizer._point_to_array(p, NormalizedLandmark) for p in landmarks]
+        )
 
     @staticmethod
-    def _point_to_array(point: LandmarkPoint) -> npt.NDArray[np.float64]:
-        if isinstance(point, NormalizedLandmark):
+    def _point_to_array(
+        point: LandmarkPoint, landmark_type: type['NormalizedLandmark']
+    ) -> npt.NDArray[np.float64]:
+        if isinstance(point, landmark_type):
             return np.array((point.x, point.y, point.z), dtype=np.float64)
 
         array = np.asarray(point, dtype=np.float64)
@@ -0,0 +1,148 @@
+# app/gesture_stabilizer.py
+'''
+Moduł stabilizujący strumień gestów rozpoznawanych klatka po klatce.
+
+Gesty statyczne są wygładzane głosowaniem w przesuwnym oknie: liczniki głosów są
+aktualizowane przyrostowo (dodanie nowej klatki, odjęcie wypadającej), więc koszt klatki
+nie zależy od długości okna. Histereza (progi wejścia i wyjścia) zapobiega migotaniu
+między gestami. Gesty dynamiczne - machnięcia w lewo, prawo, górę i dół - są wykrywane
+z prędkości nadgarstka w buforze cyklicznym ostatnich punktów dłoni.
+'''
+from collections import deque
+from typing import Final
+
+import numpy as np
+import numpy.typing as npt
+
+from app.config import ANIMATION_CONFIG, AnimationConfig
+from app.gesture_recognizer import NUM_LANDMARKS
+from app.state import Gesture
+
+# Przemieszczenie wzdłuż osi machnięcia musi tyle razy przewyższać przemieszczenie poprzeczne
+SWIPE_AXIS_RATIO: Final[float] = 2.0
+WRIST: Final[int] = 0
+
+
+class SwipeDetector:
+    '''
+    Wykrywa machnięcia z przemieszczenia nadgarstka między najstarszą a najnowszą
+    klatką bufora cyklicznego (współrzędne znormalizowane obrazu z odbiciem lustrzanym).
+    '''
+
+    def __init__(
+        self, history_length: int, min_distance: float, min_speed: float, cooldown_s: float
+    ) -> None:
+        if history_length < 2:
+            raise ValueError(f'Swipe history must hold at least 2 frames: {history_length}')
+        self.min_distance = min_distance
+        self.min_speed = min_speed
+        self.cooldown_s = cooldown_s
+        self._landmarks = np.zeros((history_length, NUM_LANDMARKS, 3), dtype=np.float32)
+        self._timestamps = np.zeros(history_length, dtype=np.float64)
+        self._next = 0
+        self._count = 0
+        self._cooldown_until = -np.inf
+
+    def reset(self) -> None:
+        self._count = 0
+
+    def update(self, landmarks: npt.NDArray[np.float32], timestamp: float) -> Gesture | None:
+        '''Dopisuje punkty dłoni (21, 3) do bufora; zwraca wykryte machnięcie albo None.'''
+        capacity = len(self._timestamps)
+        newest = self._next
+        self._landmarks[newest] = landmarks
+        self._timestamps[newest] = timestamp
+        self._next = (newest + 1) % capacity
+        self._count = min(self._count + 1, capacity)
+        if self._count < 2 or timestamp < self._cooldown_until:
+            return None
+
+        oldest = self._next if self._count == capacity else 0
+        elapsed = timestamp - self._timestamps[oldest]
+        if elapsed <= 0.0:
+            return None
+        dx, dy = (self._landmarks[newest, WRIST, :2] - self._landmarks[oldest, WRIST, :2]).tolist()
+        distance, cross = (abs(dx), abs(dy)) if abs(dx) >= abs(dy) else (abs(dy), abs(dx))
+        if (
+            distance < self.min_distance
+            or distance / elapsed < self.min_speed
+            or distance < SWIPE_AXIS_RATIO * cross
+        ):
+            return None
+
+        # Po machnięciu bufor jest czyszczony - jeden ruch daje jedno zdarzenie
+        self._cooldown_until = timestamp + self.cooldown_s
+        self.reset()
+        if abs(dx) >= abs(dy):
+            return Gesture.SWIPE_RIGHT if dx > 0 else Gesture.SWIPE_LEFT
+        return Gesture.SWIPE_DOWN if dy > 0 else Gesture.SWIPE_UP
+
+
+class GestureStabilizer:
+    '''
+    Zamienia surowe gesty z kolejnych klatek na zdarzenia: początek nowego stabilnego
+    gestu statycznego albo machnięcie. Bieżący stabilny gest jest w `stable_gesture`.
+
+    Nowy gest staje się stabilny, gdy ma co najmniej `enter_votes` głosów w oknie,
+    a dotychczasowy spadł poniżej `exit_votes`. Przy otwartej dłoni (sterowanie obrotem
+    położeniem dłoni) machnięcia nie są wykrywane.
+    '''
+
+    def __init__(self, config: AnimationConfig = ANIMATION_CONFIG) -> None:
+        window = config.gesture_history_length
+        for name, votes in (
+            ('enter', config.gesture_enter_votes), ('exit', config.gesture_exit_votes)
+        ):
+            if not 1 <= votes <= window:
+                raise ValueError(f'Gesture {name} votes must be in [1, {window}]: {votes}')
+        self.enter_votes = config.gesture_enter_votes
+        self.exit_votes = config.gesture_exit_votes
+        self._history: deque[Gesture] = deque(maxlen=window)
+        self._votes: dict[Gesture, int] = dict.fromkeys(Gesture, 0)
+        self.stable_gesture: Gesture | None = None
+        self.swipes = SwipeDetector(
+            config.swipe_history_length,
+            config.swipe_min_distance,
+            config.swipe_min_speed,
+            config.swipe_cooldown_s,
+        )
+
+    def votes(self, gesture: Gesture) -> int:
+        '''Liczba klatek z danym gestem w bieżącym oknie.'''
+        return self._votes[gesture]
+
+    def update(
+        self, gesture: Gesture, landmarks: npt.NDArray[np.float32] | None, timestamp: float
+    ) -> Gesture | None:
+        '''
+        Przyjmuje gest i punkty dłoni głównej z jednej klatki. Zwraca gest, dla którego
+        należy wykonać akcję (nowy stabilny gest lub machnięcie), albo None.
+        '''
+        if landmarks is None or self.stable_gesture is Gesture.OPEN_HAND:
+            self.swipes.reset()
+        else:
+            swipe = self.swipes.update(landmarks, timestamp)
+            if swipe is not None:
+                # Klatki rozmyte ruchem nie powinny wyłonić nowego gestu statycznego
+                self._clear_votes()
+                return swipe
+
+        if len(self._history) == self._history.maxlen:
+            self._votes[self._history[0]] -= 1
+        self._history.append(gesture)
+        self._votes[gesture] += 1
+
+        current = self.stable_gesture
+        if (
+            gesture is not current
+            and self._votes[gesture] >= self.enter_votes
+            and (current is None or self._votes[current] < self.exit_votes)
+        ):
+            self.stable_gesture = gesture
+            return gesture
+        return None
+
+    def _clear_votes(self) -> None:
+        for gesture in self._history:
+            self._votes[gesture] -= 1
+        self._history.clear()
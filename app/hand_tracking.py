@@ -0,0 +1,58 @@
+# app/hand_tracking.py
+'''
+Moduł odpowiedzialny za śledzenie wielu dłoni pomiędzy klatkami.
+Przypisuje wykrytym dłoniom stabilne identyfikatory na podstawie pozycji nadgarstka.
+'''
+import numpy as np
+import numpy.typing as npt
+
+
+class HandTracker:
+    '''
+    Zachłanne kojarzenie dłoni z poprzedniej i bieżącej klatki.
+    Pary (nowa dłoń, ślad) są rozpatrywane od najbliższej, a dłonie bez pary
+    w promieniu max_distance dostają nowy identyfikator.
+    '''
+
+    def __init__(self, max_distance: float) -> None:
+        self.max_distance = max_distance
+        self._track_ids: npt.NDArray[np.int64] = np.empty(0, dtype=np.int64)
+        self._wrists: npt.NDArray[np.float32] = np.empty((0, 2), dtype=np.float32)
+        self._next_id = 0
+
+    def update(self, wrists: npt.NDArray[np.floating]) -> npt.NDArray[np.int64]:
+        '''
+        Przyjmuje pozycje nadgarstków (K, 2) z bieżącej klatki i zwraca K identyfikatorów.
+        '''
+        count = len(wrists)
+        ids = np.full(count, -1, dtype=np.int64)
+
+        if count and len(self._wrists):
+            distances = np.linalg.norm(wrists[:, np.newaxis] - self._wrists, axis=-1)
+            rows, cols = np.unravel_index(np.argsort(distances, axis=None), distances.shape)
+            close = distances[rows, cols] <= self.max_distance
+            if count == 1:
+                # Najczęstszy przypadek - jedna dłoń, wystarczy najbliższy ślad
+                if close[0]:
+                    ids[0] = self._track_ids[cols[0]]
+            else:
+                taken = np.zeros(len(self._wrists), dtype=bool)
+                # Liczba par jest ograniczona przez max_num_hands^2, więc pętla jest krótka
+                for row, col in zip(rows[close], cols[close], strict=True):
+                    if ids[row] < 0 and not taken[col]:
+                        ids[row] = self._track_ids[col]
+                        taken[col] = True
+
+        unmatched = ids < 0
+        new_count = int(unmatched.sum())
+        ids[unmatched] = np.arange(self._next_id, self._next_id + new_count)
+        self._next_id += new_count
+
+        self._track_ids = ids.copy()
+        self._wrists = np.array(wrists[:, :2], dtype=np.float32)
+        return ids
+
+    def reset(self) -> None:
+        '''Zapomina wszystkie ślady (np. po utracie dłoni lub kamery).'''
+        self._track_ids = np.empty(0, dtype=np.int64)
+        self._wrists = np.empty((0, 2), dtype=np.float32)
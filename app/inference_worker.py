@@ -0,0 +1,184 @@
+# app/inference_worker.py
+'''
+Moduł uruchamiający detekcję dłoni MediaPipe w osobnym procesie.
+
+Klatki trafiają do procesu roboczego przez pierścień buforów w pamięci współdzielonej
+(multiprocessing.shared_memory), więc obraz 640x480 nie jest serializowany. Przez potok
+wysyłane są jedynie numery klatek i slotów, a z powrotem wracają zwarte tablice
+punktów (K, 21, 3) float32 i kody gestów.
+'''
+import contextlib
+import logging
+import multiprocessing as mproc
+from collections.abc import Callable
+from multiprocessing import shared_memory
+from multiprocessing.connection import Connection
+from typing import Any, Final, NamedTuple
+
+import mediapipe as mp
+import numpy as np
+import numpy.typing as npt
+
+from app.config import CameraConfig, GestureConfig
+from app.gesture_recognizer import NUM_LANDMARKS, GestureRecognizer, fill_landmark_array
+
+RING_SLOTS: Final[int] = 2
+STOP_TIMEOUT_S: Final[float] = 2.0
+
+# Tworzy model dłoni w procesie roboczym; musi dać się przekazać do procesu (pickle)
+HandsFactory = Callable[[], Any]
+
+
+class InferenceResult(NamedTuple):
+    frame_id: int
+    landmarks: npt.NDArray[np.float32]  # (K, 21, 3)
+    gestures: npt.NDArray[np.int8]  # (K,)
+
+
+class SharedFrameRing:
+    '''Pierścień `slots` klatek o stałym kształcie w jednym bloku pamięci współdzielonej.'''
+
+    def __init__(
+        self, shape: tuple[int, ...], slots: int = RING_SLOTS, name: str | None = None
+    ) -> None:
+        self.shape = shape
+        self.slots = slots
+        size = slots * int(np.prod(shape))
+        self._owner = name is None
+        self._shm = shared_memory.SharedMemory(name=name, create=self._owner, size=size)
+        self._frames: npt.NDArray[np.uint8] = np.ndarray(
+            (slots, *shape), dtype=np.uint8, buffer=self._shm.buf
+        )
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def slot(self, index: int) -> npt.NDArray[np.uint8]:
+        '''Zwraca widok (bez kopiowania) na slot o podanym indeksie.'''
+        return np.asarray(self._frames[index])
+
+    def close(self) -> None:
+        # Widoki muszą zniknąć przed zamknięciem bufora pamięci współdzielonej
+        del self._frames
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+
+def _worker_main(
+    ring_name: str,
+    shape: tuple[int, ...],
+    slots: int,
+    connection: Connection,
+    config: CameraConfig,
+    gesture_config: GestureConfig,
+    hands_factory: HandsFactory | None,
+) -> None:
+    '''Pętla procesu roboczego: detekcja dłoni i rozpoznanie gestów dla kolejnych slotów.'''
+    ring = SharedFrameRing(shape, slots, name=ring_name)
+    recognizer = GestureRecognizer(config, gesture_config)
+    buffer = np.zeros((config.max_num_hands, NUM_LANDMARKS, 3), dtype=np.float32)
+    if hands_factory is not None:
+        hands = hands_factory()
+    else:
+        hands = mp.solutions.hands.Hands(
+            max_num_hands=config.max_num_hands,
+            min_detection_confidence=config.min_detection_confidence,
+            min_tracking_confidence=config.min_tracking_confidence,
+        )
+    try:
+        while (request := connection.recv()) is not None:
+            frame_id, slot = request
+            results = hands.process(ring.slot(slot))
+            detected = results.multi_hand_landmarks or ()
+            count = min(len(detected), len(buffer))
+            for i in range(count):
+                fill_landmark_array(detected[i].landmark, buffer[i])
+            landmarks = buffer[:count].copy()
+            connection.send(
+                (slot, InferenceResult(frame_id, landmarks, recognizer.recognize_batch(landmarks)))
+            )
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        hands.close()
+        ring.close()
+
+
+class InferenceProcess:
+    '''
+    Strona procesu głównego: zapisuje klatki RGB do pierścienia i odbiera wyniki.
+    Żadna z metod nie blokuje - gdy wszystkie sloty są zajęte, klatka jest pomijana.
+    '''
+
+    def __init__(
+        self,
+        shape: tuple[int, ...],
+        config: CameraConfig,
+        gesture_config: GestureConfig,
+        slots: int = RING_SLOTS,
+        hands_factory: HandsFactory | None = None,
+    ) -> None:
+        self.shape = shape
+        self.ring = SharedFrameRing(shape, slots)
+        self._free_slots = list(range(slots))
+        self._next_frame_id = 0
+        self.dropped_frames = 0
+
+        context = mproc.get_context('spawn')
+        self._connection, worker_connection = context.Pipe()
+        self._process = context.Process(
+            target=_worker_main,
+            args=(
+                self.ring.name,
+                shape,
+                slots,
+                worker_connection,
+                config,
+                gesture_config,
+                hands_factory,
+            ),
+            name='HandInference',
+            daemon=True,
+        )
+        self._process.start()
+        worker_connection.close()
+
+    @property
+    def is_alive(self) -> bool:
+        return self._process.is_alive()
+
+    def acquire_slot(self) -> tuple[int, npt.NDArray[np.uint8]] | None:
+        '''Zwraca wolny slot (indeks i widok do zapisu) lub None, jeśli proces nie nadąża.'''
+        if not self._free_slots:
+            self.dropped_frames += 1
+            return None
+        slot = self._free_slots.pop()
+        return slot, self.ring.slot(slot)
+
+    def submit(self, slot: int) -> int:
+        '''Zleca przetworzenie zapisanego slotu i zwraca numer klatki.'''
+        frame_id = self._next_frame_id
+        self._next_frame_id += 1
+        self._connection.send((frame_id, slot))
+        return frame_id
+
+    def poll(self) -> InferenceResult | None:
+        '''Odbiera wszystkie gotowe wyniki i zwraca najnowszy (lub None).'''
+        latest = None
+        while self._connection.poll():
+            slot, latest = self._connection.recv()
+            self._free_slots.append(slot)
+        return latest
+
+    def close(self) -> None:
+        with contextlib.suppress(BrokenPipeError, OSError):
+            self._connection.send(None)
+        self._process.join(STOP_TIMEOUT_S)
+        if self._process.is_alive():
+            logging.warning("Inference process did not stop, terminating.")
+            self._process.terminate()
+            self._process.join(STOP_TIMEOUT_S)
+        self._connection.close()
+        self.ring.close()
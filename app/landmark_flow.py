@@ -0,0 +1,157 @@
+# app/landmark_flow.py
+'''
+Moduł przenoszący punkty dłoni między pełnymi detekcjami MediaPipe.
+
+Pełna detekcja jest uruchamiana co N klatek, a w klatkach pośrednich punkty
+z poprzedniej klatki są przesuwane rzadkim przepływem optycznym Lucasa-Kanade.
+N dobierane jest automatycznie tak, aby średni koszt klatki mieścił się w budżecie.
+'''
+import math
+import time
+from typing import Final
+
+import cv2
+import numpy as np
+import numpy.typing as npt
+
+# Współczynnik wygładzania wykładniczego dla mierzonych czasów
+COST_SMOOTHING: Final[float] = 0.2
+# Odsetek punktów, które muszą zostać odnalezione, aby propagacja była wiarygodna
+MIN_TRACKED_RATIO: Final[float] = 0.8
+# Parametry piramidalnego Lucasa-Kanadego
+LK_WIN_SIZE: Final[tuple[int, int]] = (21, 21)
+LK_MAX_LEVEL: Final[int] = 2
+LK_CRITERIA: Final[tuple[int, int, float]] = (
+    cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT,
+    20,
+    0.03,
+)
+
+
+def _smooth(previous: float | None, sample: float) -> float:
+    if previous is None:
+        return sample
+    return previous + (sample - previous) * COST_SMOOTHING
+
+
+class LandmarkPropagator:
+    '''
+    Decyduje, kiedy uruchomić pełną detekcję dłoni, i propaguje punkty (K, 21, 3)
+    przepływem optycznym w klatkach pomiędzy detekcjami.
+    '''
+
+    def __init__(
+        self, budget_ms: float, max_interval: int, motion_threshold: float
+    ) -> None:
+        self.budget_ms = budget_ms
+        self.max_interval = max_interval
+        self.motion_threshold = motion_threshold
+        self.interval = 1
+        self.detection_ms: float | None = None
+        self.propagation_ms: float | None = None
+        self._prev_gray: npt.NDArray[np.uint8] | None = None
+        self._points: npt.NDArray[np.float32] = np.empty((0, 2), dtype=np.float32)
+        self._hand_count = 0
+        self._frames_since_detection = 0
+        self._force_detection = True
+
+    def should_detect(self) -> bool:
+        '''Czy bieżąca klatka wymaga pełnej detekcji.'''
+        return (
+            self._force_detection
+            or self._prev_gray is None
+            or self._frames_since_detection >= self.interval
+        )
+
+    def record_detection(
+        self,
+        gray: npt.NDArray[np.uint8],
+        landmarks: npt.NDArray[np.float32],
+        elapsed_s: float,
+    ) -> None:
+        '''Zapamiętuje wynik pełnej detekcji jako punkt wyjścia dla propagacji.'''
+        self.detection_ms = _smooth(self.detection_ms, elapsed_s * 1000.0)
+        height, width = gray.shape[:2]
+        self._prev_gray = gray
+        self._hand_count = len(landmarks)
+        self._points = (landmarks[..., :2] * (width, height)).reshape(-1, 2).astype(np.float32)
+        self._frames_since_detection = 1
+        self._force_detection = False
+        self._update_interval()
+
+    def propagate(
+        self, gray: npt.NDArray[np.uint8], landmarks: npt.NDArray[np.float32]
+    ) -> npt.NDArray[np.float32] | None:
+        '''
+        Przesuwa punkty z poprzedniej klatki do bieżącej, nadpisując współrzędne x, y
+        w `landmarks` (pierwsze K dłoni; z pozostaje z ostatniej detekcji).
+        Zwraca None, gdy śledzenie zawiodło i potrzebna jest pełna detekcja.
+        '''
+        if self._prev_gray is None:
+            return None
+        start = time.perf_counter()
+        self._frames_since_detection += 1
+        count = self._hand_count
+        if count == 0:
+            self._prev_gray = gray
+            return landmarks[:0]
+
+        points = self._points.reshape(-1, 1, 2)
+        # Bez OPTFLOW_USE_INITIAL_FLOW nextPts jest tylko buforem na wynik
+        new_points, status, _error = cv2.calcOpticalFlowPyrLK(
+            self._prev_gray,
+            gray,
+            points,
+            points.copy(),
+            winSize=LK_WIN_SIZE,
+            maxLevel=LK_MAX_LEVEL,
+            criteria=LK_CRITERIA,
+        )
+        tracked = status.reshape(-1).astype(bool)
+        if tracked.mean() < MIN_TRACKED_RATIO:
+            self._force_detection = True
+            return None
+
+        new_points = np.asarray(new_points, dtype=np.float32).reshape(-1, 2)
+        displacement = new_points - self._points
+        # Punkty zgubione przesuwamy o medianę przesunięcia pozostałych
+        new_points[~tracked] = self._points[~tracked] + np.median(displacement[tracked], axis=0)
+
+        height, width = gray.shape[:2]
+        size = np.array((width, height), dtype=np.float32)
+        motion = float(np.linalg.norm(displacement[tracked] / size, axis=1).mean())
+        if motion > self.motion_threshold:
+            # Szybki ruch - bieżąca klatka korzysta z propagacji, następna z detekcji
+            self._force_detection = True
+
+        self._points = new_points
+        self._prev_gray = gray
+        hands = landmarks[:count]
+        hands[..., :2] = (new_points / size).reshape(count, -1, 2)
+
+        self.propagation_ms = _smooth(
+            self.propagation_ms, (time.perf_counter() - start) * 1000.0
+        )
+        self._update_interval()
+        return hands
+
+    def reset(self) -> None:
+        self._prev_gray = None
+        self._force_detection = True
+
+    def _update_interval(self) -> None:
+        '''
+        Dobiera N tak, aby (koszt detekcji + (N - 1) * koszt propagacji) / N <= budżet.
+        '''
+        if self.detection_ms is None:
+            return
+        propagation_ms = self.propagation_ms or 0.0
+        if self.detection_ms <= self.budget_ms:
+            interval = 1
+        elif propagation_ms >= self.budget_ms:
+            interval = self.max_interval
+        else:
+            interval = math.ceil(
+                (self.detection_ms - propagation_ms) / (self.budget_ms - propagation_ms)
+            )
+        self.interval = max(1, min(self.max_interval, interval))
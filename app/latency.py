@@ -0,0 +1,192 @@
+# app/latency.py
+'''
+Moduł mierzący czas etapów potoku (odczyt klatki, konwersja, detekcja, rozpoznanie,
+stabilizacja, rysowanie sceny, wyświetlenie).
+
+Pomiary są zbierane w oknie ostatnich próbek każdego etapu, z którego na żądanie
+liczone są percentyle p50/p95/p99. Raport można pokazać na pasku stanu oraz dopisać
+do pliku CSV lub JSON Lines (przy zamknięciu albo po sygnale). Wyłączony pomiar
+sprowadza się do jednego sprawdzenia flagi i współdzielonego, pustego kontekstu.
+'''
+import csv
+import json
+import logging
+import threading
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from types import TracebackType
+from typing import Final, NamedTuple
+
+import numpy as np
+
+STAGE_CAPTURE: Final[str] = 'capture'
+STAGE_CONVERT: Final[str] = 'convert'
+STAGE_INFERENCE: Final[str] = 'inference'
+STAGE_RECOGNITION: Final[str] = 'recognition'
+STAGE_STABILIZATION: Final[str] = 'stabilization'
+STAGE_DRAW: Final[str] = 'draw'
+STAGE_BLIT: Final[str] = 'blit'
+
+# Liczba ostatnich próbek etapu, z których liczone są percentyle (ok. 20 s przy 30 Hz)
+DEFAULT_WINDOW: Final[int] = 600
+PERCENTILES: Final[tuple[float, ...]] = (50.0, 95.0, 99.0)
+CSV_FIELDS: Final[tuple[str, ...]] = (
+    'timestamp', 'stage', 'samples', 'mean_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms'
+)
+
+
+class LatencySummary(NamedTuple):
+    samples: int  # wszystkie pomiary od startu, nie tylko te w oknie
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+class StageStats:
+    '''Bufor cykliczny ostatnich czasów jednego etapu; zapis możliwy z wielu wątków.'''
+
+    def __init__(self, window: int = DEFAULT_WINDOW) -> None:
+        self._samples = np.zeros(window, dtype=np.float64)
+        self._next = 0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples[self._next] = seconds
+            self._next = (self._next + 1) % len(self._samples)
+            self.count += 1
+
+    def summary(self) -> LatencySummary | None:
+        with self._lock:
+            count = self.count
+            samples = self._samples[:min(count, len(self._samples))].copy()
+        if count == 0:
+            return None
+        samples *= 1000.0
+        p50, p95, p99 = np.percentile(samples, PERCENTILES).tolist()
+        return LatencySummary(count, float(samples.mean()), p50, p95, p99, float(samples.max()))
+
+
+class _Span:
+    __slots__ = ('_start', '_stats')
+
+    def __init__(self, stats: StageStats) -> None:
+        self._stats = stats
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._stats.record(time.perf_counter() - self._start)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        pass
+
+
+NULL_SPAN: Final[_NullSpan] = _NullSpan()
+
+
+class LatencyTracker:
+    '''
+    Zbiera czasy etapów: `with tracker.span(STAGE_INFERENCE): ...`.
+    Domyślnie wyłączony - `span` zwraca wtedy współdzielony pusty kontekst.
+    '''
+
+    def __init__(self, window: int = DEFAULT_WINDOW) -> None:
+        self.enabled = False
+        self.window = window
+        self._stats: dict[str, StageStats] = {}
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def span(self, stage: str) -> _Span | _NullSpan:
+        if not self.enabled:
+            return NULL_SPAN
+        return _Span(self._stage(stage))
+
+    def record(self, stage: str, seconds: float) -> None:
+        '''Zapisuje czas zmierzony poza `span` (np. między zleceniem a wykonaniem).'''
+        if self.enabled:
+            self._stage(stage).record(seconds)
+
+    def _stage(self, stage: str) -> StageStats:
+        stats = self._stats.get(stage)
+        if stats is None:
+            stats = self._stats.setdefault(stage, StageStats(self.window))
+        return stats
+
+    def summaries(self) -> dict[str, LatencySummary]:
+        '''Podsumowania etapów w kolejności pierwszego pomiaru.'''
+        summaries = {stage: stats.summary() for stage, stats in list(self._stats.items())}
+        return {stage: summary for stage, summary in summaries.items() if summary is not None}
+
+    def format_overlay(self) -> str:
+        '''Krótki raport do paska stanu: p50/p95/p99 w milisekundach.'''
+        return 'p50/p95/p99 ms: ' + ', '.join(
+            f'{stage} {s.p50_ms:.1f}/{s.p95_ms:.1f}/{s.p99_ms:.1f}'
+            for stage, s in self.summaries().items()
+        )
+
+    def export(self, path: Path) -> None:
+        '''
+        Dopisuje bieżące podsumowania do pliku: wiersze CSV (dla rozszerzenia .csv)
+        albo jeden wiersz JSON. Błąd zapisu jest tylko logowany.
+        '''
+        summaries = self.summaries()
+        timestamp = datetime.now(UTC).isoformat(timespec='seconds')
+        try:
+            if path.suffix.lower() == '.csv':
+                write_header = not path.exists() or path.stat().st_size == 0
+                with path.open('a', encoding='utf-8', newline='') as report_file:
+                    writer = csv.writer(report_file)
+                    if write_header:
+                        writer.writerow(CSV_FIELDS)
+                    for stage, summary in summaries.items():
+                        writer.writerow(
+                            [timestamp, stage, summary.samples]
+                            + [round(value, 3) for value in summary[1:]]
+                        )
+            else:
+                entry = {
+                    'timestamp': timestamp,
+                    'stages': {
+                        stage: {
+                            name: round(value, 3) if isinstance(value, float) else value
+                            for name, value in summary._asdict().items()
+                        }
+                        for stage, summary in summaries.items()
+                    },
+                }
+                with path.open('a', encoding='utf-8') as report_file:
+                    report_file.write(json.dumps(entry) + '\n')
+        except OSError as exc:
+            logging.warning("Could not write latency report to %s: %s", path, exc)
+            return
+        logging.info("Latency report written to %s.", path)
+
+
+# Wspólny dla całego procesu; włączany opcjami --latency-report / --latency-overlay
+LATENCY = LatencyTracker()
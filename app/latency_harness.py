@@ -0,0 +1,319 @@
+# app/latency_harness.py
+'''
+Pomiar opóźnienia "od gestu do obrazu" bez kamery i bez okna.
+
+Scenariusz kolejnych gestów (np. pięść, potem palec wskazujący) jest odgrywany przez
+syntetyczne dłonie podstawione za model MediaPipe. Klatki przechodzą przez prawdziwy
+CameraHandler, a gesty przez AppController - tę samą logikę, którą wykonuje MainWindow.
+Scena jest rysowana backendem z OBJECT_CONFIG.render_backend; Matplotlib rysuje na płótnie
+Agg zamiast FigureCanvasTkAgg, więc pomiar obejmuje koszt rysowania płótna. Zegar wirtualny
+biegnie w czasie rzeczywistym podczas obliczeń, a oczekiwanie na kolejny termin
+przeskakuje, więc wynik uwzględnia koszt przetwarzania, a kilkadziesiąt sekund scenariusza
+mierzy się w kilka sekund.
+
+Dla każdego gestu mierzone są dwa opóźnienia względem chwili pokazania gestu: wykonanie
+akcji na AppState oraz pierwsze wyświetlenie przerysowanej sceny. Nie obejmują one
+opóźnienia samej kamery (ekspozycja, transmisja) ani odświeżania monitora.
+
+    python -m app.latency_harness --repeats 20 --history-length 5 --enter-votes 3
+'''
+import argparse
+import bisect
+import contextlib
+import dataclasses
+import json
+import logging
+import time
+from collections.abc import Callable, Iterator, Sequence
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Final, NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+import camera_handler
+from app.config import ANIMATION_CONFIG, CAMERA_CONFIG, OBJECT_CONFIG, AnimationConfig
+from app.controller import (
+    RENDER_BACKEND_MATPLOTLIB,
+    RENDER_BACKEND_SOFTWARE,
+    AppController,
+    SceneView,
+)
+from app.software_renderer import SoftwareView
+from app.state import AppState, Gesture
+from app.synthetic import SyntheticHands, make_gesture_hand
+
+
+class ScriptStep(NamedTuple):
+    gesture: Gesture
+    duration_s: float
+
+
+# Otwarta dłoń obraca bryłę, żeby reset widoku (VICTORY) był widoczny na obrazie
+DEFAULT_SCRIPT: Final[tuple[ScriptStep, ...]] = (
+    ScriptStep(Gesture.NO_HAND, 0.5),
+    ScriptStep(Gesture.OPEN_HAND, 1.0),
+    ScriptStep(Gesture.VICTORY, 1.0),
+    ScriptStep(Gesture.POINTING, 1.0),
+    ScriptStep(Gesture.THUMBS_UP, 1.0),
+    ScriptStep(Gesture.FIST, 1.0),
+    ScriptStep(Gesture.NO_HAND, 0.5),
+    ScriptStep(Gesture.SWIPE_RIGHT, 0.4),
+    ScriptStep(Gesture.NO_HAND, 0.7),
+    ScriptStep(Gesture.SWIPE_UP, 0.4),
+    ScriptStep(Gesture.NO_HAND, 0.7),
+)
+
+OPEN_HAND_WRIST: Final[tuple[float, float]] = (0.7, 0.6)
+# Machnięcie wykonywane zaciśniętą dłonią: położenie nadgarstka na początku i końcu kroku
+SWIPE_PATHS: Final[dict[Gesture, tuple[tuple[float, float], tuple[float, float]]]] = {
+    Gesture.SWIPE_RIGHT: ((0.2, 0.6), (0.8, 0.6)),
+    Gesture.SWIPE_LEFT: ((0.8, 0.6), (0.2, 0.6)),
+    Gesture.SWIPE_UP: ((0.5, 0.9), (0.5, 0.3)),
+    Gesture.SWIPE_DOWN: ((0.5, 0.3), (0.5, 0.9)),
+}
+
+
+class VirtualClock:
+    '''Zegar biegnący w czasie rzeczywistym, w którym `sleep` przesuwa czas bez czekania.'''
+
+    def __init__(self) -> None:
+        self._offset = -time.perf_counter()
+
+    def __call__(self) -> float:
+        return time.perf_counter() + self._offset
+
+    def sleep(self, seconds: float) -> None:
+        self._offset += seconds
+
+
+class Timeline:
+    '''Scenariusz rozłożony w czasie: chwile rozpoczęcia kolejnych kroków.'''
+
+    def __init__(self, steps: Sequence[ScriptStep]) -> None:
+        self.steps = tuple(steps)
+        self.starts = np.concatenate([[0.0], np.cumsum([s.duration_s for s in steps])[:-1]])
+        self.end = float(sum(step.duration_s for step in steps))
+
+    def hand_at(self, timestamp: float) -> npt.NDArray[np.float32] | None:
+        '''Punkty dłoni widocznej w chwili `timestamp` albo None (brak dłoni).'''
+        index = max(0, bisect.bisect_right(self.starts, timestamp) - 1)
+        step = self.steps[index]
+        if step.gesture in SWIPE_PATHS:
+            (x0, y0), (x1, y1) = SWIPE_PATHS[step.gesture]
+            progress = min(1.0, (timestamp - self.starts[index]) / step.duration_s)
+            wrist = (x0 + (x1 - x0) * progress, y0 + (y1 - y0) * progress)
+            return make_gesture_hand(Gesture.FIST, wrist)
+        if step.gesture is Gesture.OPEN_HAND:
+            return make_gesture_hand(Gesture.OPEN_HAND, OPEN_HAND_WRIST)
+        if step.gesture is Gesture.NO_HAND:
+            return None
+        return make_gesture_hand(step.gesture)
+
+
+class ScriptedHands(SyntheticHands):
+    '''Zastępuje model MediaPipe: zwraca dłoń, którą scenariusz pokazuje w chwili detekcji.'''
+
+    def __init__(self, timeline: Timeline, clock: VirtualClock) -> None:
+        super().__init__()
+        self.timeline = timeline
+        self.clock = clock
+
+    def process(self, image: npt.NDArray[np.uint8]) -> SimpleNamespace:
+        hand = self.timeline.hand_at(self.clock())
+        self.set_hands([] if hand is None else [hand])
+        return super().process(image)
+
+
+class GestureLatency(NamedTuple):
+    action_ms: list[float]
+    photon_ms: list[float]
+    missed: int
+
+
+@contextlib.contextmanager
+def _synthetic_camera(hands: ScriptedHands) -> Iterator[camera_handler.CameraHandler]:
+    '''CameraHandler z syntetycznym źródłem i scenariuszem zamiast modelu dłoni.'''
+    config = dataclasses.replace(
+        CAMERA_CONFIG,
+        source='synthetic',
+        source_realtime=False,
+        threaded_capture=False,
+        inference_backend=camera_handler.INFERENCE_INLINE,
+        adaptive_inference=False,
+        roi_inference=False,
+    )
+    handler = camera_handler.CameraHandler(config, hands_factory=lambda: hands)
+    try:
+        yield handler
+    finally:
+        handler.release()
+
+
+def _scene_view(backend: str) -> tuple[SceneView, Callable[[], None]]:
+    '''Widok sceny wybranego backendu i funkcja wyświetlająca narysowaną scenę.'''
+    width, height = OBJECT_CONFIG.render_size
+    if backend == RENDER_BACKEND_MATPLOTLIB:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        from app.view_3d import ThreeDView
+
+        # Ta sama figura co w MainWindow; draw() płótna odpowiada rysowaniu FigureCanvasTkAgg
+        figure = Figure(facecolor='#f0f0f0')
+        canvas = FigureCanvasAgg(figure)
+        view = ThreeDView(figure.add_subplot(111, projection='3d'))
+        return view, canvas.draw
+    if backend == RENDER_BACKEND_SOFTWARE:
+        return SoftwareView(width, height), lambda: None
+    raise ValueError(f'Unknown render backend: {backend!r}')
+
+
+def build_timeline(
+    script: Sequence[ScriptStep], repeats: int, jitter_s: float, seed: int = 0
+) -> Timeline:
+    '''
+    Powtarza scenariusz `repeats` razy. Każdy krok jest wydłużany o losowy ułamek
+    `jitter_s`, aby gesty zaczynały się w różnych fazach cyklu kamery.
+    '''
+    rng = np.random.default_rng(seed)
+    steps = [
+        ScriptStep(step.gesture, step.duration_s + float(rng.uniform(0.0, jitter_s)))
+        for _ in range(repeats)
+        for step in script
+    ]
+    return Timeline(steps)
+
+
+def measure(
+    script: Sequence[ScriptStep] = DEFAULT_SCRIPT,
+    repeats: int = 10,
+    config: AnimationConfig = ANIMATION_CONFIG,
+    seed: int = 0,
+    backend: str = OBJECT_CONFIG.render_backend,
+) -> dict[Gesture, GestureLatency]:
+    '''Odgrywa scenariusz i zwraca opóźnienia akcji i obrazu dla gestów z akcją.'''
+    clock = VirtualClock()
+    timeline = build_timeline(script, repeats, 1.0 / config.camera_rate_hz, seed)
+    hands = ScriptedHands(timeline, clock)
+    actions: list[tuple[float, Gesture]] = []
+    presented: list[float] = []
+
+    view, present = _scene_view(backend)
+
+    def present_scene() -> None:
+        present()
+        presented.append(clock())
+
+    controller = AppController(AppState(), view, present_scene, clock, config)
+    for gesture, action in list(controller.gesture_actions.items()):
+
+        def recorded(gesture: Gesture = gesture, action: Callable[[], None] = action) -> None:
+            actions.append((clock(), gesture))
+            action()
+
+        controller.gesture_actions[gesture] = recorded
+
+    with _synthetic_camera(hands) as handler:
+        controller.add_stages(lambda _elapsed: controller.process_gestures(handler.process_frame()))
+        # Ten sam czas uśpienia co pętla `after` w MainWindow (pełne milisekundy, min. 1 ms)
+        clock.sleep(-clock())
+        while clock() < timeline.end:
+            delay_s = controller.tick()
+            clock.sleep(max(1, round(delay_s * 1000.0)) / 1000.0)
+
+    return _latencies(timeline, actions, presented, set(controller.gesture_actions))
+
+
+def _latencies(
+    timeline: Timeline,
+    actions: list[tuple[float, Gesture]],
+    presented: list[float],
+    actionable: set[Gesture],
+) -> dict[Gesture, GestureLatency]:
+    results: dict[Gesture, GestureLatency] = {}
+    boundaries = [*timeline.starts.tolist(), timeline.end]
+    for index, step in enumerate(timeline.steps):
+        if step.gesture not in actionable:
+            continue
+        start, end = boundaries[index], boundaries[index + 1]
+        result = results.setdefault(step.gesture, GestureLatency([], [], 0))
+        action_time = next(
+            (t for t, gesture in actions if start <= t < end and gesture is step.gesture), None
+        )
+        if action_time is None:
+            results[step.gesture] = result._replace(missed=result.missed + 1)
+            continue
+        result.action_ms.append((action_time - start) * 1000.0)
+        # Pierwsza klatka sceny po akcji; brak przy akcjach bez widocznego skutku (np. FIST)
+        frame = bisect.bisect_left(presented, action_time)
+        if frame < len(presented) and presented[frame] < end:
+            result.photon_ms.append((presented[frame] - start) * 1000.0)
+    return results
+
+
+def _percentiles(values: list[float]) -> str:
+    if not values:
+        return '-'
+    p50, p95, top = np.percentile(values, [50.0, 95.0, 100.0]).tolist()
+    return f'{p50:6.1f} {p95:6.1f} {top:6.1f}'
+
+
+def format_report(results: dict[Gesture, GestureLatency]) -> str:
+    lines = [
+        f'{"gest":<12} {"n":>3}  {"akcja p50/p95/max [ms]":>22}  '
+        f'{"obraz p50/p95/max [ms]":>22}  {"pominięte":>9}'
+    ]
+    for gesture, result in results.items():
+        lines.append(
+            f'{gesture.value:<12} {len(result.action_ms):>3}  '
+            f'{_percentiles(result.action_ms):>22}  {_percentiles(result.photon_ms):>22}  '
+            f'{result.missed:>9}'
+        )
+    return '\n'.join(lines)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Pomiar opóźnienia od gestu do obrazu')
+    parser.add_argument('--repeats', type=int, default=20, help='liczba powtórzeń scenariusza')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--history-length', type=int, default=ANIMATION_CONFIG.gesture_history_length
+    )
+    parser.add_argument('--enter-votes', type=int, default=ANIMATION_CONFIG.gesture_enter_votes)
+    parser.add_argument('--exit-votes', type=int, default=ANIMATION_CONFIG.gesture_exit_votes)
+    parser.add_argument('--camera-rate', type=float, default=ANIMATION_CONFIG.camera_rate_hz)
+    parser.add_argument('--render-rate', type=float, default=ANIMATION_CONFIG.render_rate_hz)
+    parser.add_argument(
+        '--backend',
+        choices=(RENDER_BACKEND_MATPLOTLIB, RENDER_BACKEND_SOFTWARE),
+        default=OBJECT_CONFIG.render_backend,
+        help='backend widoku 3D',
+    )
+    parser.add_argument(
+        '--json', type=Path, default=None, help='plik, do którego zapisywane są surowe pomiary'
+    )
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.WARNING)
+    args = parse_args()
+    animation_config = dataclasses.replace(
+        ANIMATION_CONFIG,
+        gesture_history_length=args.history_length,
+        gesture_enter_votes=args.enter_votes,
+        gesture_exit_votes=args.exit_votes,
+        camera_rate_hz=args.camera_rate,
+        render_rate_hz=args.render_rate,
+    )
+    latencies = measure(
+        repeats=args.repeats, config=animation_config, seed=args.seed, backend=args.backend
+    )
+    print(format_report(latencies))
+    if args.json is not None:
+        args.json.write_text(
+            json.dumps({gesture.value: r._asdict() for gesture, r in latencies.items()}, indent=2),
+            encoding='utf-8',
+        )
@@ -4,38 +4,74 @@ Główny moduł aplikacji - klasa MainWindow.
 Łączy wszystkie komponenty w działającą całość.
 '''
 import logging
+import threading
+import time
 import tkinter as tk
 from collections.abc import Callable
 from tkinter import ttk
 from typing import TYPE_CHECKING, Final
 
-import cv2
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from PIL import Image, ImageTk
 
-from app.config import ANIMATION_CONFIG
-from app.state import AppState, Gesture
-from app.view_3d import ThreeDView
-from app.widgets import create_gesture_panel
-from camera_handler import CameraHandler, CameraOutput
+from app.config import ANIMATION_CONFIG, OBJECT_CONFIG
+from app.controller import (
+    RENDER_BACKEND_MATPLOTLIB,
+    RENDER_BACKEND_SOFTWARE,
+    AppController,
+    SceneView,
+)
+from app.latency import LATENCY, STAGE_BLIT
+from app.preview import VideoPreview
+from app.startup import MARK_CAMERA_READY, MARK_FIRST_FRAME, MARK_UI_READY, StartupTimer
+from app.state import AppState, CameraStatus, Gesture, StateChange
+from app.widgets import GestureHighlighter, create_gesture_panel
 
 # Dalsza część bloku type-checking
 if TYPE_CHECKING:
     from matplotlib.axes import Axes
+    from matplotlib.backend_bases import Event
     from matplotlib.figure import Figure
 
+    from app.session_log import SessionRecorder
+    from camera_handler import CameraHandler
+
+CAMERA_STATUS_TEXT: Final[dict[CameraStatus, str]] = {
+    CameraStatus.STARTING: 'Uruchamianie kamery i modelu dłoni...',
+    CameraStatus.AVAILABLE: 'Kamera gotowa.',
+    CameraStatus.RECONNECTING: 'Kamera niedostępna - ponowne łączenie...',
+    CameraStatus.FAILED: 'Kamera niedostępna - sprawdź połączenie (próby trwają w tle).',
+    CameraStatus.FINISHED: 'Źródło klatek dobiegło końca.',
+}
+
 
 class MainWindow:
     '''Główna klasa aplikacji Tkinter, która zarządza UI i pętlą zdarzeń.'''
 
-    UPDATE_INTERVAL_MS: Final[int] = 15
-
-    def __init__(self, window: tk.Tk, window_title: str) -> None:
+    # Częstotliwość logowania osiągniętych częstotliwości etapów
+    RATE_REPORT_HZ: Final[float] = 0.2
+    # Częstotliwość odświeżania raportu czasów etapów na pasku stanu
+    LATENCY_OVERLAY_HZ: Final[float] = 1.0
+
+    def __init__(
+        self,
+        window: tk.Tk,
+        window_title: str,
+        startup_timer: StartupTimer | None = None,
+        latency_overlay: bool = False,
+        session_recorder: 'SessionRecorder | None' = None,
+    ) -> None:
         # Inicjalizacja komponentów
         self.window = window
         self.state = AppState()
-        self.camera_handler = CameraHandler()
+        self.startup_timer = startup_timer or StartupTimer()
+        self._latency_text = ''
+
+        # Kamera i model MediaPipe powstają w tle, aby nie opóźniać pokazania okna
+        self.camera_handler: CameraHandler | None = None
+        self._camera_lock = threading.Lock()
+        self._camera_startup_failed = False
+        self._closing = False
+        threading.Thread(target=self._start_camera, name='CameraStartup', daemon=True).start()
 
         self.style = ttk.Style(self.window)
         self._configure_styles()
@@ -43,25 +79,32 @@ class MainWindow:
         # Konfiguracja okna
         self.window.title(window_title)
 
-        # Słownik akcji powiązanych z gestami
-        self.gesture_actions: dict[Gesture, Callable[[], None]] = {
-            Gesture.POINTING: self._handle_color_change,
-            Gesture.THUMBS_UP: self._handle_shape_change,
-            Gesture.VICTORY: self._handle_view_reset,
-            Gesture.FIST: self._handle_rotation_stop,
-        }
-
-        # Budowanie interfejsu
+        # Budowanie interfejsu; widżety odświeżane są tylko po zmianach stanu
         self._setup_ui()
-
-        # Inicjalizacja widoku 3D
-        self.view_3d = ThreeDView(self.ax)
+        # Logika gestów, animacji i rysowania sceny (niezależna od Tk)
+        self.controller = AppController(self.state, self.view_3d, self._present_scene)
+        self.controller.session_recorder = session_recorder
+        self.state.subscribe(StateChange.GESTURE, self._show_gesture)
+        self.state.subscribe(StateChange.COLOR, self._show_color)
+        self.state.subscribe(StateChange.SHAPE, self._show_shape)
+        self.state.subscribe(StateChange.CAMERA_STATUS, self._show_camera_status)
+
+        self.scheduler = self.controller.scheduler
+        self.controller.add_stages(self._camera_stage)
+        self.scheduler.add_stage(
+            'rate_report', self.RATE_REPORT_HZ, lambda _elapsed: self.scheduler.log_rates()
+        )
+        if latency_overlay:
+            self.scheduler.add_stage(
+                'latency_overlay', self.LATENCY_OVERLAY_HZ, self._latency_overlay_stage
+            )
 
         # Deklaracja atrybutów UI, które są inicjalizowane później
         self.current_color_box: tk.Canvas
         self.next_color_box: tk.Canvas
         self.shape_label: ttk.Label
-        self._video_photo: ImageTk.PhotoImage | None = None
+
+        self.startup_timer.mark(MARK_UI_READY)
 
         # Uruchomienie pętli
         self.update()
@@ -79,12 +122,15 @@ class MainWindow:
         right_frame.grid(row=0, column=1, sticky='nsew')
 
         self.status_bar = ttk.Label(
-            self.window, text='Inicjalizacja...', relief=tk.SUNKEN, anchor='w', padding=(5, 2)
+            self.window,
+            text=CAMERA_STATUS_TEXT[self.state.camera_status],
+            relief=tk.SUNKEN, anchor='w', padding=(5, 2)
         )
         self.status_bar.grid(row=1, column=0, columnspan=2, sticky='ew')
 
         self.video_label = ttk.Label(left_frame, background='black')
         self.video_label.pack(fill=tk.BOTH, expand=True)
+        self.video_preview = VideoPreview(self.video_label, ANIMATION_CONFIG.preview_max_fps)
 
         control_panel = ttk.Frame(left_frame)
         control_panel.pack(fill=tk.X, pady=10, side=tk.BOTTOM)
@@ -95,10 +141,8 @@ class MainWindow:
             self.gesture_icons,
             self.gesture_labels,
         ) = gesture_components
-
-        self.fig: Figure
-        self.ax: Axes
-        self.canvas: FigureCanvasTkAgg
+        self.gesture_highlighter = GestureHighlighter(self.gesture_frames, self.gesture_labels)
+        self.gesture_highlighter.show(Gesture.UNKNOWN)
 
         info_frame = ttk.LabelFrame(
             right_frame, text='Panel Wizualizacji', padding='10'
@@ -108,10 +152,60 @@ class MainWindow:
         # Reszta UI
         self._create_info_panel_widgets(info_frame)
 
-        self.fig = plt.figure(facecolor='#f0f0f0')
-        self.ax = self.fig.add_subplot(111, projection='3d')
-        self.canvas = FigureCanvasTkAgg(self.fig, master=right_frame)  # type: ignore[no-untyped-call]
+        # Inicjalizacja widoku 3D
+        self.view_3d: SceneView
+        self._present_scene: Callable[[], None]
+        backend = OBJECT_CONFIG.render_backend
+        if backend == RENDER_BACKEND_MATPLOTLIB:
+            self._create_matplotlib_view(right_frame)
+        elif backend == RENDER_BACKEND_SOFTWARE:
+            self._create_software_view(right_frame)
+        else:
+            raise ValueError(f'Unknown render backend: {backend!r}')
+
+    def _create_matplotlib_view(self, parent: ttk.Frame) -> None:
+        # Matplotlib importowany tylko dla tego backendu - to najcięższy import interfejsu
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        from app.view_3d import ThreeDView
+
+        self.fig: Figure = plt.figure(facecolor='#f0f0f0')
+        self.ax: Axes = self.fig.add_subplot(111, projection='3d')
+        self.canvas = FigureCanvasTkAgg(self.fig, master=parent)  # type: ignore[no-untyped-call]
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, pady=(10, 0))  # type: ignore[no-untyped-call]
+        self.view_3d = ThreeDView(self.ax)
+        # draw_idle łączy rysowanie z cyklem zdarzeń Tk, więc czas wyświetlenia liczony jest
+        # od zlecenia do zakończenia rysowania płótna (zdarzenie draw_event)
+        self._blit_requested: float | None = None
+        self.canvas.mpl_connect('draw_event', self._on_canvas_drawn)
+        self._present_scene = self._request_canvas_draw
+
+    def _create_software_view(self, parent: ttk.Frame) -> None:
+        from app.software_renderer import SoftwareView
+
+        width, height = OBJECT_CONFIG.render_size
+        view = SoftwareView(width, height)
+        self._scene_photo = ImageTk.PhotoImage('RGB', (width, height))
+        self.scene_label = ttk.Label(parent, image=self._scene_photo, anchor='center')
+        self.scene_label.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
+        self.view_3d = view
+
+        def present() -> None:
+            with LATENCY.span(STAGE_BLIT):
+                self._scene_photo.paste(Image.fromarray(view.image))
+
+        self._present_scene = present
+
+    def _request_canvas_draw(self) -> None:
+        if LATENCY.enabled:
+            self._blit_requested = time.perf_counter()
+        self.canvas.draw_idle()  # type: ignore[no-untyped-call]
+
+    def _on_canvas_drawn(self, _event: 'Event') -> None:
+        if self._blit_requested is not None:
+            LATENCY.record(STAGE_BLIT, time.perf_counter() - self._blit_requested)
+            self._blit_requested = None
 
     def _configure_styles(self) -> None:
         self.style.theme_use('clam')
@@ -141,89 +235,89 @@ class MainWindow:
         self.shape_label.pack(anchor='w', padx=5, pady=5)
 
         ttk.Button(
-            parent, text="Resetuj Widok (gest 'Victory')", command=self._handle_view_reset
+            parent, text="Resetuj Widok (gest 'Victory')",
+            command=lambda: self.controller.reset_view(),
         ).pack(pady=5, fill=tk.X)
 
-    def update(self) -> None:
-        camera_output: CameraOutput = self.camera_handler.process_frame()
-
-        if camera_output.frame is not None:
-            img_rgb = cv2.cvtColor(camera_output.frame, cv2.COLOR_BGR2RGB)
-            img = Image.fromarray(img_rgb)
-            self._video_photo = ImageTk.PhotoImage(image=img)
-            self.video_label.configure(image=self._video_photo, text='')
-
-        self._process_gestures(camera_output)
-
-        # Wygładzanie ruchu
-        smoothing = ANIMATION_CONFIG.smoothing_factor
-        self.state.angle_x += (self.state.target_angle_x - self.state.angle_x) * smoothing
-        self.state.angle_y += (self.state.target_angle_y - self.state.angle_y) * smoothing
+    def _start_camera(self) -> None:
+        '''Wątek tła: import cv2/MediaPipe, otwarcie kamery i zbudowanie modelu dłoni.'''
+        try:
+            from camera_handler import CameraHandler  # import w tle: cv2 i MediaPipe są ciężkie
+
+            handler = CameraHandler()
+        except Exception:
+            logging.exception("Camera initialization failed.")
+            self._camera_startup_failed = True
+            return
+        with self._camera_lock:
+            if not self._closing:
+                self.camera_handler = handler
+                return
+        handler.release()
 
-        self.view_3d.draw(self.state)
-        self.canvas.draw()  # type: ignore[no-untyped-call]
-
-        self.window.after(self.UPDATE_INTERVAL_MS, self.update)
-
-    def _process_gestures(self, camera_output: CameraOutput) -> None:
-        self.state.gesture_history.append(camera_output.gesture)
-
-        is_stable_gesture = (
-            len(set(self.state.gesture_history)) == 1 and
-            len(self.state.gesture_history) == self.state.gesture_history.maxlen
-        )
-        if is_stable_gesture:
-            self.state.current_stable_gesture = self.state.gesture_history[0]
-
-        active_gesture = self.state.current_stable_gesture or Gesture.UNKNOWN
-        self._update_gesture_highlight(active_gesture)
-
-        stable_gesture = self.state.current_stable_gesture
-
-        if stable_gesture is Gesture.OPEN_HAND and camera_output.coords:
-            self.state.target_angle_y = (camera_output.coords[0] - 0.5) * -360
-            self.state.target_angle_x = (camera_output.coords[1] - 0.5) * 180
-
-        if stable_gesture and stable_gesture != self.state.last_action_gesture:
-            action = self.gesture_actions.get(stable_gesture)
-            if action:
-                action()
-            else:
-                logging.debug("No action for gesture: %s", stable_gesture.value)
-            self.state.last_action_gesture = stable_gesture
-
-    def _handle_color_change(self) -> None:
-        self.state.next_color()
-        self.current_color_box.config(bg=self.state.get_current_color())
-        next_idx = (self.state.color_index + 1) % len(self.state.colors)
-        self.next_color_box.config(bg=self.state.colors[next_idx])
-        logging.info("Color changed to %s.", self.state.color_names[self.state.color_index])
-
-    def _handle_shape_change(self) -> None:
-        self.state.next_shape()
-        shape_name = self.state.shape_names[self.state.shape_index]
-        self.shape_label.config(text=f'Kształt: {shape_name}')
-        logging.info("Shape changed to %s.", shape_name)
-
-    def _handle_view_reset(self) -> None:
-        self.state.target_angle_x, self.state.target_angle_y = 30.0, 45.0
-        logging.info("View has been reset.")
-
-    def _handle_rotation_stop(self) -> None:
-        self.state.target_angle_x = self.state.angle_x
-        self.state.target_angle_y = self.state.angle_y
-        logging.info("Rotation stopped.")
-
-    def _update_gesture_highlight(self, active_gesture: Gesture) -> None:
-        if active_gesture not in self.gesture_frames:
-            active_gesture = Gesture.UNKNOWN
-
-        for gesture, frame in self.gesture_frames.items():
-            frame_style = 'Highlight.TFrame' if gesture is active_gesture else 'TFrame'
-            label_style = 'Highlight.TLabel' if gesture is active_gesture else 'TLabel'
-            frame.config(style=frame_style)
-            self.gesture_labels[gesture].config(style=label_style)
+    def update(self) -> None:
+        '''Wykonuje etapy, których termin minął, i planuje pobudkę na najbliższy termin.'''
+        delay_s = self.controller.tick()
+        self.window.after(max(1, round(delay_s * 1000.0)), self.update)
+
+    def _camera_stage(self, _elapsed_s: float) -> None:
+        handler = self.camera_handler
+        if handler is not None:
+            self._update_camera(handler)
+        elif self._camera_startup_failed:
+            self._set_camera_status(CameraStatus.FAILED)
+
+    def _latency_overlay_stage(self, _elapsed_s: float) -> None:
+        self._latency_text = LATENCY.format_overlay()
+        self._show_camera_status(self.state)
+
+    def _update_camera(self, handler: 'CameraHandler') -> None:
+        self.startup_timer.mark(MARK_CAMERA_READY)
+        camera_output = handler.process_frame()
+        self._set_camera_status(handler.camera_status)
+
+        if (
+            camera_output.fresh
+            and camera_output.frame is not None
+            and self.video_preview.show(camera_output.frame)
+        ):
+            self.startup_timer.mark(MARK_FIRST_FRAME)
+            self.startup_timer.report()
+
+        self.controller.process_gestures(camera_output)
+
+    def _set_camera_status(self, status: CameraStatus) -> None:
+        if not self.state.set_camera_status(status):
+            return
+        logging.info("Camera status changed to %s.", status.value)
+        if status is not CameraStatus.AVAILABLE:
+            # Bez kamery nie będzie pierwszej klatki - raportujemy to, co zmierzono
+            self.startup_timer.report()
+
+    # Subskrybenci zmian stanu - wywoływani z flush_changes, raz na klatkę interfejsu
+    def _show_gesture(self, state: AppState) -> None:
+        self.gesture_highlighter.show(state.current_stable_gesture or Gesture.UNKNOWN)
+
+    def _show_color(self, state: AppState) -> None:
+        self.current_color_box.config(bg=state.get_current_color())
+        next_idx = (state.color_index + 1) % len(state.colors)
+        self.next_color_box.config(bg=state.colors[next_idx])
+
+    def _show_shape(self, state: AppState) -> None:
+        self.shape_label.config(text=f'Kształt: {state.shape_names[state.shape_index]}')
+
+    def _show_camera_status(self, state: AppState) -> None:
+        text = CAMERA_STATUS_TEXT[state.camera_status]
+        if self._latency_text:
+            text = f'{text}  |  {self._latency_text}'
+        self.status_bar.config(text=text)
 
     def on_closing(self) -> None:
-        self.camera_handler.release()
+        with self._camera_lock:
+            self._closing = True
+            handler = self.camera_handler
+        if handler is not None:
+            handler.release()
+        if self.controller.session_recorder is not None:
+            self.controller.session_recorder.close()
         self.window.destroy()
@@ -0,0 +1,183 @@
+# app/meshes.py
+'''
+Moduł z geometrią brył wyświetlanych w widoku 3D.
+
+Każda bryła to siatka: wierzchołki (V, 3) float32 oraz ściany (F, K) int32 - indeksy
+K wierzchołków wielokąta. Ściany o mniejszej liczbie wierzchołków powtarzają ostatni
+indeks, dzięki czemu cała siatka mieści się w jednej tablicy. Siatki są budowane
+raz i współdzielone przez wszystkie widoki. Oprócz brył wbudowanych można wyświetlać
+modele z plików OBJ/STL (ObjectConfig.model_paths), upraszczane do zadanej liczby ścian.
+'''
+import functools
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+from app.config import OBJECT_CONFIG
+
+SPHERE_RADIUS = 0.5
+
+
+class Mesh(NamedTuple):
+    vertices: npt.NDArray[np.float32]  # (V, 3)
+    faces: npt.NDArray[np.int32]  # (F, K)
+
+    def polygons(self) -> npt.NDArray[np.float32]:
+        '''Współrzędne wierzchołków każdej ściany (F, K, 3).'''
+        return self.vertices[self.faces]
+
+
+def _mesh(vertices: list[list[float]], faces: list[list[int]]) -> Mesh:
+    return Mesh(np.array(vertices, dtype=np.float32), np.array(faces, dtype=np.int32))
+
+
+def cube_mesh() -> Mesh:
+    return _mesh(
+        [[-.5, -.5, -.5], [.5, -.5, -.5], [.5, .5, -.5], [-.5, .5, -.5],
+         [-.5, -.5, .5], [.5, -.5, .5], [.5, .5, .5], [-.5, .5, .5]],
+        [[0, 3, 2, 1], [4, 5, 6, 7], [0, 1, 5, 4], [2, 3, 7, 6], [0, 4, 7, 3], [1, 2, 6, 5]],
+    )
+
+
+def pyramid_mesh() -> Mesh:
+    return _mesh(
+        [[-.5, -.5, -.5], [.5, -.5, -.5], [.5, .5, -.5], [-.5, .5, -.5], [0, 0, .5]],
+        [[0, 1, 4, 4], [1, 2, 4, 4], [2, 3, 4, 4], [3, 0, 4, 4], [0, 3, 2, 1]],
+    )
+
+
+def sphere_mesh(u_steps: int = 30, v_steps: int = 20) -> Mesh:
+    '''Siatka czworokątów na sferze (długość x szerokość geograficzna).'''
+    u, v = np.meshgrid(
+        np.linspace(0.0, 2.0 * np.pi, u_steps), np.linspace(0.0, np.pi, v_steps), indexing='ij'
+    )
+    vertices = SPHERE_RADIUS * np.stack(
+        [np.cos(u) * np.sin(v), np.sin(u) * np.sin(v), np.cos(v)], axis=-1
+    )
+    index = np.arange(u_steps * v_steps).reshape(u_steps, v_steps)
+    faces = np.stack(
+        [index[:-1, :-1], index[:-1, 1:], index[1:, 1:], index[1:, :-1]], axis=-1
+    ).reshape(-1, 4)
+    return Mesh(vertices.reshape(-1, 3).astype(np.float32), faces.astype(np.int32))
+
+
+class ShapeStyle(NamedTuple):
+    '''Wygląd bryły wspólny dla backendów renderowania (kolor krawędzi w notacji Matplotlib).'''
+    edgecolor: str
+    linewidth: float
+    shaded: bool
+
+
+SHAPE_MESHES = {
+    'CUBE': cube_mesh,
+    'PYRAMID': pyramid_mesh,
+    'SPHERE': sphere_mesh,
+}
+
+# Ściany brył płaskich w widoku Matplotlib: bez powtórzonych wierzchołków (boki piramidy
+# to trójkąty) i w kolejności pierwotnego renderera - punkt początkowy i kierunek obrysu
+# zmieniają sortowanie głębi i wygładzanie krawędzi
+PLOT_FACES: dict[str, list[list[int]]] = {
+    'CUBE': [[0, 1, 2, 3], [4, 5, 6, 7], [0, 1, 5, 4], [2, 3, 7, 6], [0, 3, 7, 4], [1, 2, 6, 5]],
+    'PYRAMID': [[0, 1, 4], [1, 2, 4], [2, 3, 4], [3, 0, 4], [0, 1, 2, 3]],
+}
+
+SHAPE_STYLES = {
+    'CUBE': ShapeStyle(edgecolor='k', linewidth=1.0, shaded=False),
+    'PYRAMID': ShapeStyle(edgecolor='k', linewidth=1.0, shaded=False),
+    'SPHERE': ShapeStyle(edgecolor='none', linewidth=0.0, shaded=True),
+}
+DEFAULT_STYLE = ShapeStyle(edgecolor='none', linewidth=0.0, shaded=True)
+
+
+@functools.cache
+def get_mesh(shape: str) -> Mesh:
+    '''Zwraca (zbudowaną lub wczytaną przy pierwszym użyciu) siatkę bryły o podanej nazwie.'''
+    builder = SHAPE_MESHES.get(shape)
+    if builder is not None:
+        return builder()
+    model_path = OBJECT_CONFIG.model_paths.get(shape)
+    if model_path is None:
+        raise ValueError(f'Unknown shape: {shape!r}')
+    # Wczytywanie modeli jest potrzebne tylko, gdy skonfigurowano pliki
+    from app.model_loader import load_model
+
+    return load_model(Path(model_path), OBJECT_CONFIG.max_model_faces)
+
+
+def plot_polygons(shape: str) -> list[npt.NDArray[np.float32]] | npt.NDArray[np.float32]:
+    '''Wielokąty bryły dla Poly3DCollection: lista o różnej liczbie wierzchołków lub (F, K, 3).'''
+    mesh = get_mesh(shape)
+    faces = PLOT_FACES.get(shape)
+    if faces is None:
+        return mesh.polygons()
+    return [mesh.vertices[face] for face in faces]
+
+
+def normalized(mesh: Mesh) -> Mesh:
+    '''Przesuwa i skaluje siatkę tak, aby mieściła się w sześcianie [-0.5, 0.5]^3.'''
+    low, high = mesh.vertices.min(axis=0), mesh.vertices.max(axis=0)
+    extent = float((high - low).max()) or 1.0
+    vertices = (mesh.vertices - (low + high) / 2.0) / extent
+    return Mesh(vertices.astype(np.float32), mesh.faces)
+
+
+def decimate(mesh: Mesh, max_faces: int) -> Mesh:
+    '''
+    Upraszcza siatkę trójkątów metodą klasteryzacji wierzchołków: wierzchołki w tej samej
+    komórce regularnej siatki zastępuje ich średnia, a trójkąty zdegenerowane i powtórzone
+    są usuwane. Rozdzielczość siatki jest zmniejszana, aż liczba ścian spadnie do `max_faces`.
+    '''
+    if len(mesh.faces) <= max_faces:
+        return mesh
+    low = mesh.vertices.min(axis=0)
+    extent = float((mesh.vertices.max(axis=0) - low).max()) or 1.0
+    # Zamknięta powierzchnia w siatce r^3 ma rzędu kilku r^2 trójkątów
+    resolution = max(2, int(np.sqrt(max_faces / 2.0)))
+    while True:
+        decimated = _cluster_vertices(mesh, low, extent, resolution)
+        if len(decimated.faces) <= max_faces or resolution <= 2:
+            return decimated
+        resolution = max(2, int(resolution * 0.8))
+
+
+def _cluster_vertices(
+    mesh: Mesh, low: npt.NDArray[np.float32], extent: float, resolution: int
+) -> Mesh:
+    cells = ((mesh.vertices - low) / extent * resolution).astype(np.int64)
+    cells = np.clip(cells, 0, resolution - 1)
+    cell_ids = (cells[:, 0] * resolution + cells[:, 1]) * resolution + cells[:, 2]
+    _, cluster = np.unique(cell_ids, return_inverse=True)
+    counts = np.bincount(cluster)
+    vertices = np.stack(
+        [np.bincount(cluster, weights=mesh.vertices[:, axis]) / counts for axis in range(3)],
+        axis=1,
+    )
+
+    faces = cluster[mesh.faces]
+    faces = faces[
+        (faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) & (faces[:, 0] != faces[:, 2])
+    ]
+    # Ten sam trójkąt może powstać z kilku oryginalnych - zostawiamy jedno wystąpienie
+    _, first = np.unique(np.sort(faces, axis=1), axis=0, return_index=True)
+    faces = faces[np.sort(first)]
+    # Usunięcie wierzchołków, do których nie odwołuje się już żadna ściana
+    used, faces = np.unique(faces, return_inverse=True)
+    return Mesh(vertices[used].astype(np.float32), faces.reshape(-1, 3).astype(np.int32))
+
+
+def face_normals(mesh: Mesh) -> npt.NDArray[np.float32]:
+    '''
+    Jednostkowe normalne ścian (F, 3) metodą Newella - odporną na powtórzone
+    wierzchołki. Ściany zdegenerowane dostają wektor zerowy.
+    '''
+    polygons = mesh.polygons()
+    following = np.roll(polygons, -1, axis=1)
+    normals = np.cross(polygons, following).sum(axis=1)
+    length = np.linalg.norm(normals, axis=1, keepdims=True)
+    unit: npt.NDArray[np.float32] = np.divide(
+        normals, length, out=np.zeros_like(normals), where=length > 0
+    )
+    return unit
@@ -0,0 +1,126 @@
+# app/model_loader.py
+'''
+Moduł wczytujący modele 3D z plików OBJ i STL.
+
+Model jest triangulowany, normalizowany do sześcianu [-0.5, 0.5]^3 i upraszczany do
+zadanej liczby ścian. Wynik trafia do binarnej pamięci podręcznej (pliki .npy) o kluczu
+zawierającym skrót pełnej ścieżki, czas modyfikacji i rozmiar źródła, skąd przy kolejnych
+uruchomieniach jest mapowany do pamięci (np.load z mmap_mode) zamiast ponownego parsowania.
+'''
+import hashlib
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Final
+
+import numpy as np
+import numpy.typing as npt
+
+from app.meshes import Mesh, decimate, normalized
+
+MODEL_CACHE_DIR = (
+    Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'kck-gestures' / 'models'
+)
+MODEL_SUFFIXES: Final[frozenset[str]] = frozenset({'.obj', '.stl'})
+
+STL_HEADER_SIZE: Final[int] = 84
+STL_RECORD: Final[np.dtype[np.void]] = np.dtype(
+    [('normal', '<f4', (3,)), ('vertices', '<f4', (3, 3)), ('attribute', '<u2')]
+)
+STL_ASCII_VERTEX: Final[re.Pattern[bytes]] = re.compile(
+    rb'vertex\s+(\S+)\s+(\S+)\s+(\S+)', re.IGNORECASE
+)
+
+
+def load_obj(path: Path) -> Mesh:
+    '''Wczytuje wierzchołki i ściany (triangulowane wachlarzem) z pliku Wavefront OBJ.'''
+    vertices: list[list[str]] = []
+    faces: list[tuple[int, int, int]] = []
+    with path.open(encoding='utf-8', errors='replace') as obj_file:
+        for line in obj_file:
+            if line.startswith('v '):
+                vertices.append(line.split()[1:4])
+            elif line.startswith('f '):
+                # Indeksy od 1; ujemne liczone od końca dotychczasowej listy wierzchołków
+                indices = [int(token.split('/')[0]) for token in line.split()[1:]]
+                indices = [i - 1 if i > 0 else len(vertices) + i for i in indices]
+                faces.extend(
+                    (indices[0], indices[j], indices[j + 1]) for j in range(1, len(indices) - 1)
+                )
+    return _validated(path, np.array(vertices, dtype=np.float32), np.array(faces, dtype=np.int32))
+
+
+def load_stl(path: Path) -> Mesh:
+    '''Wczytuje binarny lub tekstowy plik STL, łącząc powtórzone wierzchołki trójkątów.'''
+    data = path.read_bytes()
+    count = int.from_bytes(data[80:STL_HEADER_SIZE], 'little') if len(data) >= 84 else -1
+    if len(data) == STL_HEADER_SIZE + count * STL_RECORD.itemsize:
+        records = np.frombuffer(data, STL_RECORD, count, offset=STL_HEADER_SIZE)
+        corners = records['vertices'].reshape(-1, 3)
+    else:
+        corners = np.array(STL_ASCII_VERTEX.findall(data), dtype=np.float32).reshape(-1, 3)
+    # Dodanie zera zamienia -0.0 na 0.0, aby identyczne wierzchołki miały identyczne bajty
+    corners = np.ascontiguousarray(corners, dtype=np.float32) + np.float32(0.0)
+    # Unikalność po bajtach całego wierzchołka - wielokrotnie szybsza niż np.unique(axis=0)
+    keys = corners.view(np.dtype((np.void, corners.itemsize * 3))).reshape(-1)
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    return _validated(path, corners[first], inverse.reshape(-1, 3).astype(np.int32))
+
+
+def _validated(
+    path: Path, vertices: npt.NDArray[np.float32], faces: npt.NDArray[np.int32]
+) -> Mesh:
+    if len(faces) == 0:
+        raise ValueError(f'Model {path} contains no faces')
+    if faces.min() < 0 or faces.max() >= len(vertices):
+        raise ValueError(f'Model {path} references missing vertices')
+    return Mesh(vertices.reshape(-1, 3), faces)
+
+
+LOADERS = {'.obj': load_obj, '.stl': load_stl}
+
+
+def load_model(path: Path, max_faces: int, cache_dir: Path = MODEL_CACHE_DIR) -> Mesh:
+    '''
+    Zwraca model gotowy do wyświetlenia. Tablice z pamięci podręcznej są mapowane
+    do pamięci tylko do odczytu. Błąd zapisu pamięci podręcznej nie przerywa wczytywania.
+    '''
+    suffix = path.suffix.lower()
+    if suffix not in MODEL_SUFFIXES:
+        raise ValueError(f'Unsupported model format: {path}')
+    stat = path.stat()
+    # Skrót ścieżki (z rozszerzeniem) rozróżnia pliki o tej samej nazwie w różnych katalogach
+    digest = hashlib.sha256(str(path.resolve()).encode('utf-8')).hexdigest()[:16]
+    prefix = f'{path.stem}-{digest}_'
+    key = f'{prefix}{stat.st_mtime_ns}_{stat.st_size}_{max_faces}'
+    vertices_path = cache_dir / f'{key}.vertices.npy'
+    faces_path = cache_dir / f'{key}.faces.npy'
+    if vertices_path.exists() and faces_path.exists():
+        try:
+            return Mesh(np.load(vertices_path, mmap_mode='r'), np.load(faces_path, mmap_mode='r'))
+        except (OSError, ValueError) as exc:
+            logging.debug("Ignoring unreadable cached model %s: %s", key, exc)
+
+    source = LOADERS[suffix](path)
+    mesh = decimate(normalized(source), max_faces)
+    logging.info(
+        "Loaded model %s: %s faces (%s after simplification).",
+        path,
+        len(source.faces),
+        len(mesh.faces),
+    )
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for stale in cache_dir.iterdir():
+            if stale.name.startswith(prefix) and stale.suffix == '.npy':
+                stale.unlink()
+        for target, array in ((vertices_path, mesh.vertices), (faces_path, mesh.faces)):
+            # Zapis przez plik tymczasowy - przerwany zapis nie zostawi uszkodzonego wpisu
+            temporary = target.with_suffix('.tmp')
+            with temporary.open('wb') as cache_file:
+                np.save(cache_file, array)
+            temporary.replace(target)
+    except OSError as exc:
+        logging.debug("Could not cache model %s: %s", key, exc)
+    return mesh
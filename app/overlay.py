@@ -0,0 +1,56 @@
+# app/overlay.py
+'''
+Moduł rysujący nakładkę z punktami dłoni bezpośrednio na klatce obrazu.
+Działa na tablicach (N, 21, 3), więc nie wymaga obiektów protobuf z MediaPipe.
+'''
+from typing import Final
+
+import cv2
+import numpy as np
+import numpy.typing as npt
+
+# Połączenia między punktami dłoni (jak mediapipe.solutions.hands.HAND_CONNECTIONS)
+HAND_CONNECTIONS: Final[npt.NDArray[np.intp]] = np.array(
+    [
+        (0, 1), (1, 2), (2, 3), (3, 4),
+        (0, 5), (5, 6), (6, 7), (7, 8),
+        (5, 9), (9, 10), (10, 11), (11, 12),
+        (9, 13), (13, 14), (14, 15), (15, 16),
+        (13, 17), (0, 17), (17, 18), (18, 19), (19, 20),
+    ],
+    dtype=np.intp,
+)
+
+# Kolory w kolejności RGB (potok pracuje na klatkach RGB), zgodne ze stylem mediapipe
+CONNECTION_COLOR: Final[tuple[int, int, int]] = (224, 224, 224)
+LANDMARK_COLOR: Final[tuple[int, int, int]] = (255, 0, 0)
+BORDER_COLOR: Final[tuple[int, int, int]] = (224, 224, 224)
+THICKNESS: Final[int] = 2
+CIRCLE_RADIUS: Final[int] = 2
+
+
+def draw_hand_landmarks(
+    image: npt.NDArray[np.uint8], landmarks: npt.NDArray[np.floating]
+) -> None:
+    '''
+    Rysuje połączenia i punkty wszystkich dłoni (N, 21, 3) na obrazie (w miejscu).
+    Współrzędne punktów są znormalizowane do zakresu [0, 1].
+    '''
+    if len(landmarks) == 0:
+        return
+    height, width = image.shape[:2]
+    points = landmarks[..., :2]
+    # Punkty poza kadrem pomijamy, tak jak robi to mediapipe drawing_utils
+    visible: npt.NDArray[np.bool_] = np.all((points >= 0.0) & (points <= 1.0), axis=-1)
+    scale = np.array([width - 1, height - 1], dtype=np.float32)
+    pixels: npt.NDArray[np.int32] = np.rint(points * scale).astype(np.int32)
+
+    # Wszystkie widoczne odcinki wszystkich dłoni jednym wywołaniem OpenCV
+    segments = pixels[:, HAND_CONNECTIONS][visible[:, HAND_CONNECTIONS].all(axis=-1)]
+    if len(segments):
+        cv2.polylines(image, list(segments), False, CONNECTION_COLOR, THICKNESS)
+
+    border_radius = max(CIRCLE_RADIUS + 1, int(CIRCLE_RADIUS * 1.2))
+    for x, y in pixels[visible].tolist():
+        cv2.circle(image, (x, y), border_radius, BORDER_COLOR, THICKNESS)
+        cv2.circle(image, (x, y), CIRCLE_RADIUS, LANDMARK_COLOR, THICKNESS)
@@ -0,0 +1,89 @@
+# app/preview.py
+'''
+Moduł wyświetlający podgląd kamery w etykiecie Tk.
+
+Dla danego rozmiaru widżetu istnieje jeden PhotoImage, aktualizowany w miejscu metodą
+`paste` - bez tworzenia nowych obrazów Tk dla każdej klatki. Klatka jest skalowana
+przez cv2.resize do bufora o rozmiarze etykiety (z zachowaniem proporcji), a rozmiar
+jest przeliczany tylko przy zdarzeniu <Configure>.
+'''
+import math
+import time
+import tkinter as tk
+from tkinter import ttk
+
+import numpy as np
+import numpy.typing as npt
+from PIL import Image, ImageTk
+
+Frame = npt.NDArray[np.uint8]
+
+# Etykieta mniejsza niż to (np. przed pierwszym ułożeniem okna) nie wyznacza rozmiaru podglądu
+MIN_PREVIEW_SIZE = 16
+
+
+def fit_size(frame_size: tuple[int, int], available: tuple[int, int]) -> tuple[int, int]:
+    '''Największy rozmiar (szer., wys.) o proporcjach klatki mieszczący się w `available`.'''
+    frame_width, frame_height = frame_size
+    width, height = available
+    scale = min(width / frame_width, height / frame_height)
+    return max(1, round(frame_width * scale)), max(1, round(frame_height * scale))
+
+
+class VideoPreview:
+    '''Podgląd klatek RGB w etykiecie; `max_fps` > 0 ogranicza częstotliwość odświeżania.'''
+
+    def __init__(self, label: ttk.Label, max_fps: float = 0.0) -> None:
+        self.label = label
+        # Obraz wypełnia etykietę bez marginesów - inaczej każde ułożenie powiększałoby podgląd
+        label.configure(padding=0, borderwidth=0, anchor='center')
+        self.min_interval = 1.0 / max_fps if max_fps > 0 else 0.0
+        self._available: tuple[int, int] | None = None
+        self._last_shown = -math.inf
+        self._buffer: Frame | None = None
+        self._photo: ImageTk.PhotoImage | None = None
+        label.bind('<Configure>', self._on_configure)
+
+    def _on_configure(self, event: 'tk.Event[ttk.Label]') -> None:
+        if event.width >= MIN_PREVIEW_SIZE and event.height >= MIN_PREVIEW_SIZE:
+            self._available = (event.width, event.height)
+
+    def prepare(self, frame: Frame, now: float | None = None) -> Frame | None:
+        '''
+        Zwraca klatkę przeskalowaną do rozmiaru etykiety (bufor współdzielony między
+        wywołaniami) albo None, jeśli odświeżenie należy pominąć z powodu limitu.
+        '''
+        now = time.perf_counter() if now is None else now
+        if now - self._last_shown < self.min_interval:
+            return None
+        self._last_shown = now
+
+        height, width = frame.shape[:2]
+        if self._available is None:
+            return frame
+        size = fit_size((width, height), self._available)
+        if size == (width, height):
+            return frame
+        target_width, target_height = size
+        if self._buffer is None or self._buffer.shape[:2] != (target_height, target_width):
+            self._buffer = np.empty((target_height, target_width, 3), dtype=np.uint8)
+        # Import dopiero przy pierwszym skalowaniu - klatki przychodzą z kamery, która i tak
+        # ładuje cv2 w tle, więc moduł podglądu nie spowalnia budowania okna
+        import cv2
+
+        # INTER_AREA przy pomniejszaniu unika aliasingu; przy powiększaniu wystarcza liniowa
+        interpolation = cv2.INTER_AREA if target_width < width else cv2.INTER_LINEAR
+        cv2.resize(frame, size, dst=self._buffer, interpolation=interpolation)
+        return self._buffer
+
+    def show(self, frame: Frame) -> bool:
+        '''Wyświetla klatkę; zwraca False, jeśli odświeżenie zostało pominięte.'''
+        image = self.prepare(frame)
+        if image is None:
+            return False
+        height, width = image.shape[:2]
+        if self._photo is None or (self._photo.width(), self._photo.height()) != (width, height):
+            self._photo = ImageTk.PhotoImage('RGB', (width, height))
+            self.label.configure(image=self._photo, text='')
+        self._photo.paste(Image.fromarray(image))
+        return True
@@ -0,0 +1,99 @@
+# app/reconnect.py
+'''
+Moduł ponownego łączenia ze źródłem klatek w tle.
+
+Otwarcie cv2.VideoCapture potrafi blokować na setki milisekund, więc próby odbywają się
+w osobnym wątku z wykładniczo rosnącym opóźnieniem i losowym rozrzutem. Wątek UI jedynie
+odbiera gotowe, otwarte źródło metodą `take_source`.
+'''
+import logging
+import random
+import threading
+from collections.abc import Callable
+from typing import Final
+
+from app.config import CameraConfig
+from app.frame_sources import FrameSource
+from app.state import CameraStatus
+
+STOP_TIMEOUT_S: Final[float] = 1.0
+
+OpenSource = Callable[[], FrameSource | None]
+
+
+def backoff_delay(attempt: int, config: CameraConfig, rng: random.Random) -> float:
+    '''Opóźnienie (s) przed próbą numer `attempt` (od 0), z rozrzutem +/- jitter.'''
+    delay = min(
+        config.reconnect_max_delay_s,
+        config.reconnect_initial_delay_s * config.reconnect_backoff**attempt,
+    )
+    return delay * (1.0 + rng.uniform(-config.reconnect_jitter, config.reconnect_jitter))
+
+
+class ReconnectSupervisor:
+    '''
+    Wątek próbujący otworzyć źródło funkcją `open_source` aż do skutku.
+    Stan: RECONNECTING, FAILED (po `reconnect_max_attempts` porażkach) lub AVAILABLE.
+    '''
+
+    def __init__(
+        self, open_source: OpenSource, config: CameraConfig, rng: random.Random | None = None
+    ) -> None:
+        self._open_source = open_source
+        self.config = config
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._source: FrameSource | None = None
+        self._status = CameraStatus.RECONNECTING
+        self.attempts = 0
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='CameraReconnect', daemon=True)
+
+    @property
+    def status(self) -> CameraStatus:
+        return self._status
+
+    def start(self) -> None:
+        logging.info("Camera unavailable, reconnecting in background.")
+        self._thread.start()
+
+    def take_source(self) -> FrameSource | None:
+        '''Zwraca (jednokrotnie) otwarte źródło lub None, jeśli jeszcze go nie ma.'''
+        with self._lock:
+            source, self._source = self._source, None
+        return source
+
+    def stop(self) -> None:
+        '''Kończy próby i zwalnia źródło, którego nikt nie odebrał.'''
+        with self._lock:
+            self._stop_event.set()
+            source, self._source = self._source, None
+        if source is not None:
+            source.release()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(STOP_TIMEOUT_S)
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(backoff_delay(self.attempts, self.config, self._rng)):
+            source = self._open_source()
+            if source is not None:
+                with self._lock:
+                    if not self._stop_event.is_set():
+                        self._source = source
+                        self._status = CameraStatus.AVAILABLE
+                        logging.info("Camera reconnected after %s attempt(s).", self.attempts + 1)
+                        return
+                source.release()
+                return
+
+            self.attempts += 1
+            if (
+                self.attempts >= self.config.reconnect_max_attempts
+                and self._status is not CameraStatus.FAILED
+            ):
+                self._status = CameraStatus.FAILED
+                logging.error(
+                    "Camera still unavailable after %s attempts, retrying every %.1f s.",
+                    self.attempts,
+                    self.config.reconnect_max_delay_s,
+                )
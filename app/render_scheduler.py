@@ -0,0 +1,50 @@
+# app/render_scheduler.py
+'''
+Moduł decydujący, czy scena 3D wymaga przerysowania.
+
+Zapamiętuje stan sceny z ostatnio narysowanej klatki (kąty, kształt, kolor) i zgłasza
+potrzebę rysowania tylko wtedy, gdy któryś z nich się zmienił - kąty o więcej niż epsilon.
+Bezczynna aplikacja nie zużywa więc czasu procesora na rysowanie identycznego obrazu.
+'''
+from typing import NamedTuple
+
+from app.config import ANIMATION_CONFIG
+from app.state import AppState
+
+
+class SceneSnapshot(NamedTuple):
+    angle_x: float
+    angle_y: float
+    shape_index: int
+    color_index: int
+
+    @classmethod
+    def of(cls, state: AppState) -> 'SceneSnapshot':
+        return cls(state.angle_x, state.angle_y, state.shape_index, state.color_index)
+
+
+class RenderScheduler:
+    '''Śledzi, czy stan sceny zmienił się od ostatniego rysowania.'''
+
+    def __init__(self, angle_epsilon: float = ANIMATION_CONFIG.redraw_angle_epsilon) -> None:
+        self.angle_epsilon = angle_epsilon
+        self._drawn: SceneSnapshot | None = None
+        self.rendered_frames = 0
+        self.skipped_frames = 0
+
+    def needs_redraw(self, state: AppState) -> bool:
+        drawn = self._drawn
+        dirty = (
+            drawn is None
+            or state.shape_index != drawn.shape_index
+            or state.color_index != drawn.color_index
+            or abs(state.angle_x - drawn.angle_x) > self.angle_epsilon
+            or abs(state.angle_y - drawn.angle_y) > self.angle_epsilon
+        )
+        if not dirty:
+            self.skipped_frames += 1
+        return dirty
+
+    def mark_drawn(self, state: AppState) -> None:
+        self._drawn = SceneSnapshot.of(state)
+        self.rendered_frames += 1
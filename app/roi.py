@@ -0,0 +1,99 @@
+# app/roi.py
+'''
+Moduł wyznaczający obszar zainteresowania (ROI) wokół ostatnio wykrytej dłoni.
+Detekcja na przyciętym i pomniejszonym fragmencie klatki jest tańsza niż na całym obrazie.
+'''
+from typing import Final, NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+# ROI zajmujące większość kadru nie daje oszczędności - wtedy używamy całej klatki
+MAX_ROI_AREA_RATIO: Final[float] = 0.6
+
+
+class RegionOfInterest(NamedTuple):
+    '''Prostokąt w pikselach: [x0, x1) x [y0, y1).'''
+    x0: int
+    y0: int
+    x1: int
+    y1: int
+
+    @property
+    def width(self) -> int:
+        return self.x1 - self.x0
+
+    @property
+    def height(self) -> int:
+        return self.y1 - self.y0
+
+
+def compute_roi(
+    landmarks: npt.NDArray[np.floating], frame_shape: tuple[int, ...], padding: float
+) -> RegionOfInterest | None:
+    '''
+    Wyznacza ROI obejmujące wszystkie dłonie (K, 21, 3) z marginesem `padding`
+    (ułamek rozmiaru ramki dodawany z każdej strony). Zwraca None, gdy ROI
+    obejmowałoby większość kadru lub nie ma dłoni.
+    '''
+    if len(landmarks) == 0:
+        return None
+    height, width = frame_shape[:2]
+    points = landmarks[..., :2].reshape(-1, 2)
+    low = points.min(axis=0)
+    high = points.max(axis=0)
+    # Kwadratowy obszar - dłoń zmienia orientację, więc nie ufamy proporcjom ramki
+    size = float(np.max((high - low) * (width, height))) * (1.0 + 2.0 * padding)
+    center = (low + high) / 2.0 * (width, height)
+
+    x0 = max(0, int(center[0] - size / 2.0))
+    y0 = max(0, int(center[1] - size / 2.0))
+    x1 = min(width, int(np.ceil(center[0] + size / 2.0)))
+    y1 = min(height, int(np.ceil(center[1] + size / 2.0)))
+    if x1 <= x0 or y1 <= y0:
+        return None
+    if (x1 - x0) * (y1 - y0) > MAX_ROI_AREA_RATIO * width * height:
+        return None
+    return RegionOfInterest(x0, y0, x1, y1)
+
+
+def remap_landmarks(
+    landmarks: npt.NDArray[np.floating], roi: RegionOfInterest, frame_shape: tuple[int, ...]
+) -> None:
+    '''
+    Przelicza (w miejscu) punkty znormalizowane względem ROI na współrzędne
+    znormalizowane względem całej klatki.
+    '''
+    height, width = frame_shape[:2]
+    landmarks[..., 0] = (roi.x0 + landmarks[..., 0] * roi.width) / width
+    landmarks[..., 1] = (roi.y0 + landmarks[..., 1] * roi.height) / height
+    # Głębokość w MediaPipe jest w skali szerokości obrazu wejściowego
+    landmarks[..., 2] *= roi.width / width
+
+
+class RoiTracker:
+    '''
+    Pamięta ROI z poprzedniej klatki. Co `full_frame_interval` klatek wymusza detekcję
+    na całym obrazie, aby zauważyć dłonie pojawiające się poza ROI.
+    '''
+
+    def __init__(self, padding: float, full_frame_interval: int) -> None:
+        self.padding = padding
+        self.full_frame_interval = full_frame_interval
+        self.region: RegionOfInterest | None = None
+        self._frames_in_roi = 0
+
+    def next_region(self) -> RegionOfInterest | None:
+        '''Zwraca ROI dla bieżącej klatki lub None, jeśli należy użyć całej klatki.'''
+        if self.region is None or self._frames_in_roi >= self.full_frame_interval:
+            self._frames_in_roi = 0
+            return None
+        self._frames_in_roi += 1
+        return self.region
+
+    def update(self, landmarks: npt.NDArray[np.floating], frame_shape: tuple[int, ...]) -> None:
+        self.region = compute_roi(landmarks, frame_shape, self.padding)
+
+    def reset(self) -> None:
+        self.region = None
+        self._frames_in_roi = 0
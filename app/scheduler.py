@@ -0,0 +1,76 @@
+# app/scheduler.py
+'''
+Moduł harmonogramu wieloczęstotliwościowego dla pętli interfejsu.
+
+Każdy etap (kamera, animacja, rysowanie) ma własną docelową częstotliwość. Harmonogram
+uruchamia tylko etapy, których termin minął, i zwraca czas do najbliższego terminu,
+więc pętla Tk budzi się dokładnie wtedy, gdy jest coś do zrobienia. Spóźnione wywołania
+są łączone: etap opóźniony o kilka okresów wykonuje się raz, a nie seriami.
+'''
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from app.capture import RateMeter
+
+# Callback dostaje czas (s), jaki upłynął od jego poprzedniego wykonania
+StageCallback = Callable[[float], None]
+
+
+@dataclass
+class Stage:
+    name: str
+    period: float
+    callback: StageCallback
+    next_due: float = 0.0
+    last_run: float | None = None
+    coalesced_ticks: int = 0
+    meter: RateMeter = field(default_factory=RateMeter)
+
+
+class MultiRateScheduler:
+    '''Uruchamia etapy z ich własną częstotliwością w jednym wątku (pętli Tk).'''
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self.stages: dict[str, Stage] = {}
+
+    def add_stage(self, name: str, rate_hz: float, callback: StageCallback) -> None:
+        if rate_hz <= 0:
+            raise ValueError(f'Stage rate must be positive: {name}={rate_hz}')
+        self.stages[name] = Stage(name, 1.0 / rate_hz, callback, next_due=self._clock())
+
+    def run_due(self) -> float:
+        '''Wykonuje etapy, których termin minął; zwraca sekundy do najbliższego terminu.'''
+        for stage in self.stages.values():
+            now = self._clock()
+            if now < stage.next_due:
+                continue
+            elapsed = stage.period if stage.last_run is None else now - stage.last_run
+            stage.last_run = now
+            stage.meter.tick(now)
+            stage.callback(elapsed)
+
+            stage.next_due += stage.period
+            if stage.next_due <= now:
+                # Spóźnienie o cały okres lub więcej - pomijamy zaległe wywołania
+                missed = int((now - stage.next_due) / stage.period) + 1
+                stage.coalesced_ticks += missed
+                stage.next_due += missed * stage.period
+
+        now = self._clock()
+        return max(0.0, min(stage.next_due for stage in self.stages.values()) - now)
+
+    def rates(self) -> dict[str, float]:
+        '''Osiągnięta częstotliwość (Hz) każdego etapu.'''
+        return {name: stage.meter.rate for name, stage in self.stages.items()}
+
+    def log_rates(self) -> None:
+        logging.debug(
+            "Stage rates: %s",
+            ', '.join(
+                f'{name}={rate:.1f} Hz ({self.stages[name].coalesced_ticks} coalesced)'
+                for name, rate in self.rates().items()
+            ),
+        )
@@ -0,0 +1,370 @@
+# app/session_log.py
+'''
+Zapis sesji (punkty dłoni i gesty z kolejnych klatek) do pliku binarnego oraz jej
+odtwarzanie przez GestureRecognizer i GestureStabilizer.
+
+Plik zaczyna się nagłówkiem: MAGIC, długość nagłówka (uint32) i metadane JSON (wersja,
+rozmiar rekordu, nazwy gestów w kolejności kodów), dopełnione do wielokrotności 64 bajtów.
+Dalej są wyłącznie dopisywane rekordy stałego rozmiaru (RECORD_DTYPE), więc plik mapuje
+się do pamięci jako tablica numpy, a położenie rekordu wynika z jego numeru. Znaczniki
+czasu to sekundy od epoki Unix (zegar monotoniczny zakotwiczony w czasie systemowym przy
+otwarciu pliku) i nie maleją także między dopisanymi sesjami, dlatego wycinek czasu
+wyszukuje się binarnie, czytając tylko kilka stron pliku - wielogodzinna sesja nie jest
+wczytywana w całości. Niepełny rekord na końcu
+(przerwany zapis) jest pomijany przy odczycie i obcinany przed dopisywaniem.
+
+Odtwarzanie pozwala sprawdzić zmianę progów z CameraConfig lub AnimationConfig
+na nagraniach z prawdziwych sesji w kilka sekund:
+
+    python main.py --record-session sesja.kcks
+    python -m app.session_log sesja.kcks --finger-straight 150 --enter-votes 2
+'''
+import argparse
+import dataclasses
+import json
+import logging
+import time
+from collections import Counter
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from types import TracebackType
+from typing import Any, BinaryIO, Final, NamedTuple, Self
+
+import numpy as np
+import numpy.typing as npt
+
+from app.config import ANIMATION_CONFIG, CAMERA_CONFIG, AnimationConfig, CameraConfig
+from app.gesture_recognizer import GESTURE_CODES, GESTURES, NUM_LANDMARKS, GestureRecognizer
+from app.gesture_stabilizer import GestureStabilizer
+from app.state import Gesture
+
+MAGIC: Final[bytes] = b'KCKSESS\x00'
+FORMAT_VERSION: Final[int] = 1
+HEADER_ALIGNMENT: Final[int] = 64
+# Kod zapisywany, gdy nie ma stabilnego gestu lub zdarzenia
+NO_GESTURE: Final[int] = -1
+
+RECORD_DTYPE: Final[np.dtype] = np.dtype([
+    ('timestamp', '<f8'),
+    ('raw_gesture', 'i1'),
+    ('stable_gesture', 'i1'),
+    ('event', 'i1'),
+    ('has_hand', 'u1'),
+    ('landmarks', '<f4', (NUM_LANDMARKS, 3)),
+])
+
+# Rekordy buforowane przed zapisem (ok. 2 s przy 30 Hz) i przetwarzane naraz przy odtwarzaniu
+RECORD_BATCH: Final[int] = 64
+REPLAY_CHUNK: Final[int] = 16384
+
+
+def _gesture_code(gesture: Gesture | None) -> int:
+    return NO_GESTURE if gesture is None else GESTURE_CODES[gesture]
+
+
+def _encode_header() -> bytes:
+    metadata = {
+        'version': FORMAT_VERSION,
+        'record_size': RECORD_DTYPE.itemsize,
+        'gestures': [gesture.name for gesture in GESTURES],
+        'created': datetime.now(UTC).isoformat(timespec='seconds'),
+    }
+    body = json.dumps(metadata).encode('utf-8')
+    length = len(MAGIC) + 4 + len(body)
+    length += -length % HEADER_ALIGNMENT
+    return MAGIC + length.to_bytes(4, 'little') + body.ljust(length - len(MAGIC) - 4)
+
+
+def _read_header(file: BinaryIO) -> tuple[int, dict[str, Any]]:
+    '''Zwraca długość nagłówka i metadane; niepoprawny plik kończy się ValueError.'''
+    prefix = file.read(len(MAGIC) + 4)
+    if len(prefix) < len(MAGIC) + 4 or not prefix.startswith(MAGIC):
+        raise ValueError(f'Not a session log: {file.name}')
+    length = int.from_bytes(prefix[len(MAGIC):], 'little')
+    metadata = json.loads(file.read(length - len(prefix)).decode('utf-8'))
+    if metadata.get('version') != FORMAT_VERSION:
+        raise ValueError(f'Unsupported session log version: {metadata.get("version")!r}')
+    if metadata.get('record_size') != RECORD_DTYPE.itemsize:
+        raise ValueError(f'Unexpected record size in session log: {metadata.get("record_size")}')
+    return length, metadata
+
+
+class SessionRecorder:
+    '''
+    Dopisuje rekordy klatek do pliku sesji. Istniejący plik jest kontynuowany,
+    o ile zapisano go z tym samym zestawem gestów.
+
+    `record` przyjmuje znaczniki zegara `clock` (tego samego co w AppController), które
+    są przeliczane na czas od epoki. Gdyby wypadły przed ostatnim rekordem w pliku
+    (np. po cofnięciu zegara systemowego), są przesuwane tak, aby nie malały.
+    '''
+
+    def __init__(
+        self,
+        path: Path,
+        batch: int = RECORD_BATCH,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.path = path
+        self._buffer = np.zeros(batch, dtype=RECORD_DTYPE)
+        self._pending = 0
+        self._epoch_offset = time.time() - clock()
+        self._last_timestamp = -np.inf
+        self._file = path.open('a+b')
+        try:
+            self._prepare_file()
+        except Exception:
+            self._file.close()
+            raise
+
+    def _prepare_file(self) -> None:
+        size = self._file.seek(0, 2)
+        if size == 0:
+            self._file.write(_encode_header())
+            return
+        self._file.seek(0)
+        header_length, metadata = _read_header(self._file)
+        if metadata['gestures'] != [gesture.name for gesture in GESTURES]:
+            raise ValueError(f'Session log {self.path} was recorded with different gestures')
+        records = (size - header_length) // RECORD_DTYPE.itemsize
+        whole = header_length + records * RECORD_DTYPE.itemsize
+        if whole != size:
+            logging.warning("Dropping a partial record at the end of %s.", self.path)
+            self._file.truncate(whole)
+        if records:
+            self._file.seek(whole - RECORD_DTYPE.itemsize)
+            self._last_timestamp = float(np.frombuffer(self._file.read(8), dtype='<f8')[0])
+
+    def record(
+        self,
+        timestamp: float,
+        raw_gesture: Gesture,
+        stable_gesture: Gesture | None,
+        event: Gesture | None,
+        landmarks: npt.NDArray[np.float32] | None,
+    ) -> None:
+        timestamp += self._epoch_offset
+        if timestamp < self._last_timestamp:
+            logging.warning(
+                "Session clock is %.3f s behind the last record in %s; shifting timestamps.",
+                self._last_timestamp - timestamp,
+                self.path,
+            )
+            self._epoch_offset += self._last_timestamp - timestamp
+            timestamp = self._last_timestamp
+        self._last_timestamp = timestamp
+        row = self._buffer[self._pending]
+        row['timestamp'] = timestamp
+        row['raw_gesture'] = GESTURE_CODES[raw_gesture]
+        row['stable_gesture'] = _gesture_code(stable_gesture)
+        row['event'] = _gesture_code(event)
+        row['has_hand'] = landmarks is not None
+        if landmarks is not None:
+            row['landmarks'] = landmarks
+        else:
+            row['landmarks'] = 0.0
+        self._pending += 1
+        if self._pending == len(self._buffer):
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            self._file.write(self._buffer[:self._pending].tobytes())
+            self._pending = 0
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+        logging.info("Session recorded to %s.", self.path)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class SessionLog:
+    '''Plik sesji zmapowany do pamięci; `records` to tablica rekordów RECORD_DTYPE.'''
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with path.open('rb') as file:
+            header_length, self.metadata = _read_header(file)
+            size = file.seek(0, 2)
+        count = (size - header_length) // RECORD_DTYPE.itemsize
+        self.records: npt.NDArray[np.void] = (
+            np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=header_length, shape=(count,))
+            if count
+            else np.zeros(0, dtype=RECORD_DTYPE)
+        )
+        # Kody z pliku -> kody bieżącego GESTURES; indeks przesunięty o 1 dla NO_GESTURE
+        try:
+            codes = [GESTURE_CODES[Gesture[name]] for name in self.metadata['gestures']]
+        except KeyError as exc:
+            raise ValueError(f'Unknown gesture in session log {path}: {exc}') from None
+        self._code_table = np.array([NO_GESTURE, *codes], dtype=np.int8)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def duration_s(self) -> float:
+        if len(self.records) == 0:
+            return 0.0
+        timestamps = self.records['timestamp']
+        return float(timestamps[-1] - timestamps[0])
+
+    def between(
+        self, start_s: float | None = None, end_s: float | None = None
+    ) -> npt.NDArray[np.void]:
+        '''
+        Rekordy z przedziału [start_s, end_s) liczonego od pierwszej klatki sesji
+        - widok na mapowany plik, bez kopiowania.
+        '''
+        if len(self.records) == 0:
+            return self.records
+        timestamps = self.records['timestamp']
+        origin = float(timestamps[0])
+        first = 0 if start_s is None else int(np.searchsorted(timestamps, origin + start_s))
+        last = (
+            len(timestamps) if end_s is None else int(np.searchsorted(timestamps, origin + end_s))
+        )
+        return self.records[first:last]
+
+    def gesture_codes(self, codes: npt.NDArray[np.int8]) -> npt.NDArray[np.int8]:
+        '''Przelicza kody gestów z pliku na indeksy w bieżącym GESTURES (NO_GESTURE bez zmian).'''
+        return self._code_table[codes.astype(np.intp) + 1]
+
+
+class ReplayResult(NamedTuple):
+    # Kody gestów (indeksy w GESTURES, NO_GESTURE gdy brak) dla każdej odtworzonej klatki
+    raw_gestures: npt.NDArray[np.int8]
+    stable_gestures: npt.NDArray[np.int8]
+    events: npt.NDArray[np.int8]
+    elapsed_s: float
+
+
+def replay(
+    log: SessionLog,
+    records: npt.NDArray[np.void] | None = None,
+    camera_config: CameraConfig = CAMERA_CONFIG,
+    animation_config: AnimationConfig = ANIMATION_CONFIG,
+    chunk_size: int = REPLAY_CHUNK,
+) -> ReplayResult:
+    '''
+    Odtwarza rekordy (domyślnie całą sesję) tak szybko, jak pozwala procesor: gesty są
+    rozpoznawane wsadowo dla całych porcji pliku, a stabilizator dostaje je klatka po
+    klatce z zapisanymi znacznikami czasu. Klatki bez dłoni zachowują zapisany gest.
+    '''
+    records = log.records if records is None else records
+    recognizer = GestureRecognizer(camera_config)
+    stabilizer = GestureStabilizer(animation_config)
+    raw = np.empty(len(records), dtype=np.int8)
+    stable = np.empty(len(records), dtype=np.int8)
+    events = np.empty(len(records), dtype=np.int8)
+
+    started = time.perf_counter()
+    for first in range(0, len(records), chunk_size):
+        chunk = records[first:first + chunk_size]
+        has_hand = chunk['has_hand'].astype(bool)
+        landmarks = np.ascontiguousarray(chunk['landmarks'])
+        codes = log.gesture_codes(chunk['raw_gesture'])
+        if has_hand.any():
+            codes[has_hand] = recognizer.recognize_batch(landmarks[has_hand])
+        raw[first:first + len(chunk)] = codes
+
+        for i, (code, timestamp, hand) in enumerate(
+            zip(codes.tolist(), chunk['timestamp'].tolist(), has_hand.tolist(), strict=True)
+        ):
+            event = stabilizer.update(GESTURES[code], landmarks[i] if hand else None, timestamp)
+            stable[first + i] = _gesture_code(stabilizer.stable_gesture)
+            events[first + i] = _gesture_code(event)
+    return ReplayResult(raw, stable, events, time.perf_counter() - started)
+
+
+def _event_counts(codes: npt.NDArray[np.int8]) -> Counter[Gesture]:
+    return Counter(GESTURES[code] for code in codes[codes != NO_GESTURE].tolist())
+
+
+def format_comparison(log: SessionLog, records: npt.NDArray[np.void], result: ReplayResult) -> str:
+    '''Raport różnic między zapisaną sesją a jej odtworzeniem.'''
+    frames = len(records)
+    duration_s = float(records['timestamp'][-1] - records['timestamp'][0]) if frames else 0.0
+    raw_changed = int(
+        np.count_nonzero(log.gesture_codes(records['raw_gesture']) != result.raw_gestures)
+    )
+    stable_changed = int(
+        np.count_nonzero(log.gesture_codes(records['stable_gesture']) != result.stable_gestures)
+    )
+    recorded_events = _event_counts(log.gesture_codes(records['event']))
+    replayed_events = _event_counts(result.events)
+    speedup = duration_s / result.elapsed_s if result.elapsed_s > 0 else float('inf')
+    lines = [
+        f'Klatki: {frames}, czas sesji: {duration_s:.1f} s, '
+        f'odtworzenie: {result.elapsed_s:.2f} s ({speedup:.0f}x)',
+        f'Zmienione gesty surowe: {raw_changed} ({raw_changed / max(frames, 1):.1%})',
+        f'Zmienione gesty stabilne: {stable_changed} ({stable_changed / max(frames, 1):.1%})',
+        f'{"zdarzenie":<12} {"zapis":>6} {"odtw.":>6}',
+    ]
+    lines.extend(
+        f'{gesture.value:<12} {recorded_events[gesture]:>6} {replayed_events[gesture]:>6}'
+        for gesture in GESTURES
+        if recorded_events[gesture] or replayed_events[gesture]
+    )
+    return '\n'.join(lines)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Odtwarzanie zapisanej sesji gestów')
+    parser.add_argument('path', type=Path, help='plik sesji zapisany opcją --record-session')
+    parser.add_argument('--start', type=float, default=None, help='początek wycinka [s]')
+    parser.add_argument('--end', type=float, default=None, help='koniec wycinka [s]')
+    parser.add_argument(
+        '--finger-straight', type=float, default=CAMERA_CONFIG.finger_straight_angle_threshold
+    )
+    parser.add_argument(
+        '--finger-bent', type=float, default=CAMERA_CONFIG.finger_bent_angle_threshold
+    )
+    parser.add_argument(
+        '--thumb-straight', type=float, default=CAMERA_CONFIG.thumb_straight_angle_threshold
+    )
+    parser.add_argument(
+        '--history-length', type=int, default=ANIMATION_CONFIG.gesture_history_length
+    )
+    parser.add_argument('--enter-votes', type=int, default=ANIMATION_CONFIG.gesture_enter_votes)
+    parser.add_argument('--exit-votes', type=int, default=ANIMATION_CONFIG.gesture_exit_votes)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.WARNING)
+    args = parse_args()
+    session = SessionLog(args.path)
+    selected = session.between(args.start, args.end)
+    replayed = replay(
+        session,
+        selected,
+        dataclasses.replace(
+            CAMERA_CONFIG,
+            finger_straight_angle_threshold=args.finger_straight,
+            finger_bent_angle_threshold=args.finger_bent,
+            thumb_straight_angle_threshold=args.thumb_straight,
+        ),
+        dataclasses.replace(
+            ANIMATION_CONFIG,
+            gesture_history_length=args.history_length,
+            gesture_enter_votes=args.enter_votes,
+            gesture_exit_votes=args.exit_votes,
+        ),
+    )
+    print(format_comparison(session, selected, replayed))
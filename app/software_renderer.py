@@ -0,0 +1,108 @@
+# app/software_renderer.py
+'''
+Moduł programowego renderera sceny 3D - alternatywa dla widoku Matplotlib.
+
+Wierzchołki siatki są obracane i rzutowane perspektywicznie jednym mnożeniem macierzy,
+ściany odwrócone tyłem odrzucane, a pozostałe sortowane po głębokości (algorytm malarza)
+i wypełniane przez cv2.fillConvexPoly z płaskim cieniowaniem. Wynikiem jest obraz RGB
+w prealokowanym buforze, wyświetlany tą samą ścieżką co podgląd kamery.
+'''
+from typing import Final, NamedTuple
+
+import cv2
+import numpy as np
+import numpy.typing as npt
+from PIL import ImageColor
+
+from app.meshes import DEFAULT_STYLE, SHAPE_STYLES, Mesh, ShapeStyle, face_normals, get_mesh
+from app.state import AppState
+
+BACKGROUND_COLOR: Final[str] = '#f0f0f0'
+EDGE_COLOR: Final[tuple[int, int, int]] = (0, 0, 0)
+# Odległość kamery od środka sceny i skala rzutu (ułamek krótszego boku obrazu na jednostkę)
+CAMERA_DISTANCE: Final[float] = 3.0
+VIEW_SCALE: Final[float] = 0.3
+# Oświetlenie w układzie kamery: z lewej, z góry i od przodu
+LIGHT_DIRECTION: Final[npt.NDArray[np.float32]] = (
+    np.array([-0.4, 0.5, 0.77], dtype=np.float32) / np.linalg.norm([-0.4, 0.5, 0.77])
+).astype(np.float32)
+AMBIENT: Final[float] = 0.35
+DIFFUSE: Final[float] = 0.65
+# Współrzędne podpikselowe dla cv2 (4 bity części ułamkowej)
+SUBPIXEL_BITS: Final[int] = 4
+
+
+class _PreparedShape(NamedTuple):
+    mesh: Mesh
+    normals: npt.NDArray[np.float32]
+    style: ShapeStyle
+
+
+def view_rotation(elev: float, azim: float) -> npt.NDArray[np.float32]:
+    '''
+    Macierz (3, 3) przejścia do układu kamery (x w prawo, y w górę, z do obserwatora)
+    dla kątów w konwencji Axes3D.view_init.
+    '''
+    elev_rad, azim_rad = np.radians(elev), np.radians(azim)
+    sin_e, cos_e = np.sin(elev_rad), np.cos(elev_rad)
+    sin_a, cos_a = np.sin(azim_rad), np.cos(azim_rad)
+    return np.array(
+        [
+            [-sin_a, cos_a, 0.0],
+            [-sin_e * cos_a, -sin_e * sin_a, cos_e],
+            [cos_e * cos_a, cos_e * sin_a, sin_e],
+        ],
+        dtype=np.float32,
+    )
+
+
+class SoftwareView:
+    '''Rysuje bieżącą bryłę do bufora `image` (H, W, 3) RGB.'''
+
+    def __init__(self, width: int, height: int, background: str = BACKGROUND_COLOR) -> None:
+        self.image = np.empty((height, width, 3), dtype=np.uint8)
+        self._background = ImageColor.getrgb(background)[:3]
+        self._shapes: dict[str, _PreparedShape] = {}
+        self._center = np.array([width / 2.0, height / 2.0], dtype=np.float32)
+        self._scale = VIEW_SCALE * min(width, height)
+
+    def draw(self, state: AppState) -> None:
+        shape = self._prepare(state.get_current_shape())
+        rotation = view_rotation(state.angle_x, state.angle_y)
+        vertices = shape.mesh.vertices @ rotation.T
+        normals = shape.normals @ rotation.T
+        faces = shape.mesh.faces
+
+        # Odrzucenie ścian tyłem do kamery i sortowanie od najdalszej
+        centroids = vertices[faces].mean(axis=1)
+        to_camera = np.array([0.0, 0.0, CAMERA_DISTANCE], dtype=np.float32) - centroids
+        visible = np.flatnonzero(np.einsum('ij,ij->i', normals, to_camera) > 0)
+        visible = visible[np.argsort(centroids[visible, 2])]
+
+        perspective = CAMERA_DISTANCE / (CAMERA_DISTANCE - vertices[:, 2:3])
+        screen = vertices[:, :2] * perspective * (self._scale, -self._scale) + self._center
+        points = np.rint(screen * (1 << SUBPIXEL_BITS)).astype(np.int32)[faces]
+
+        intensity = AMBIENT + DIFFUSE * np.clip(normals[visible] @ LIGHT_DIRECTION, 0.0, None)
+        base = np.array(ImageColor.getrgb(state.get_current_color())[:3], dtype=np.float32)
+        colors = np.clip(intensity[:, np.newaxis] * base, 0, 255).astype(np.uint8).tolist()
+
+        self.image[...] = self._background
+        edges = shape.style.edgecolor != 'none'
+        thickness = max(1, round(shape.style.linewidth))
+        for face_points, color in zip(points[visible], colors, strict=True):
+            cv2.fillConvexPoly(self.image, face_points, color, cv2.LINE_AA, SUBPIXEL_BITS)
+            if edges:
+                cv2.polylines(
+                    self.image, [face_points], True, EDGE_COLOR, thickness, cv2.LINE_AA,
+                    SUBPIXEL_BITS,
+                )
+
+    def _prepare(self, shape_type: str) -> _PreparedShape:
+        shape = self._shapes.get(shape_type)
+        if shape is None:
+            mesh = get_mesh(shape_type)
+            style = SHAPE_STYLES.get(shape_type, DEFAULT_STYLE)
+            shape = _PreparedShape(mesh, face_normals(mesh).astype(np.float32), style)
+            self._shapes[shape_type] = shape
+        return shape
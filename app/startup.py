@@ -0,0 +1,58 @@
+# app/startup.py
+'''
+Moduł mierzący czas uruchamiania aplikacji.
+
+Kolejne etapy startu (pokazanie okna, zbudowanie UI, gotowość kamery, pierwsza klatka)
+są zapisywane jako znaczniki czasu względem początku procesu. Raport trafia do logu,
+a opcjonalnie jest dopisywany jako wiersz JSON do pliku, co pozwala porównywać
+czas zimnego startu między wydaniami.
+'''
+import json
+import logging
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Final
+
+MARK_WINDOW_SHOWN: Final[str] = 'window_shown'
+MARK_UI_READY: Final[str] = 'ui_ready'
+MARK_CAMERA_READY: Final[str] = 'camera_ready'
+MARK_FIRST_FRAME: Final[str] = 'first_frame'
+
+
+class StartupTimer:
+    '''Zbiera znaczniki czasu (w sekundach od `start`) dla etapów uruchamiania.'''
+
+    def __init__(self, start: float | None = None, report_path: Path | None = None) -> None:
+        self.start = time.perf_counter() if start is None else start
+        self.report_path = report_path
+        self.marks: dict[str, float] = {}
+        self._reported = False
+
+    def mark(self, name: str) -> None:
+        '''Zapisuje etap; ponowne wywołanie dla tego samego etapu jest ignorowane.'''
+        if name not in self.marks:
+            self.marks[name] = time.perf_counter() - self.start
+
+    def format_report(self) -> str:
+        return ', '.join(
+            f'{name}={elapsed * 1000.0:.0f} ms' for name, elapsed in self.marks.items()
+        )
+
+    def report(self) -> None:
+        '''Loguje raport (jednokrotnie) i dopisuje go do pliku, jeśli go podano.'''
+        if self._reported:
+            return
+        self._reported = True
+        logging.info("Startup timing: %s", self.format_report())
+        if self.report_path is None:
+            return
+        entry = {
+            'timestamp': datetime.now(UTC).isoformat(timespec='seconds'),
+            'marks_ms': {name: round(elapsed * 1000.0, 1) for name, elapsed in self.marks.items()},
+        }
+        try:
+            with self.report_path.open('a', encoding='utf-8') as report_file:
+                report_file.write(json.dumps(entry) + '\n')
+        except OSError as exc:
+            logging.warning("Could not write startup report to %s: %s", self.report_path, exc)
@@ -2,12 +2,14 @@
 '''
 Moduł definiujący stan aplikacji.
 Zawiera wszystkie dane, które mogą się zmieniać w trakcie działania programu.
+Zmiany widoczne w interfejsie (gest, kolor, kształt, stan kamery) są zbierane
+i ogłaszane subskrybentom w flush_changes - raz na klatkę interfejsu.
 '''
-from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
 
-from app.config import ANIMATION_CONFIG, OBJECT_CONFIG
+from app.config import OBJECT_CONFIG
 
 
 class Gesture(Enum):
@@ -20,6 +22,29 @@ class Gesture(Enum):
     NO_HAND = 'NO_HAND'
     NO_CAMERA = 'NO_CAMERA'
     ERROR = 'ERROR'
+    # Gesty dynamiczne wykrywane z ruchu dłoni (GestureStabilizer), nie z pojedynczej klatki
+    SWIPE_LEFT = 'SWIPE_LEFT'
+    SWIPE_RIGHT = 'SWIPE_RIGHT'
+    SWIPE_UP = 'SWIPE_UP'
+    SWIPE_DOWN = 'SWIPE_DOWN'
+
+
+class CameraStatus(Enum):
+    STARTING = 'STARTING'
+    AVAILABLE = 'AVAILABLE'
+    RECONNECTING = 'RECONNECTING'
+    FAILED = 'FAILED'
+    FINISHED = 'FINISHED'
+
+
+class StateChange(Enum):
+    GESTURE = 'GESTURE'
+    COLOR = 'COLOR'
+    SHAPE = 'SHAPE'
+    CAMERA_STATUS = 'CAMERA_STATUS'
+
+
+StateListener = Callable[['AppState'], None]
 
 
 @dataclass
@@ -39,19 +64,65 @@ class AppState:
     colors: tuple[str, ...] = OBJECT_CONFIG.colors
     color_names: tuple[str, ...] = OBJECT_CONFIG.color_names
 
-    # Stan gestów
-    gesture_history: deque[Gesture] = field(
-        default_factory=lambda: deque(maxlen=ANIMATION_CONFIG.gesture_history_length)
-    )
+    # Stan gestów (historia klatek jest w GestureStabilizer)
     current_stable_gesture: Gesture | None = None
     last_action_gesture: Gesture | None = None
 
+    # Stan kamery (inicjalizowanej w tle)
+    camera_status: CameraStatus = CameraStatus.STARTING
+
+    # Subskrypcje zmian i zmiany czekające na ogłoszenie
+    _listeners: dict[StateChange, list[StateListener]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _pending: set[StateChange] = field(default_factory=set, init=False, repr=False, compare=False)
+
+    def subscribe(self, change: StateChange, listener: StateListener) -> None:
+        '''Rejestruje funkcję wywoływaną (ze stanem) po zmianie danego rodzaju.'''
+        self._listeners.setdefault(change, []).append(listener)
+
+    def flush_changes(self) -> None:
+        '''
+        Ogłasza zmiany zebrane od poprzedniego wywołania. Każdy subskrybent jest
+        wywoływany najwyżej raz, nawet jeśli wartość zmieniła się kilka razy.
+        '''
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, set()
+        for change in StateChange:
+            if change in pending:
+                for listener in self._listeners.get(change, ()):
+                    listener(self)
+
     # Metody do modyfikacji stanu
     def next_color(self) -> None:
         self.color_index = (self.color_index + 1) % len(self.colors)
+        self._pending.add(StateChange.COLOR)
+
+    def previous_color(self) -> None:
+        self.color_index = (self.color_index - 1) % len(self.colors)
+        self._pending.add(StateChange.COLOR)
 
     def next_shape(self) -> None:
         self.shape_index = (self.shape_index + 1) % len(self.shapes)
+        self._pending.add(StateChange.SHAPE)
+
+    def previous_shape(self) -> None:
+        self.shape_index = (self.shape_index - 1) % len(self.shapes)
+        self._pending.add(StateChange.SHAPE)
+
+    def set_stable_gesture(self, gesture: Gesture | None) -> None:
+        if gesture is not self.current_stable_gesture:
+            self.current_stable_gesture = gesture
+            self._pending.add(StateChange.GESTURE)
+
+    def set_camera_status(self, status: CameraStatus) -> bool:
+        '''Ustawia stan kamery; zwraca True, jeśli się zmienił.'''
+        if status is self.camera_status:
+            return False
+        self.camera_status = status
+        self._pending.add(StateChange.CAMERA_STATUS)
+        return True
 
     def get_current_color(self) -> str:
         return self.colors[self.color_index]
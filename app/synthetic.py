@@ -0,0 +1,93 @@
+# app/synthetic.py
+'''
+Moduł generujący sztuczne dane dłoni.
+Pozwala testować i mierzyć potok rozpoznawania gestów bez kamery i bez modelu MediaPipe.
+'''
+from collections.abc import Sequence
+from types import SimpleNamespace
+from typing import Final
+
+import numpy as np
+import numpy.typing as npt
+from mediapipe.framework.formats.landmark_pb2 import NormalizedLandmarkList
+
+from app.gesture_recognizer import NUM_LANDMARKS
+from app.state import Gesture
+
+# Stany palców (True = prosty) w kolejności: kciuk, wskazujący, środkowy, serdeczny, mały
+GESTURE_POSES: Final[dict[Gesture, tuple[bool, bool, bool, bool, bool]]] = {
+    Gesture.OPEN_HAND: (True, True, True, True, True),
+    Gesture.THUMBS_UP: (True, False, False, False, False),
+    Gesture.POINTING: (False, True, False, False, False),
+    Gesture.VICTORY: (False, True, True, False, False),
+    Gesture.FIST: (False, False, False, False, False),
+}
+
+PHALANX_LENGTH: Final[float] = 0.05
+PALM_LENGTH: Final[float] = 0.1
+FOLD_ANGLE: Final[float] = 150.0
+
+
+def _rotate(direction: npt.NDArray[np.float64], degrees: float) -> npt.NDArray[np.float64]:
+    rad = np.radians(degrees)
+    c, s = np.cos(rad), np.sin(rad)
+    return np.array([c * direction[0] - s * direction[1], s * direction[0] + c * direction[1], 0.0])
+
+
+def make_hand(
+    straight: Sequence[bool], wrist: tuple[float, float] = (0.5, 0.8)
+) -> npt.NDArray[np.float32]:
+    '''
+    Buduje sztuczną dłoń (21, 3) w układzie MediaPipe, w której każdy palec jest prosty
+    (kąt w stawie 180°) lub zgięty (kąt 30°).
+    '''
+    points = np.zeros((NUM_LANDMARKS, 3))
+    points[0, :2] = wrist
+    for finger, is_straight in enumerate(straight):
+        direction = _rotate(np.array([0.0, -1.0, 0.0]), -40 + finger * 20)
+        first = 1 + finger * 4
+        base = points[0] + direction * PALM_LENGTH
+        for joint in range(4):
+            points[first + joint] = base + direction * PHALANX_LENGTH * joint
+        if not is_straight:
+            folded = _rotate(direction, FOLD_ANGLE)
+            points[first + 2] = points[first + 1] + folded * PHALANX_LENGTH
+            points[first + 3] = points[first + 1] + folded * PHALANX_LENGTH * 1.6
+    return points.astype(np.float32)
+
+
+def make_gesture_hand(
+    gesture: Gesture, wrist: tuple[float, float] = (0.5, 0.8)
+) -> npt.NDArray[np.float32]:
+    '''Buduje sztuczną dłoń pokazującą jeden z gestów z GESTURE_POSES.'''
+    return make_hand(GESTURE_POSES[gesture], wrist)
+
+
+def to_landmark_list(landmarks: npt.NDArray[np.floating]) -> NormalizedLandmarkList:
+    '''Konwertuje tablicę (21, 3) na listę punktów w formacie zwracanym przez MediaPipe.'''
+    landmark_list = NormalizedLandmarkList()
+    for x, y, z in landmarks.tolist():
+        landmark_list.landmark.add(x=x, y=y, z=z)
+    return landmark_list
+
+
+class SyntheticHands:
+    '''
+    Zastępuje model mediapipe Hands - zwraca z góry zadane dłonie niezależnie od obrazu.
+    '''
+
+    def __init__(self, hands: Sequence[npt.NDArray[np.floating]] = ()) -> None:
+        self._results = SimpleNamespace(multi_hand_landmarks=None)
+        self.set_hands(hands)
+
+    def set_hands(self, hands: Sequence[npt.NDArray[np.floating]]) -> None:
+        '''Ustawia dłonie zwracane przez kolejne wywołania process.'''
+        self._results = SimpleNamespace(
+            multi_hand_landmarks=[to_landmark_list(h) for h in hands] or None
+        )
+
+    def process(self, image: npt.NDArray[np.uint8]) -> SimpleNamespace:  # noqa: ARG002
+        return self._results
+
+    def close(self) -> None:
+        pass
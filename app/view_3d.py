@@ -1,60 +1,89 @@
 # app/view_3d.py
 '''
 Moduł odpowiedzialny za renderowanie sceny 3D.
+
+Widok działa w trybie "retained": artysta (Poly3DCollection) każdej bryły powstaje raz,
+z siatki współdzielonej przez moduł app.meshes. Zmiana bryły przełącza widoczność,
+zmiana koloru podmienia kolory ścian, a w każdej klatce ustawiane są jedynie kąty kamery.
 '''
+from typing import Final
+
 import numpy as np
+import numpy.typing as npt
 from matplotlib.axes import Axes
+from matplotlib.colors import LightSource, to_rgba
 from mpl_toolkits.mplot3d.art3d import Poly3DCollection  # type: ignore
 
+from app.meshes import DEFAULT_STYLE, SHAPE_STYLES, face_normals, get_mesh, plot_polygons
 from app.state import AppState
 
+FACE_ALPHA: Final[float] = 0.9
+# Źródło światła i zakres jasności jak przy cieniowaniu w Axes3D.plot_surface
+LIGHT_SOURCE: Final[LightSource] = LightSource(azdeg=225, altdeg=19.4712)
+MIN_SHADE: Final[float] = 0.3
+
+
+def shade_factors(normals: npt.NDArray[np.floating]) -> npt.NDArray[np.float64]:
+    '''Jasność ścian (F,) w zakresie [MIN_SHADE, 1] dla jednostkowych normalnych (F, 3).'''
+    intensity = (normals @ LIGHT_SOURCE.direction + 1.0) / 2.0
+    return np.asarray(MIN_SHADE + intensity * (1.0 - MIN_SHADE))
+
 
 class ThreeDView:
     '''Zarządza rysowaniem obiektów 3D na kanwie Matplotlib.'''
     def __init__(self, ax: Axes):
         self.ax = ax
+        self._artists: dict[str, Poly3DCollection] = {}
+        self._shades: dict[str, npt.NDArray[np.float64] | None] = {}
+        self._shape: str | None = None
+        self._color: str | None = None
+        self._configure_axes()
 
     def draw(self, state: AppState) -> None:
-        '''Rysuje obiekt na podstawie bieżącego stanu aplikacji.'''
-        self.ax.cla()
+        '''Aktualizuje scenę do bieżącego stanu aplikacji - tylko to, co się zmieniło.'''
         shape_type = state.get_current_shape()
         color = state.get_current_color()
 
-        if shape_type == 'CUBE':
-            self._draw_cube(color)
-        elif shape_type == 'PYRAMID':
-            self._draw_pyramid(color)
-        elif shape_type == 'SPHERE':
-            self._draw_sphere(color)
+        if shape_type != self._shape:
+            if self._shape is not None:
+                self._artists[self._shape].set_visible(False)
+            self._artist(shape_type).set_visible(True)
+            self._shape = shape_type
+            self._color = None
+        if color != self._color:
+            self._artists[shape_type].set_facecolor(self._face_colors(shape_type, color))
+            self._color = color
 
-        self._configure_axes(state)
-
-    def _draw_cube(self, color: str) -> None:
-        v = np.array([[-.5,-.5,-.5], [.5,-.5,-.5], [.5,.5,-.5], [-.5,.5,-.5],
-                      [-.5,-.5,.5], [.5,-.5,.5], [.5,.5,.5], [-.5,.5,.5]])
-        faces = [[v[j] for j in i] for i in [[0,1,2,3], [4,5,6,7], [0,1,5,4],
-                                             [2,3,7,6], [0,3,7,4], [1,2,6,5]]]
-        self.ax.add_collection3d(  # type: ignore[attr-defined]
-            Poly3DCollection(faces, facecolors=color, linewidths=1, edgecolors='k', alpha=0.9)
-        )
+        self.ax.view_init(elev=state.angle_x, azim=state.angle_y)  # type: ignore[attr-defined]
 
-    def _draw_pyramid(self, color: str) -> None:
-        v = np.array([[-0.5,-0.5,-0.5], [0.5,-0.5,-0.5], [0.5,0.5,-0.5],
-                      [-0.5,0.5,-0.5], [0,0,0.5]])
-        faces = [[v[i] for i in j] for j in [[0,1,4], [1,2,4], [2,3,4], [3,0,4], [0,1,2,3]]]
-        self.ax.add_collection3d(  # type: ignore[attr-defined]
-            Poly3DCollection(faces, facecolors=color, linewidths=1, edgecolors='k', alpha=0.9)
-        )
+    def _artist(self, shape_type: str) -> Poly3DCollection:
+        '''Zwraca artystę bryły, tworząc go przy pierwszym wyświetleniu.'''
+        artist = self._artists.get(shape_type)
+        if artist is None:
+            mesh = get_mesh(shape_type)
+            style = SHAPE_STYLES.get(shape_type, DEFAULT_STYLE)
+            artist = Poly3DCollection(
+                plot_polygons(shape_type),
+                linewidths=style.linewidth,
+                edgecolors=style.edgecolor,
+                alpha=FACE_ALPHA,
+            )
+            self.ax.add_collection3d(artist)  # type: ignore[attr-defined]
+            self._artists[shape_type] = artist
+            self._shades[shape_type] = shade_factors(face_normals(mesh)) if style.shaded else None
+        return artist
 
-    def _draw_sphere(self, color: str) -> None:
-        u, v = np.mgrid[0:2*np.pi:30j, 0:np.pi:20j]  # type: ignore[misc]
-        x = 0.5 * np.cos(u) * np.sin(v)
-        y = 0.5 * np.sin(u) * np.sin(v)
-        z = 0.5 * np.cos(v)
-        self.ax.plot_surface(x, y, z, color=color, alpha=0.9)  # type: ignore[attr-defined]
+    def _face_colors(self, shape_type: str, color: str) -> npt.NDArray[np.float64]:
+        rgba = np.array(to_rgba(color, FACE_ALPHA))
+        shades = self._shades[shape_type]
+        if shades is None:
+            return rgba[np.newaxis]
+        colors: npt.NDArray[np.float64] = shades[:, np.newaxis] * rgba
+        colors[:, 3] = rgba[3]
+        return colors
 
-    def _configure_axes(self, state: AppState) -> None:
-        '''Konfiguruje wygląd osi, limity i widok kamery.'''
+    def _configure_axes(self) -> None:
+        '''Konfiguruje (jednorazowo) wygląd osi i limity.'''
         self.ax.set_facecolor('#f0f0f0')
         self.ax.set_xlabel('OŚ X', color='red')
         self.ax.set_ylabel('OŚ Y', color='green')
@@ -63,5 +92,3 @@ class ThreeDView:
         self.ax.set_xlim(-0.7, 0.7)
         self.ax.set_ylim(-0.7, 0.7)
         self.ax.set_zlim(-0.7, 0.7)  # type: ignore[attr-defined]
-
-        self.ax.view_init(elev=state.angle_x, azim=state.angle_y)  # type: ignore[attr-defined]
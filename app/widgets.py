@@ -3,15 +3,53 @@
 Moduł zawierający pomocnicze funkcje do budowy komponentów GUI.
 '''
 import logging
+import os
 import tkinter as tk
 from pathlib import Path
 from tkinter import ttk
+from typing import Final
 
 from PIL import Image, ImageTk
 
 from app.state import Gesture
 
 ICONS_DIR = Path(__file__).resolve().parent.parent / 'icons'
+ICON_SIZE: Final[tuple[int, int]] = (48, 48)
+# Pomniejszone ikony są przechowywane poza repozytorium, w katalogu cache użytkownika
+ICON_CACHE_DIR = (
+    Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'kck-gestures' / 'icons'
+)
+
+
+def load_icon(
+    icon_path: Path, size: tuple[int, int] = ICON_SIZE, cache_dir: Path = ICON_CACHE_DIR
+) -> Image.Image:
+    '''
+    Zwraca ikonę przeskalowaną do `size`. Wynik skalowania LANCZOS jest zapisywany
+    na dysku pod nazwą zawierającą czas modyfikacji źródła, więc zmiana pliku ikony
+    automatycznie unieważnia wpis. Błąd zapisu cache nie przerywa ładowania.
+    '''
+    width, height = size
+    prefix = f'{icon_path.stem}_{width}x{height}_'
+    cached_path = cache_dir / f'{prefix}{icon_path.stat().st_mtime_ns}.png'
+    if cached_path.exists():
+        try:
+            with Image.open(cached_path) as cached:
+                cached.load()
+                return cached.copy()
+        except OSError as exc:
+            logging.debug("Ignoring unreadable cached icon %s: %s", cached_path, exc)
+
+    with Image.open(icon_path) as image:
+        resized = image.resize(size, Image.Resampling.LANCZOS)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for stale in cache_dir.glob(f'{prefix}*.png'):
+            stale.unlink()
+        resized.save(cached_path)
+    except OSError as exc:
+        logging.debug("Could not cache icon %s: %s", cached_path, exc)
+    return resized
 
 
 def create_gesture_panel(
@@ -41,9 +79,7 @@ def create_gesture_panel(
 
         icon_path = ICONS_DIR / icon_file
         try:
-            with Image.open(icon_path) as image:
-                resized = image.resize((48, 48), Image.Resampling.LANCZOS)
-            photo = ImageTk.PhotoImage(resized)
+            photo = ImageTk.PhotoImage(load_icon(icon_path))
             icon_label = ttk.Label(frame, image=photo)
             icon_label.image = photo  # type: ignore[attr-defined]
             icon_label.pack()
@@ -63,3 +99,29 @@ def create_gesture_panel(
         gesture_labels[gesture] = text_label
 
     return gesture_frames, gesture_icons, gesture_labels
+
+
+class GestureHighlighter:
+    '''
+    Podświetla aktywny gest w panelu gestów. Zmiana gestu przestylowuje tylko dwa
+    kafelki (poprzedni i nowy); ponowne wskazanie tego samego gestu nic nie kosztuje.
+    '''
+
+    def __init__(
+        self, frames: dict[Gesture, ttk.Frame], labels: dict[Gesture, ttk.Label]
+    ) -> None:
+        self.frames = frames
+        self.labels = labels
+        self.active: Gesture | None = None
+
+    def show(self, gesture: Gesture) -> None:
+        if gesture not in self.frames:
+            gesture = Gesture.UNKNOWN
+        if gesture is self.active:
+            return
+        if self.active is not None:
+            self.frames[self.active].config(style='TFrame')
+            self.labels[self.active].config(style='TLabel')
+        self.frames[gesture].config(style='Highlight.TFrame')
+        self.labels[gesture].config(style='Highlight.TLabel')
+        self.active = gesture
@@ -0,0 +1,49 @@
+'''
+Wspólne przygotowanie benchmarków: potok bez kamery i Matplotlib bez okna.
+'''
+import matplotlib
+import mediapipe as mp
+import pytest
+from pytest_benchmark.utils import parse_compare_fail
+
+import camera_handler
+from app.config import CAMERA_CONFIG
+from app.frame_sources import SyntheticSource
+from app.synthetic import SyntheticHands
+
+matplotlib.use('Agg')
+
+# Próg regresji stosowany przy --benchmark-compare, jeśli nie podano własnego
+DEFAULT_COMPARE_FAIL = 'median:15%'
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    if config.getoption('benchmark_compare') and not config.getoption('benchmark_compare_fail'):
+        config.option.benchmark_compare_fail = [parse_compare_fail(DEFAULT_COMPARE_FAIL)]
+
+
+@pytest.fixture
+def synthetic_hands(monkeypatch):
+    hands = SyntheticHands()
+    monkeypatch.setattr(mp.solutions.hands, 'Hands', lambda **_kwargs: hands)
+    return hands
+
+
+@pytest.fixture
+def handler(monkeypatch, synthetic_hands):  # noqa: ARG001
+    # Syntetyczne źródło bez odmierzania czasu i synchroniczny odczyt - mierzymy sam potok
+    monkeypatch.setattr(CAMERA_CONFIG, 'source', 'synthetic')
+    monkeypatch.setattr(CAMERA_CONFIG, 'source_realtime', False)
+    monkeypatch.setattr(CAMERA_CONFIG, 'threaded_capture', False)
+    instance = camera_handler.CameraHandler()
+    yield instance
+    instance.release()
+
+
+@pytest.fixture
+def frame():
+    source = SyntheticSource(
+        CAMERA_CONFIG.frame_width, CAMERA_CONFIG.frame_height, fps=0.0, realtime=False
+    )
+    return source.read()[1]
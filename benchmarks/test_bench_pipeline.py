@@ -0,0 +1,51 @@
+import cv2
+import numpy as np
+import pytest
+
+from app.latency import STAGE_INFERENCE, LatencyTracker
+from app.state import Gesture
+from app.synthetic import make_gesture_hand
+
+
+def test_flip(benchmark, frame):
+    benchmark(cv2.flip, frame, 1)
+
+
+def test_color_conversion(benchmark, frame):
+    benchmark(cv2.cvtColor, frame, cv2.COLOR_BGR2RGB)
+
+
+def test_convert_and_flip_into_buffer(benchmark, frame):
+    display = np.empty_like(frame)
+
+    def convert_and_flip():
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=display)
+        cv2.flip(display, 1, dst=display)
+
+    benchmark(convert_and_flip)
+
+
+@pytest.mark.parametrize('hand_count', [0, 1, 2])
+def test_process_image(benchmark, handler, synthetic_hands, frame, hand_count):
+    wrists = [(0.3, 0.8), (0.7, 0.8)][:hand_count]
+    synthetic_hands.set_hands([make_gesture_hand(Gesture.OPEN_HAND, w) for w in wrists])
+    output = benchmark(handler.process_image, frame)
+    assert output.frame is not None
+
+
+def test_process_frame(benchmark, handler, synthetic_hands):
+    synthetic_hands.set_hands([make_gesture_hand(Gesture.POINTING)])
+    assert benchmark(handler.process_frame).gesture is Gesture.POINTING
+
+
+@pytest.mark.parametrize('enabled', [False, True], ids=['disabled', 'enabled'])
+def test_latency_span(benchmark, enabled):
+    tracker = LatencyTracker()
+    if enabled:
+        tracker.enable()
+
+    def timed():
+        with tracker.span(STAGE_INFERENCE):
+            pass
+
+    benchmark(timed)
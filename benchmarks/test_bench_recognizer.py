@@ -0,0 +1,40 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from app.gesture_recognizer import GestureRecognizer
+from app.gesture_stabilizer import GestureStabilizer
+from app.state import Gesture
+from app.synthetic import GESTURE_POSES, make_gesture_hand, make_hand, to_landmark_list
+
+
+@pytest.mark.parametrize('gesture', list(GESTURE_POSES), ids=lambda g: g.value)
+def test_recognize_array(benchmark, gesture):
+    recognizer = GestureRecognizer()
+    landmarks = make_gesture_hand(gesture)
+    assert benchmark(recognizer.recognize, landmarks) is gesture
+
+
+def test_recognize_protobuf(benchmark):
+    recognizer = GestureRecognizer()
+    gesture = next(iter(GESTURE_POSES))
+    landmarks = to_landmark_list(make_hand(GESTURE_POSES[gesture])).landmark
+    assert benchmark(recognizer.recognize, landmarks) is gesture
+
+
+@pytest.mark.parametrize('count', [1, 2, 64, 1024])
+def test_recognize_batch(benchmark, count):
+    recognizer = GestureRecognizer()
+    rng = np.random.default_rng(0)
+    poses = list(GESTURE_POSES)
+    batch = np.stack([make_gesture_hand(poses[i]) for i in rng.integers(0, len(poses), count)])
+    assert benchmark(recognizer.recognize_batch, batch).shape == (count,)
+
+
+def test_stabilizer_update(benchmark):
+    stabilizer = GestureStabilizer()
+    landmarks = make_gesture_hand(Gesture.FIST)
+    gestures = itertools.cycle([Gesture.FIST, Gesture.FIST, Gesture.UNKNOWN])
+    timestamps = itertools.count(0.0, 1 / 30)
+    benchmark(lambda: stabilizer.update(next(gestures), landmarks, next(timestamps)))
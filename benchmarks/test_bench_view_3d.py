@@ -0,0 +1,51 @@
+import matplotlib.pyplot as plt
+import pytest
+
+from app.config import OBJECT_CONFIG
+from app.software_renderer import SoftwareView
+from app.state import AppState
+from app.view_3d import ThreeDView
+
+
+@pytest.fixture
+def figure():
+    fig = plt.figure(facecolor='#f0f0f0')
+    yield fig
+    plt.close(fig)
+
+
+def _state_with_shape(shape):
+    state = AppState()
+    state.shape_index = OBJECT_CONFIG.shapes.index(shape)
+    return state
+
+
+@pytest.mark.parametrize('shape', OBJECT_CONFIG.shapes)
+def test_view_draw(benchmark, figure, shape):
+    view = ThreeDView(figure.add_subplot(111, projection='3d'))
+    benchmark(view.draw, _state_with_shape(shape))
+
+
+@pytest.mark.parametrize('shape', OBJECT_CONFIG.shapes)
+def test_view_draw_and_canvas(benchmark, figure, shape):
+    view = ThreeDView(figure.add_subplot(111, projection='3d'))
+    state = _state_with_shape(shape)
+
+    def render():
+        state.angle_y += 1.0
+        view.draw(state)
+        figure.canvas.draw()
+
+    benchmark(render)
+
+
+@pytest.mark.parametrize('shape', OBJECT_CONFIG.shapes)
+def test_software_view_draw(benchmark, shape):
+    view = SoftwareView(*OBJECT_CONFIG.render_size)
+    state = _state_with_shape(shape)
+
+    def render():
+        state.angle_y += 1.0
+        view.draw(state)
+
+    benchmark(render)
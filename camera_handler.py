@@ -1,8 +1,10 @@
 '''
 Moduł odpowiedzialny za obsługę kamery i rozpoznawanie gestów dłoni.
-Zaktualizowany o logikę ponownej inicjalizacji w przypadku utraty połączenia.
+Po utracie połączenia kamera jest ponownie otwierana w tle (ReconnectSupervisor),
+a model MediaPipe pozostaje załadowany.
 '''
 import logging
+import time
 from typing import Any, Final, NamedTuple
 
 import cv2
@@ -10,134 +12,462 @@ import mediapipe as mp
 import numpy as np
 import numpy.typing as npt
 
-from app.config import CAMERA_CONFIG
-from app.gesture_recognizer import GestureRecognizer
-from app.state import Gesture
+from app.capture import FrameGrabber
+from app.config import CAMERA_CONFIG, GESTURE_CONFIG, CameraConfig
+from app.frame_sources import FrameSource, create_frame_source
+from app.gesture_recognizer import (
+    GESTURES,
+    NUM_LANDMARKS,
+    GestureRecognizer,
+    fill_landmark_array,
+)
+from app.hand_tracking import HandTracker
+from app.inference_worker import HandsFactory, InferenceProcess, InferenceResult
+from app.landmark_flow import LandmarkPropagator
+from app.latency import (
+    LATENCY,
+    STAGE_CAPTURE,
+    STAGE_CONVERT,
+    STAGE_INFERENCE,
+    STAGE_RECOGNITION,
+)
+from app.overlay import draw_hand_landmarks
+from app.reconnect import ReconnectSupervisor
+from app.roi import RegionOfInterest, RoiTracker, remap_landmarks
+from app.state import CameraStatus, Gesture
 
-FRAME_WIDTH: Final[int] = 640
-FRAME_HEIGHT: Final[int] = 480
-RECONNECT_ATTEMPTS: Final[int] = 2
+INFERENCE_INLINE: Final[str] = 'inline'
+INFERENCE_PROCESS: Final[str] = 'process'
+INFERENCE_BACKENDS: Final[tuple[str, ...]] = (INFERENCE_INLINE, INFERENCE_PROCESS)
+
+
+class HandOutput(NamedTuple):
+    track_id: int
+    gesture: Gesture
+    coords: tuple[float, float] | None
+    landmarks: npt.NDArray[np.float32]
 
 
 # Zwracany typ danych z NamedTuple dla czytelności
 class CameraOutput(NamedTuple):
+    # Klatka RGB z nakładką - widok na bufor współdzielony, ważny do następnego process_frame
     frame: npt.NDArray[np.uint8] | None
     gesture: Gesture
     coords: tuple[float, float] | None
+    # Bufor (21, 3) float32 współdzielony między klatkami - ważny do następnego process_frame
+    landmarks: npt.NDArray[np.float32] | None = None
+    # Wszystkie wykryte dłonie posortowane po identyfikatorze; pierwsza to dłoń główna
+    hands: tuple[HandOutput, ...] = ()
+    # False, gdy od poprzedniego wywołania nie było nowej klatki i zwracany jest dawny wynik
+    fresh: bool = True
 
 
 class CameraHandler:
     '''
     Ulepszona, niezawodna klasa do obsługi kamery i rozpoznawania gestów.
-    Posiada mechanizm do ponownej próby inicjalizacji kamery.
+    Niedostępna kamera jest ponownie otwierana w tle, bez blokowania process_frame.
+    `hands_factory` zastępuje model MediaPipe (np. syntetycznymi dłońmi w pomiarach).
     '''
 
-    def __init__(self) -> None:
-        self.config = CAMERA_CONFIG
-        self.vid: cv2.VideoCapture | None = None
+    def __init__(
+        self,
+        config: CameraConfig | None = None,
+        hands_factory: HandsFactory | None = None,
+    ) -> None:
+        self.config = config or CAMERA_CONFIG
+        self._hands_factory = hands_factory
+        if self.config.inference_backend not in INFERENCE_BACKENDS:
+            raise ValueError(f'Unknown inference backend: {self.config.inference_backend!r}')
+        self.source: FrameSource | None = None
         self.hands: mp.solutions.hands.Hands | None = None
         self.mp_hands: Any | None = None
-        self.mp_drawing: Any | None = None
+        self.inference_process: InferenceProcess | None = None
         self.is_camera_available: bool = False
-        self.gesture_recognizer = GestureRecognizer()
+        self.gesture_recognizer = GestureRecognizer(self.config)
+        self.hand_tracker = HandTracker(self.config.hand_track_max_distance)
+        self._landmark_buffer = np.zeros(
+            (self.config.max_num_hands, NUM_LANDMARKS, 3), dtype=np.float32
+        )
+        self._grabber: FrameGrabber | None = None
+        self._reconnect: ReconnectSupervisor | None = None
+        self._source_finished = False
+        # Prealokowane bufory etapów potoku, odtwarzane tylko przy zmianie rozmiaru klatki
+        self._buffers: dict[str, npt.NDArray[np.uint8]] = {}
+        self._gray_index = 0
+        self.roi_tracker: RoiTracker | None = None
+        if self.config.roi_inference:
+            self.roi_tracker = RoiTracker(
+                self.config.roi_padding, self.config.roi_full_frame_interval
+            )
+        self.propagator: LandmarkPropagator | None = None
+        if self.config.adaptive_inference and self.config.inference_backend == INFERENCE_INLINE:
+            self.propagator = LandmarkPropagator(
+                self.config.inference_budget_ms,
+                self.config.max_detection_interval,
+                self.config.redetect_motion_threshold,
+            )
+        self._empty_result = InferenceResult(
+            -1, self._landmark_buffer[:0].copy(), np.empty(0, dtype=np.int8)
+        )
+        self._worker_result = self._empty_result
+        self._last_output = CameraOutput(frame=None, gesture=Gesture.NO_HAND, coords=None)
 
         self.initialize_camera()
 
     def initialize_camera(self) -> bool:
         """
-        Inicjalizuje lub reinicjalizuje kamerę i model MediaPipe.
+        Inicjalizuje lub reinicjalizuje (synchronicznie) źródło klatek i model MediaPipe.
         Zwraca True w przypadku sukcesu, False w przeciwnym razie.
         """
-        self.release()
-        logging.info(
-            "Attempting to initialize camera at index %s...", self.config.camera_index
-        )
-        vid = cv2.VideoCapture(self.config.camera_index)
-        if not vid.isOpened():
-            logging.error("Failed to open camera.")
-            vid.release()
-            self.is_camera_available = False
+        self._stop_reconnect()
+        self._release_source()
+        self._source_finished = False
+        source = self._open_source()
+        if source is None:
             return False
+        return self._install_source(source)
 
-        vid.set(cv2.CAP_PROP_FRAME_WIDTH, FRAME_WIDTH)
-        vid.set(cv2.CAP_PROP_FRAME_HEIGHT, FRAME_HEIGHT)
-        vid.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    def _open_source(self) -> FrameSource | None:
+        '''Tworzy i otwiera źródło klatek; wywoływane także z wątku ponownego łączenia.'''
+        source = create_frame_source(self.config)
+        if not source.open():
+            source.release()
+            return None
+        return source
 
-        self.vid = vid
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            max_num_hands=1,
-            min_detection_confidence=self.config.min_detection_confidence,
-            min_tracking_confidence=self.config.min_tracking_confidence,
-        )
-        self.mp_drawing = mp.solutions.drawing_utils
+    def _install_source(self, source: FrameSource) -> bool:
+        '''Podłącza otwarte źródło; model MediaPipe jest tworzony tylko raz.'''
+        self.source = source
+        if self.config.inference_backend == INFERENCE_INLINE and self.hands is None:
+            if self._hands_factory is not None:
+                self.hands = self._hands_factory()
+            else:
+                self.mp_hands = mp.solutions.hands
+                self.hands = self.mp_hands.Hands(
+                    max_num_hands=self.config.max_num_hands,
+                    min_detection_confidence=self.config.min_detection_confidence,
+                    min_tracking_confidence=self.config.min_tracking_confidence,
+                )
+        if self.config.threaded_capture:
+            self._grabber = FrameGrabber(source.read)
+            self._grabber.start()
         self.is_camera_available = True
         logging.info("Camera initialized successfully.")
         return True
 
     def _ensure_camera_ready(self) -> bool:
-        if self.is_camera_available and self.vid and self.hands:
+        if self.is_camera_available and self.source and self._has_detector():
+            return True
+        if self.source_finished:
+            return False
+        if self._reconnect is None:
+            self._start_reconnect()
+            return False
+        source = self._reconnect.take_source()
+        if source is None:
+            return False
+        self._reconnect = None
+        return self._install_source(source)
+
+    def _start_reconnect(self) -> None:
+        self._reconnect = ReconnectSupervisor(self._open_source, self.config)
+        self._reconnect.start()
+
+    def _stop_reconnect(self) -> None:
+        if self._reconnect:
+            self._reconnect.stop()
+            self._reconnect = None
+
+    def _lose_source(self) -> None:
+        '''Zwalnia uszkodzone źródło i zleca ponowne łączenie w tle.'''
+        self._release_source()
+        self._start_reconnect()
+
+    def _has_detector(self) -> bool:
+        # Proces roboczy jest tworzony leniwie przy pierwszej klatce
+        return self.hands is not None or self.config.inference_backend == INFERENCE_PROCESS
+
+    @property
+    def source_finished(self) -> bool:
+        '''Czy skończone źródło (plik, katalog) zostało odtworzone do końca.'''
+        return self._source_finished
+
+    @property
+    def camera_status(self) -> CameraStatus:
+        '''Stan źródła klatek do prezentacji w interfejsie.'''
+        if self.is_camera_available:
+            return CameraStatus.AVAILABLE
+        if self._source_finished:
+            return CameraStatus.FINISHED
+        if self._reconnect is not None:
+            return self._reconnect.status
+        return CameraStatus.RECONNECTING
+
+    @property
+    def capture_fps(self) -> float | None:
+        '''Częstotliwość odczytu klatek przez wątek kamery (None w trybie synchronicznym).'''
+        return self._grabber.capture_fps if self._grabber else None
+
+    def wait_for_frame(self, timeout: float) -> bool:
+        '''
+        Blokuje najwyżej `timeout` s, aż process_frame będzie miał nową klatkę do
+        przetworzenia (albo awarię wątku kamery do obsłużenia). Przy niedostępnej kamerze
+        czeka cały `timeout`, aby ponowne łączenie w tle nie było odpytywane w pętli.
+        W trybie synchronicznym process_frame sam czeka na urządzenie, więc zwraca True.
+        '''
+        if not self.is_camera_available:
+            time.sleep(timeout)
+            return False
+        if self._grabber is None:
             return True
-        return self.initialize_camera()
+        return self._grabber.slot.wait(timeout)
 
     def process_frame(self) -> CameraOutput:
         '''Przetwarza klatkę i zwraca wynik jako obiekt CameraOutput.'''
-        for attempt in range(RECONNECT_ATTEMPTS):
-            if not self._ensure_camera_ready() or not self.vid or not self.hands:
-                return CameraOutput(frame=None, gesture=Gesture.NO_CAMERA, coords=None)
-
-            ret, frame = self.vid.read()
-            if ret:
-                break
-
-            logging.warning(
-                "Could not read frame from camera (attempt %s/%s).",
-                attempt + 1,
-                RECONNECT_ATTEMPTS,
-            )
-            self.is_camera_available = False
-            self.release()
-        else:
-            logging.error("Camera read failed after reconnection attempts.")
+        if self.config.threaded_capture:
+            return self._process_latest_frame()
+
+        if not self._ensure_camera_ready() or not self.source:
+            return CameraOutput(frame=None, gesture=Gesture.NO_CAMERA, coords=None)
+
+        with LATENCY.span(STAGE_CAPTURE):
+            ret, frame = self.source.read()
+        if not ret or frame is None:
+            if self.source.finished:
+                return self._finish_source()
+            logging.error("Could not read frame from camera.")
+            self._lose_source()
             return CameraOutput(frame=None, gesture=Gesture.ERROR, coords=None)
 
-        frame = cv2.flip(frame, 1)
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        frame.flags.writeable = False
-        results = self.hands.process(frame_rgb)
-        frame.flags.writeable = True
+        return self.process_image(frame)
 
-        gesture = Gesture.NO_HAND
-        hand_coords = None
+    def _process_latest_frame(self) -> CameraOutput:
+        '''
+        Przetwarza najnowszą klatkę dostarczoną przez wątek kamery.
+        Jeśli od ostatniego wywołania nie pojawiła się nowa klatka, zwraca poprzedni wynik
+        oznaczony jako nieświeży (fresh=False), aby nie był liczony drugi raz.
+        '''
+        if not self._ensure_camera_ready() or not self._grabber:
+            return CameraOutput(frame=None, gesture=Gesture.NO_CAMERA, coords=None)
 
-        if results.multi_hand_landmarks:
-            hand_landmarks = results.multi_hand_landmarks[0]
-            if self.mp_drawing:
-                self.mp_drawing.draw_landmarks(
-                    frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS
-                )
+        frame = self._grabber.take()
+        if frame is None:
+            if self.source and self.source.finished:
+                return self._finish_source()
+            if self._grabber.failed:
+                logging.error("Camera read failed in capture thread.")
+                self._lose_source()
+                return CameraOutput(frame=None, gesture=Gesture.ERROR, coords=None)
+            return self._last_output._replace(fresh=False)
 
-            gesture = self.gesture_recognizer.recognize(tuple(hand_landmarks.landmark))
+        self._last_output = self.process_image(frame)
+        return self._last_output
 
-            if gesture is Gesture.OPEN_HAND:
-                control_point = hand_landmarks.landmark[0]
-                hand_coords = (control_point.x, control_point.y)
+    def _finish_source(self) -> CameraOutput:
+        logging.info("Frame source reached its end.")
+        self._release_source()
+        self._source_finished = True
+        return CameraOutput(frame=None, gesture=Gesture.NO_CAMERA, coords=None)
+
+    def process_image(self, frame: npt.NDArray[np.uint8]) -> CameraOutput:
+        '''
+        Przetwarza klatkę BGR już pobraną z kamery: konwersja do RGB i odbicie
+        w jednym prealokowanym buforze, detekcja dłoni, nakładka z punktami
+        rysowana w tym samym buforze i rozpoznanie gestów.
+        '''
+        if not self._has_detector():
+            return CameraOutput(frame=None, gesture=Gesture.NO_CAMERA, coords=None)
+
+        # Jedyna konwersja kolorów w całym potoku; odbicie w miejscu, bez kopii
+        display = self._buffer('display', frame.shape)
+        with LATENCY.span(STAGE_CONVERT):
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=display)
+            cv2.flip(display, 1, dst=display)
+
+        if self.config.inference_backend == INFERENCE_PROCESS:
+            landmarks, codes = self._detect_out_of_process(display)
+        elif self.propagator is not None:
+            landmarks, codes = self._detect_adaptive(display, self.propagator)
+        else:
+            landmarks, codes = self._detect_inline(display)
+
+        draw_hand_landmarks(display, landmarks)
+        hands = self._track_hands(landmarks, codes)
+        if not hands:
+            return CameraOutput(frame=display, gesture=Gesture.NO_HAND, coords=None)
 
+        primary = hands[0]
         return CameraOutput(
-            frame=frame.astype(np.uint8),
-            gesture=gesture,
-            coords=hand_coords,
+            frame=display,
+            gesture=primary.gesture,
+            coords=primary.coords,
+            landmarks=primary.landmarks,
+            hands=hands,
         )
 
+    def _buffer(self, name: str, shape: tuple[int, ...]) -> npt.NDArray[np.uint8]:
+        '''Zwraca prealokowany bufor etapu potoku, tworząc go przy zmianie rozmiaru.'''
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape, dtype=np.uint8)
+            self._buffers[name] = buffer
+        return buffer
+
+    def _detect_inline(
+        self, frame: npt.NDArray[np.uint8]
+    ) -> tuple[npt.NDArray[np.float32], npt.NDArray[np.int8]]:
+        '''Wykrywa dłonie modelem MediaPipe w bieżącym wątku i klasyfikuje je wsadowo.'''
+        if self.hands is None:
+            return self._empty_result.landmarks, self._empty_result.gestures
+
+        region = self.roi_tracker.next_region() if self.roi_tracker else None
+        landmarks = self._run_hands(self.hands, frame, region)
+        if region is not None and len(landmarks) == 0:
+            # Dłoń wyszła poza ROI - ponawiamy detekcję na całej klatce
+            landmarks = self._run_hands(self.hands, frame, None)
+        if self.roi_tracker:
+            self.roi_tracker.update(landmarks, frame.shape)
+        return landmarks, self._recognize(landmarks)
+
+    def _recognize(self, landmarks: npt.NDArray[np.float32]) -> npt.NDArray[np.int8]:
+        with LATENCY.span(STAGE_RECOGNITION):
+            return self.gesture_recognizer.recognize_batch(landmarks)
+
+    def _run_hands(
+        self,
+        hands: mp.solutions.hands.Hands,
+        frame: npt.NDArray[np.uint8],
+        region: RegionOfInterest | None,
+    ) -> npt.NDArray[np.float32]:
+        '''
+        Uruchamia model MediaPipe na całej klatce lub na pomniejszonym ROI i zwraca
+        punkty dłoni we współrzędnych znormalizowanych względem całej klatki.
+        '''
+        image = frame
+        if region is not None:
+            # ROI skalowane do stałego kwadratu, więc bufor jest alokowany tylko raz
+            size = self.config.roi_inference_size
+            image = self._buffer('roi', (size, size, 3))
+            cv2.resize(
+                frame[region.y0:region.y1, region.x0:region.x1],
+                (size, size),
+                dst=image,
+                interpolation=cv2.INTER_AREA,
+            )
+        with LATENCY.span(STAGE_INFERENCE):
+            results = hands.process(image)
+
+        detected = results.multi_hand_landmarks or ()
+        count = min(len(detected), len(self._landmark_buffer))
+        landmarks = self._landmark_buffer[:count]
+        for i in range(count):
+            fill_landmark_array(detected[i].landmark, landmarks[i])
+        if region is not None:
+            remap_landmarks(landmarks, region, frame.shape)
+        return landmarks
+
+    def _detect_adaptive(
+        self, frame: npt.NDArray[np.uint8], propagator: LandmarkPropagator
+    ) -> tuple[npt.NDArray[np.float32], npt.NDArray[np.int8]]:
+        '''
+        Uruchamia pełną detekcję tylko wtedy, gdy wymaga tego propagator;
+        w pozostałych klatkach przesuwa punkty przepływem optycznym.
+        '''
+        # Dwa bufory na przemian - propagator przechowuje poprzednią klatkę
+        self._gray_index ^= 1
+        gray = self._buffer(f'gray{self._gray_index}', frame.shape[:2])
+        cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY, dst=gray)
+        if not propagator.should_detect():
+            landmarks = propagator.propagate(gray, self._landmark_buffer)
+            if landmarks is not None:
+                return landmarks, self._recognize(landmarks)
+
+        start = time.perf_counter()
+        landmarks, codes = self._detect_inline(frame)
+        propagator.record_detection(gray, landmarks, time.perf_counter() - start)
+        return landmarks, codes
+
+    def _detect_out_of_process(
+        self, frame: npt.NDArray[np.uint8]
+    ) -> tuple[npt.NDArray[np.float32], npt.NDArray[np.int8]]:
+        '''
+        Przekazuje klatkę do procesu roboczego i zwraca najnowszy dostępny wynik.
+        Wynik dotyczy zwykle jednej z poprzednich klatek - proces główny nie czeka na detekcję.
+        '''
+        worker = self.inference_process
+        if worker is not None and (not worker.is_alive or worker.shape != frame.shape):
+            if not worker.is_alive:
+                logging.error("Inference process exited unexpectedly, restarting.")
+            self._close_inference_process()
+            worker = None
+        if worker is None:
+            worker = InferenceProcess(
+                frame.shape, self.config, GESTURE_CONFIG, hands_factory=self._hands_factory
+            )
+            self.inference_process = worker
+
+        # Mierzony jest tylko koszt przekazania klatki i odebrania wyniku w tym procesie
+        with LATENCY.span(STAGE_INFERENCE):
+            slot = worker.acquire_slot()
+            if slot is not None:
+                index, target = slot
+                # Jedyna kopia klatki - do pamięci współdzielonej, przed narysowaniem nakładki
+                np.copyto(target, frame)
+                worker.submit(index)
+            result = worker.poll()
+        if result is not None:
+            self._worker_result = result
+
+        count = len(self._worker_result.landmarks)
+        landmarks = self._landmark_buffer[:count]
+        landmarks[...] = self._worker_result.landmarks
+        return landmarks, self._worker_result.gestures
+
+    def _close_inference_process(self) -> None:
+        if self.inference_process:
+            self.inference_process.close()
+            self.inference_process = None
+        self._worker_result = self._empty_result
+
+    def _track_hands(
+        self, landmarks: npt.NDArray[np.float32], codes: npt.NDArray[np.int8]
+    ) -> tuple[HandOutput, ...]:
+        '''Nadaje dłoniom identyfikatory śledzenia i buduje wyniki posortowane po nich.'''
+        if len(landmarks) == 0:
+            self.hand_tracker.reset()
+            return ()
+
+        track_ids = self.hand_tracker.update(landmarks[:, 0, :2])
+        hands = []
+        for i in np.argsort(track_ids):
+            gesture = GESTURES[codes[i]]
+            coords = None
+            if gesture is Gesture.OPEN_HAND:
+                coords = (float(landmarks[i, 0, 0]), float(landmarks[i, 0, 1]))
+            hands.append(HandOutput(int(track_ids[i]), gesture, coords, landmarks[i]))
+        return tuple(hands)
+
+    def _release_source(self) -> None:
+        '''Zwalnia źródło klatek, zachowując model MediaPipe i proces roboczy.'''
+        if self._grabber:
+            self._grabber.stop()
+            self._grabber = None
+        if self.source:
+            self.source.release()
+        if self.propagator:
+            self.propagator.reset()
+        if self.roi_tracker:
+            self.roi_tracker.reset()
+        self.source = None
+        self.is_camera_available = False
+        self._last_output = CameraOutput(frame=None, gesture=Gesture.NO_HAND, coords=None)
+
     def release(self) -> None:
-        '''Zwalnia zasób kamery.'''
-        if self.vid and self.vid.isOpened():
-            self.vid.release()
-            logging.info("Camera resource released.")
+        '''Zwalnia zasób kamery, model MediaPipe i proces roboczy.'''
+        self._stop_reconnect()
+        self._release_source()
         if self.hands:
             self.hands.close()
-        self.vid = None
+        self._close_inference_process()
         self.hands = None
         self.mp_hands = None
-        self.mp_drawing = None
-        self.is_camera_available = False
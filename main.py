@@ -1,22 +1,114 @@
 '''
 Punkt startowy aplikacji.
 Tworzy główne okno, konfiguruje logowanie i uruchamia pętlę zdarzeń.
+
+Okno pojawia się, zanim zostaną zaimportowane ciężkie moduły (matplotlib, cv2, MediaPipe):
+interfejs jest budowany dopiero po jego pokazaniu, a kamera i model dłoni startują w tle.
 '''
+import argparse
 import logging
+import signal
+import time
 import tkinter as tk
+from pathlib import Path
+from tkinter import ttk
+
+from app.startup import MARK_WINDOW_SHOWN, StartupTimer
+
+WINDOW_TITLE = 'Sterowanie Obiektem 3D za pomocą Gestów'
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=WINDOW_TITLE)
+    parser.add_argument(
+        '--startup-report',
+        type=Path,
+        default=None,
+        help='plik, do którego dopisywany jest raport czasu uruchamiania (JSON Lines)',
+    )
+    parser.add_argument(
+        '--latency-report',
+        type=Path,
+        default=None,
+        help='plik (.csv lub JSON Lines), do którego przy zamknięciu i po sygnale SIGUSR1 '
+        'dopisywane są percentyle czasów etapów potoku',
+    )
+    parser.add_argument(
+        '--latency-overlay',
+        action='store_true',
+        help='pokazuje percentyle czasów etapów na pasku stanu',
+    )
+    parser.add_argument(
+        '--record-session',
+        type=Path,
+        default=None,
+        help='plik, do którego dopisywane są punkty dłoni i gesty z każdej klatki '
+        '(do odtworzenia przez python -m app.session_log)',
+    )
+    return parser.parse_args()
+
+
+def enable_latency_tracking(report_path: Path | None) -> None:
+    '''Włącza pomiar czasów etapów i eksport raportu na żądanie (SIGUSR1, tylko POSIX).'''
+    from app.latency import LATENCY
+
+    LATENCY.enable()
+    if report_path is not None and hasattr(signal, 'SIGUSR1'):
+        signal.signal(signal.SIGUSR1, lambda _signum, _frame: LATENCY.export(report_path))
+
+
+def build_main_window(
+    root: tk.Tk,
+    splash: ttk.Label,
+    timer: StartupTimer,
+    latency_overlay: bool,
+    session_path: Path | None,
+) -> None:
+    # Import dopiero po pokazaniu okna - ładuje matplotlib i resztę interfejsu
+    from app.main_window import MainWindow
+
+    splash.destroy()
+    recorder = None
+    if session_path is not None:
+        from app.session_log import SessionRecorder
+
+        recorder = SessionRecorder(session_path)
+    # Referencję do okna przechowują wywołania zaplanowane przez `after`
+    MainWindow(root, WINDOW_TITLE, timer, latency_overlay, recorder)
 
-from app.main_window import MainWindow
 
 if __name__ == '__main__':
+    start_time = time.perf_counter()
     # Konfiguracja logowania na samym początku
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(levelname)s - %(module)s - %(message)s',
         datefmt='%H:%M:%S',
     )
+    args = parse_args()
+    startup_timer = StartupTimer(start_time, args.startup_report)
+    if args.latency_report or args.latency_overlay:
+        enable_latency_tracking(args.latency_report)
 
     logging.info('Application starting...')
     root = tk.Tk()
-    app = MainWindow(root, 'Sterowanie Obiektem 3D za pomocą Gestów')
+    root.title(WINDOW_TITLE)
+    splash = ttk.Label(root, text='Uruchamianie...', padding=40)
+    splash.grid(row=0, column=0)
+    root.update()
+    startup_timer.mark(MARK_WINDOW_SHOWN)
+
+    root.after_idle(
+        build_main_window,
+        root,
+        splash,
+        startup_timer,
+        args.latency_overlay,
+        args.record_session,
+    )
     root.mainloop()
+    if args.latency_report:
+        from app.latency import LATENCY
+
+        LATENCY.export(args.latency_report)
     logging.info('Application closed.')
@@ -0,0 +1,94 @@
+import asyncio
+
+import cv2
+import mediapipe as mp
+import numpy as np
+import pytest
+
+import camera_handler
+from app.async_pipeline import AsyncGesturePipeline
+from app.capture import LatestFrameSlot
+from app.config import CameraConfig
+from app.state import Gesture
+from app.synthetic import SyntheticHands, make_gesture_hand
+
+
+@pytest.fixture
+def fist_hands(monkeypatch):
+    hands = SyntheticHands([make_gesture_hand(Gesture.FIST)])
+    monkeypatch.setattr(mp.solutions.hands, 'Hands', lambda **_kwargs: hands)
+    return hands
+
+
+def use_config(monkeypatch, **overrides):
+    config = CameraConfig(source_realtime=False, **overrides)
+    monkeypatch.setattr(camera_handler, 'CAMERA_CONFIG', config)
+
+
+async def collect(pipeline, count):
+    outputs = []
+    async with pipeline:
+        async for output in pipeline.outputs():
+            outputs.append(output)
+            if len(outputs) == count:
+                break
+    return outputs
+
+
+def test_slot_wait_wakes_on_frame_and_close():
+    slot = LatestFrameSlot()
+    assert not slot.wait(0.01)
+    slot.put(np.zeros(1, np.uint8))
+    assert slot.wait(0.01)
+    slot.take()
+    slot.close()
+    assert slot.wait(0.01)
+
+
+@pytest.mark.parametrize('threaded', [False, True])
+def test_pipeline_streams_detached_outputs(monkeypatch, fist_hands, threaded):  # noqa: ARG001
+    use_config(monkeypatch, source='synthetic', threaded_capture=threaded)
+
+    outputs = asyncio.run(collect(AsyncGesturePipeline(), 3))
+
+    assert [o.gesture for o in outputs] == [Gesture.FIST] * 3
+    assert all(o.frame is None for o in outputs)
+    # Punkty każdego wyniku to osobna kopia, a nie współdzielony bufor potoku
+    assert outputs[0].landmarks is not outputs[1].landmarks
+    assert outputs[0].landmarks is outputs[0].hands[0].landmarks
+
+
+def test_pipeline_copies_frames_on_request(monkeypatch, fist_hands):  # noqa: ARG001
+    use_config(monkeypatch, source='synthetic', threaded_capture=False)
+
+    outputs = asyncio.run(collect(AsyncGesturePipeline(include_frames=True), 2))
+
+    assert outputs[0].frame.shape == (480, 640, 3)
+    assert not np.shares_memory(outputs[0].frame, outputs[1].frame)
+
+
+def test_pipeline_ends_with_finite_source(monkeypatch, fist_hands, tmp_path):  # noqa: ARG001
+    for i in range(3):
+        cv2.imwrite(str(tmp_path / f'{i:03d}.png'), np.zeros((24, 32, 3), np.uint8))
+    use_config(
+        monkeypatch, source='images', source_path=str(tmp_path), source_loop=False,
+        threaded_capture=False,
+    )
+
+    outputs = asyncio.run(collect(AsyncGesturePipeline(), 10))
+
+    assert [o.gesture for o in outputs] == [Gesture.FIST] * 3 + [Gesture.NO_CAMERA]
+
+
+def test_queue_keeps_newest_outputs():
+    async def publish_all():
+        pipeline = AsyncGesturePipeline(queue_size=2)
+        for gesture in (Gesture.FIST, Gesture.VICTORY, Gesture.POINTING):
+            pipeline._publish(camera_handler.CameraOutput(None, gesture, None))
+        received = [pipeline._queue.get_nowait().gesture for _ in range(2)]
+        await pipeline.stop()
+        return pipeline.dropped_outputs, received
+
+    dropped, received = asyncio.run(publish_all())
+    assert dropped == 1
+    assert received == [Gesture.VICTORY, Gesture.POINTING]
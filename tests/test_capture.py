@@ -0,0 +1,54 @@
+import threading
+
+import numpy as np
+
+from app.capture import FrameGrabber, LatestFrameSlot, RateMeter
+
+
+def test_slot_returns_latest_frame_and_counts_drops():
+    slot = LatestFrameSlot()
+    first, second = np.zeros(1, np.uint8), np.ones(1, np.uint8)
+    slot.put(first)
+    slot.put(second)
+    assert slot.take() is second
+    assert slot.take() is None
+    assert slot.dropped_frames == 1
+
+
+def test_rate_meter():
+    meter = RateMeter(window=5)
+    assert meter.rate == 0.0
+    for i in range(5):
+        meter.tick(i * 0.1)
+    assert meter.rate == 10.0
+
+
+def test_grabber_delivers_frames_and_stops_on_failure():
+    frames = [np.full(1, i, np.uint8) for i in range(3)]
+    delivered = threading.Event()
+
+    def read():
+        if frames:
+            return True, frames.pop(0)
+        delivered.set()
+        return False, None
+
+    grabber = FrameGrabber(read)
+    grabber.start()
+    assert delivered.wait(1.0)
+    grabber.stop()
+    assert grabber.failed
+    assert grabber.take()[0] == 2
+    assert grabber.slot.dropped_frames == 2
+
+
+def test_grabber_marks_failure_when_read_raises():
+    def read():
+        raise RuntimeError('device unplugged')
+
+    grabber = FrameGrabber(read)
+    grabber.start()
+    assert grabber.slot.wait(1.0)
+    grabber.stop()
+    assert grabber.failed
+    assert grabber.take() is None
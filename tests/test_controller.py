@@ -0,0 +1,61 @@
+import dataclasses
+
+import mediapipe as mp
+
+import camera_handler
+from app.config import ANIMATION_CONFIG, CameraConfig
+from app.controller import AppController
+from app.software_renderer import SoftwareView
+from app.state import AppState, Gesture
+from app.synthetic import SyntheticHands, make_gesture_hand
+
+
+def test_handler_marks_repeated_output_as_stale(monkeypatch):
+    config = CameraConfig(source='synthetic', source_realtime=False, threaded_capture=True)
+    monkeypatch.setattr(camera_handler, 'CAMERA_CONFIG', config)
+    hands = SyntheticHands([make_gesture_hand(Gesture.POINTING)])
+    monkeypatch.setattr(mp.solutions.hands, 'Hands', lambda **_kwargs: hands)
+    handler = camera_handler.CameraHandler()
+    try:
+        assert handler.wait_for_frame(1.0)
+        first = handler.process_frame()
+        # Wątek kamery nie dostarczył nowej klatki
+        monkeypatch.setattr(handler._grabber, 'take', lambda: None)
+        repeated = handler.process_frame()
+    finally:
+        handler.release()
+    assert first.fresh
+    assert first.gesture is Gesture.POINTING
+    assert not repeated.fresh
+    assert repeated.gesture is Gesture.POINTING
+
+
+def test_stale_outputs_do_not_vote_for_gestures():
+    state = AppState()
+    controller = AppController(state, SoftwareView(32, 32), lambda: None, clock=lambda: 0.0)
+    fresh = camera_handler.CameraOutput(
+        frame=None,
+        gesture=Gesture.POINTING,
+        coords=(0.5, 0.5),
+        landmarks=make_gesture_hand(Gesture.POINTING),
+    )
+    color_index = state.color_index
+
+    controller.process_gestures(fresh)
+    for _ in range(5):
+        controller.process_gestures(fresh._replace(fresh=False))
+    assert state.color_index == color_index
+
+    controller.process_gestures(fresh)
+    controller.process_gestures(fresh)
+    assert state.color_index != color_index
+
+
+def test_animation_uses_injected_config():
+    state = AppState()
+    config = dataclasses.replace(ANIMATION_CONFIG, smoothing_factor=1.0)
+    controller = AppController(state, SoftwareView(32, 32), lambda: None, config=config)
+    state.target_angle_x, state.target_angle_y = 40.0, -25.0
+
+    controller.animate(0.001)
+    assert (state.angle_x, state.angle_y) == (40.0, -25.0)
@@ -0,0 +1,94 @@
+import cv2
+import mediapipe as mp
+import numpy as np
+import pytest
+
+import camera_handler
+from app.config import CameraConfig
+from app.frame_sources import (
+    ImageDirectorySource,
+    SyntheticSource,
+    VideoFileSource,
+    create_frame_source,
+)
+from app.state import Gesture
+from app.synthetic import SyntheticHands
+
+
+@pytest.fixture
+def image_dir(tmp_path):
+    for i in range(3):
+        cv2.imwrite(str(tmp_path / f'{i:03d}.png'), np.full((24, 32, 3), i * 50, np.uint8))
+    return tmp_path
+
+
+def test_synthetic_source_produces_moving_frames():
+    source = SyntheticSource(64, 48, fps=0.0, realtime=False)
+    assert source.open()
+    first, second = source.read()[1], source.read()[1]
+    assert first.shape == (48, 64, 3) and first.dtype == np.uint8
+    assert not np.array_equal(first, second)
+    assert not source.finished
+
+
+def test_image_directory_source_plays_in_order_and_finishes(image_dir):
+    source = ImageDirectorySource(image_dir, fps=0.0, realtime=False, loop=False)
+    assert source.open()
+    values = [int(source.read()[1][0, 0, 0]) for _ in range(3)]
+    assert values == [0, 50, 100]
+    assert source.finished
+    assert source.read() == (False, None)
+
+
+def test_image_directory_source_loops(image_dir):
+    source = ImageDirectorySource(image_dir, fps=0.0, realtime=False, loop=True)
+    assert source.open()
+    values = [int(source.read()[1][0, 0, 0]) for _ in range(4)]
+    assert values == [0, 50, 100, 0]
+    assert not source.finished
+
+
+def test_image_directory_source_skips_unreadable_images(image_dir):
+    (image_dir / '001.png').write_bytes(b'not an image')
+    source = ImageDirectorySource(image_dir, fps=0.0, realtime=False, loop=True)
+    assert source.open()
+    values = [int(source.read()[1][0, 0, 0]) for _ in range(3)]
+    assert values == [0, 100, 0]
+
+
+def test_video_file_source_reads_until_end(tmp_path):
+    path = tmp_path / 'clip.avi'
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*'MJPG'), 30.0, (32, 24))
+    for i in range(4):
+        writer.write(np.full((24, 32, 3), i * 60, np.uint8))
+    writer.release()
+
+    source = VideoFileSource(path, realtime=False, loop=False)
+    assert source.open()
+    frames = []
+    while (frame := source.read()[1]) is not None:
+        frames.append(frame)
+    assert len(frames) == 4
+    assert source.finished
+
+
+def test_create_frame_source_rejects_unknown_kind():
+    with pytest.raises(ValueError):
+        create_frame_source(CameraConfig(source='webcam'))
+
+
+def test_handler_reports_end_of_finite_source(monkeypatch, image_dir):
+    config = CameraConfig(
+        source='images', source_path=str(image_dir), source_realtime=False,
+        source_loop=False, threaded_capture=False,
+    )
+    monkeypatch.setattr(camera_handler, 'CAMERA_CONFIG', config)
+    monkeypatch.setattr(mp.solutions.hands, 'Hands', lambda **_kwargs: SyntheticHands())
+    handler = camera_handler.CameraHandler()
+
+    outputs = [handler.process_frame() for _ in range(4)]
+
+    assert [o.gesture for o in outputs[:3]] == [Gesture.NO_HAND] * 3
+    assert outputs[3].gesture is Gesture.NO_CAMERA
+    assert handler.source_finished
+    assert handler.process_frame().gesture is Gesture.NO_CAMERA
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from mediapipe.framework.formats.landmark_pb2 import NormalizedLandmark
+
+from app.gesture_recognizer import (
+    FINGER_BENT,
+    FINGER_STRAIGHT,
+    FINGER_UNKNOWN,
+    GESTURES,
+    MASK_WEIGHTS,
+    GestureRecognizer,
+    compile_gesture_table,
+    fill_landmark_array,
+)
+from app.state import Gesture
+from app.synthetic import GESTURE_POSES, make_hand
+
+
+@pytest.mark.parametrize('gesture', list(GESTURE_POSES))
+def test_recognize_poses(gesture):
+    recognizer = GestureRecognizer()
+    assert recognizer.recognize(make_hand(GESTURE_POSES[gesture])) is gesture
+
+
+def test_recognize_unknown_pose():
+    recognizer = GestureRecognizer()
+    assert recognizer.recognize(make_hand((True, True, False, True, False))) is Gesture.UNKNOWN
+
+
+def test_recognize_empty_landmarks():
+    assert GestureRecognizer().recognize([]) is Gesture.UNKNOWN
+
+
+def test_recognize_protobuf_landmarks():
+    hand = make_hand(GESTURE_POSES[Gesture.VICTORY])
+    landmarks = [NormalizedLandmark(x=x, y=y, z=z) for x, y, z in hand]
+    assert GestureRecognizer().recognize(landmarks) is Gesture.VICTORY
+
+
+def test_recognize_batch_matches_single():
+    recognizer = GestureRecognizer()
+    batch = np.stack([make_hand(pose) for pose in GESTURE_POSES.values()])
+    codes = recognizer.recognize_batch(batch)
+    assert codes.shape == (len(GESTURE_POSES),)
+    assert [GESTURES[c] for c in codes] == list(GESTURE_POSES)
+
+
+def test_degenerate_hand_is_fist():
+    # Wszystkie punkty w jednym miejscu dają kąty 0 stopni, czyli zgięte palce
+    assert GestureRecognizer().recognize(np.zeros((21, 3))) is Gesture.FIST
+
+
+def test_fill_landmark_array_reuses_buffer():
+    hand = make_hand(GESTURE_POSES[Gesture.POINTING])
+    landmarks = [NormalizedLandmark(x=x, y=y, z=z) for x, y, z in hand]
+    buffer = np.zeros((21, 3), dtype=np.float32)
+    result = fill_landmark_array(landmarks, buffer)
+    assert result is buffer
+    np.testing.assert_allclose(buffer, hand, atol=1e-6)
+    assert GestureRecognizer().recognize(buffer) is Gesture.POINTING
+
+
+def test_compile_gesture_table_priority_and_any():
+    table = compile_gesture_table({
+        'POINTING': ('any', 'straight', 'bent', 'bent', 'bent'),
+        'FIST': ('bent', 'bent', 'bent', 'bent', 'bent'),
+        'OPEN_HAND': ('any', 'straight', 'any', 'any', 'any'),
+    })
+    states = np.array([
+        [FINGER_STRAIGHT, FINGER_STRAIGHT, FINGER_BENT, FINGER_BENT, FINGER_BENT],
+        [FINGER_BENT] * 5,
+        [FINGER_UNKNOWN, FINGER_STRAIGHT, FINGER_UNKNOWN, FINGER_STRAIGHT, FINGER_BENT],
+        [FINGER_STRAIGHT, FINGER_BENT, FINGER_BENT, FINGER_BENT, FINGER_BENT],
+    ], dtype=np.int8)
+    gestures = [GESTURES[c] for c in table[states @ MASK_WEIGHTS]]
+    assert gestures == [Gesture.POINTING, Gesture.FIST, Gesture.OPEN_HAND, Gesture.UNKNOWN]
+
+
+@pytest.mark.parametrize('definitions', [
+    {'WAVE': ('straight',) * 5},
+    {'FIST': ('bent',) * 4},
+    {'FIST': ('bent', 'bent', 'curled', 'bent', 'bent')},
+])
+def test_compile_gesture_table_rejects_invalid_definitions(definitions):
+    with pytest.raises(ValueError):
+        compile_gesture_table(definitions)
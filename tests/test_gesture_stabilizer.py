@@ -0,0 +1,105 @@
+import pytest
+
+from app.config import AnimationConfig
+from app.gesture_stabilizer import GestureStabilizer, SwipeDetector
+from app.state import Gesture
+from app.synthetic import make_gesture_hand
+
+FRAME_S = 1 / 30
+
+
+def feed(stabilizer, gestures, start=0.0):
+    hand = make_gesture_hand(Gesture.FIST)
+    return [
+        stabilizer.update(gesture, hand, start + i * FRAME_S) for i, gesture in enumerate(gestures)
+    ]
+
+
+def test_gesture_becomes_stable_after_enter_votes():
+    stabilizer = GestureStabilizer(AnimationConfig())
+    events = feed(stabilizer, [Gesture.POINTING] * 4)
+    assert events == [None, None, Gesture.POINTING, None]
+    assert stabilizer.stable_gesture is Gesture.POINTING
+    assert stabilizer.votes(Gesture.POINTING) == 4
+
+
+def test_short_flicker_does_not_change_stable_gesture():
+    stabilizer = GestureStabilizer(AnimationConfig())
+    feed(stabilizer, [Gesture.POINTING] * 5)
+    events = feed(stabilizer, [Gesture.UNKNOWN, Gesture.UNKNOWN, Gesture.POINTING], start=1.0)
+    assert events == [None, None, None]
+    assert stabilizer.stable_gesture is Gesture.POINTING
+
+
+def test_exit_threshold_holds_current_gesture():
+    config = AnimationConfig(gesture_enter_votes=2, gesture_exit_votes=2)
+    stabilizer = GestureStabilizer(config)
+    feed(stabilizer, [Gesture.FIST] * 5)
+    # VICTORY ma już dość głosów, ale FIST wciąż ma co najmniej dwa
+    events = feed(stabilizer, [Gesture.VICTORY] * 4, start=1.0)
+    assert events == [None, None, None, Gesture.VICTORY]
+
+
+def test_invalid_votes_are_rejected():
+    with pytest.raises(ValueError):
+        GestureStabilizer(AnimationConfig(gesture_enter_votes=6))
+
+
+def test_swipe_detection_and_cooldown():
+    detector = SwipeDetector(history_length=8, min_distance=0.25, min_speed=1.0, cooldown_s=0.5)
+    events = []
+    for i in range(8):
+        hand = make_gesture_hand(Gesture.FIST, wrist=(0.2 + 0.06 * i, 0.5))
+        events.append(detector.update(hand, i * FRAME_S))
+    assert events.count(Gesture.SWIPE_RIGHT) == 1
+    assert set(events) == {None, Gesture.SWIPE_RIGHT}
+
+
+@pytest.mark.parametrize(
+    ('step', 'expected'),
+    [
+        ((-0.06, 0.0), Gesture.SWIPE_LEFT),
+        ((0.0, -0.06), Gesture.SWIPE_UP),
+        ((0.0, 0.06), Gesture.SWIPE_DOWN),
+    ],
+)
+def test_swipe_directions(step, expected):
+    detector = SwipeDetector(history_length=8, min_distance=0.25, min_speed=1.0, cooldown_s=0.5)
+    events = [
+        detector.update(
+            make_gesture_hand(Gesture.FIST, wrist=(0.5 + step[0] * i, 0.5 + step[1] * i)),
+            i * FRAME_S,
+        )
+        for i in range(8)
+    ]
+    assert expected in events
+
+
+def test_slow_or_diagonal_motion_is_not_a_swipe():
+    detector = SwipeDetector(history_length=8, min_distance=0.25, min_speed=1.0, cooldown_s=0.5)
+    slow = [
+        detector.update(make_gesture_hand(Gesture.FIST, wrist=(0.2 + 0.06 * i, 0.5)), i * 0.5)
+        for i in range(8)
+    ]
+    detector.reset()
+    diagonal = [
+        detector.update(
+            make_gesture_hand(Gesture.FIST, wrist=(0.2 + 0.06 * i, 0.2 + 0.06 * i)), i * FRAME_S
+        )
+        for i in range(8)
+    ]
+    assert set(slow) == {None}
+    assert set(diagonal) == {None}
+
+
+def test_open_hand_motion_rotates_instead_of_swiping():
+    stabilizer = GestureStabilizer(AnimationConfig())
+    events = [
+        stabilizer.update(
+            Gesture.OPEN_HAND,
+            make_gesture_hand(Gesture.OPEN_HAND, wrist=(0.2 + 0.06 * i, 0.5)),
+            i * FRAME_S,
+        )
+        for i in range(10)
+    ]
+    assert events == [None, None, Gesture.OPEN_HAND] + [None] * 7
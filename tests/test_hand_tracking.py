@@ -0,0 +1,38 @@
+import numpy as np
+
+from app.hand_tracking import HandTracker
+
+
+def test_new_hands_get_consecutive_ids():
+    tracker = HandTracker(max_distance=0.1)
+    ids = tracker.update(np.array([[0.2, 0.5], [0.8, 0.5]]))
+    assert ids.tolist() == [0, 1]
+
+
+def test_ids_follow_hands_when_order_changes():
+    tracker = HandTracker(max_distance=0.1)
+    tracker.update(np.array([[0.2, 0.5], [0.8, 0.5]]))
+    ids = tracker.update(np.array([[0.79, 0.52], [0.22, 0.48]]))
+    assert ids.tolist() == [1, 0]
+
+
+def test_hand_too_far_gets_new_id():
+    tracker = HandTracker(max_distance=0.1)
+    tracker.update(np.array([[0.2, 0.5]]))
+    ids = tracker.update(np.array([[0.6, 0.5]]))
+    assert ids.tolist() == [1]
+
+
+def test_lost_hand_id_is_not_reused():
+    tracker = HandTracker(max_distance=0.1)
+    tracker.update(np.array([[0.2, 0.5], [0.8, 0.5]]))
+    tracker.update(np.array([[0.8, 0.5]]))
+    ids = tracker.update(np.array([[0.8, 0.5], [0.2, 0.5]]))
+    assert ids.tolist() == [1, 2]
+
+
+def test_reset_forgets_tracks():
+    tracker = HandTracker(max_distance=0.1)
+    tracker.update(np.array([[0.2, 0.5]]))
+    tracker.reset()
+    assert tracker.update(np.array([[0.2, 0.5]])).tolist() == [1]
@@ -0,0 +1,54 @@
+import time
+from functools import partial
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from app.config import CameraConfig, GestureConfig
+from app.gesture_recognizer import GESTURES
+from app.inference_worker import InferenceProcess, SharedFrameRing
+from app.state import Gesture
+from app.synthetic import SyntheticHands, make_gesture_hand
+
+
+def test_ring_slots_are_shared_between_handles():
+    ring = SharedFrameRing((4, 6, 3), slots=2)
+    try:
+        ring.slot(1)[...] = 7
+        attached = SharedFrameRing((4, 6, 3), slots=2, name=ring.name)
+        try:
+            assert np.all(attached.slot(1) == 7)
+            assert np.all(attached.slot(0) == 0)
+        finally:
+            attached.close()
+    finally:
+        ring.close()
+
+
+def test_worker_process_runs_frames_and_cleans_up():
+    hand = make_gesture_hand(Gesture.POINTING)
+    worker = InferenceProcess(
+        (8, 8, 3), CameraConfig(), GestureConfig(), hands_factory=partial(SyntheticHands, [hand])
+    )
+    ring_name = worker.ring.name
+    try:
+        slot, frame = worker.acquire_slot()
+        frame[...] = 0
+        frame_id = worker.submit(slot)
+
+        deadline = time.monotonic() + 30.0
+        result = worker.poll()
+        while result is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+            result = worker.poll()
+    finally:
+        worker.close()
+
+    assert result is not None
+    assert result.frame_id == frame_id
+    np.testing.assert_allclose(result.landmarks[0], hand, atol=1e-6)
+    assert GESTURES[result.gestures[0]] is Gesture.POINTING
+    assert not worker.is_alive
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=ring_name)
@@ -0,0 +1,51 @@
+import cv2
+import numpy as np
+
+from app.landmark_flow import LandmarkPropagator
+from app.state import Gesture
+from app.synthetic import make_gesture_hand
+
+
+def _textured_frame(shift_x=0):
+    rng = np.random.default_rng(1)
+    noise = rng.integers(0, 256, (240, 320), dtype=np.uint8)
+    texture = cv2.GaussianBlur(noise, (7, 7), 0)
+    return np.roll(texture, shift_x, axis=1)
+
+
+def test_propagate_follows_image_motion():
+    propagator = LandmarkPropagator(budget_ms=5.0, max_interval=4, motion_threshold=0.5)
+    landmarks = make_gesture_hand(Gesture.OPEN_HAND)[np.newaxis].copy()
+    expected = landmarks.copy()
+    propagator.record_detection(_textured_frame(), landmarks, elapsed_s=0.02)
+
+    propagated = propagator.propagate(_textured_frame(shift_x=4), landmarks)
+
+    assert propagated.shape == (1, 21, 3)
+    np.testing.assert_allclose(propagated[0, :, 0], expected[0, :, 0] + 4 / 320, atol=2e-3)
+    np.testing.assert_allclose(propagated[0, :, 1:], expected[0, :, 1:], atol=2e-3)
+
+
+def test_fast_motion_forces_detection():
+    propagator = LandmarkPropagator(budget_ms=5.0, max_interval=4, motion_threshold=0.005)
+    landmarks = make_gesture_hand(Gesture.FIST)[np.newaxis].copy()
+    propagator.record_detection(_textured_frame(), landmarks, elapsed_s=0.02)
+    assert not propagator.should_detect()
+    propagator.propagate(_textured_frame(shift_x=4), landmarks)
+    assert propagator.should_detect()
+
+
+def test_interval_follows_budget():
+    propagator = LandmarkPropagator(budget_ms=5.0, max_interval=6, motion_threshold=0.1)
+    empty = np.empty((0, 21, 3), dtype=np.float32)
+    propagator.record_detection(_textured_frame(), empty, elapsed_s=0.017)
+    # Bez pomiaru propagacji: ceil(17 / 5) = 4
+    assert propagator.interval == 4
+    for _ in range(3):
+        assert not propagator.should_detect()
+        assert len(propagator.propagate(_textured_frame(), empty)) == 0
+    assert propagator.should_detect()
+
+    cheap = LandmarkPropagator(budget_ms=20.0, max_interval=6, motion_threshold=0.1)
+    cheap.record_detection(_textured_frame(), empty, elapsed_s=0.017)
+    assert cheap.interval == 1
@@ -0,0 +1,67 @@
+import csv
+import json
+
+import pytest
+
+from app.latency import NULL_SPAN, STAGE_DRAW, STAGE_INFERENCE, LatencyTracker, StageStats
+
+
+def test_disabled_tracker_records_nothing():
+    tracker = LatencyTracker()
+    assert tracker.span(STAGE_INFERENCE) is NULL_SPAN
+    with tracker.span(STAGE_INFERENCE):
+        pass
+    tracker.record(STAGE_DRAW, 0.01)
+    assert tracker.summaries() == {}
+
+
+def test_span_records_duration():
+    tracker = LatencyTracker()
+    tracker.enable()
+    with tracker.span(STAGE_INFERENCE):
+        pass
+    summary = tracker.summaries()[STAGE_INFERENCE]
+    assert summary.samples == 1
+    assert 0.0 <= summary.p50_ms < 100.0
+
+
+def test_percentiles_use_rolling_window():
+    stats = StageStats(window=100)
+    for _ in range(100):
+        stats.record(1.0)
+    for i in range(100):
+        stats.record((i + 1) / 1000.0)
+    summary = stats.summary()
+    assert summary.samples == 200
+    assert summary.max_ms == pytest.approx(100.0)
+    assert summary.p50_ms == pytest.approx(50.5)
+    assert summary.p99_ms == pytest.approx(99.01)
+
+
+def test_overlay_lists_stages():
+    tracker = LatencyTracker()
+    tracker.enable()
+    tracker.record(STAGE_INFERENCE, 0.008)
+    tracker.record(STAGE_DRAW, 0.002)
+    assert tracker.format_overlay() == (
+        'p50/p95/p99 ms: inference 8.0/8.0/8.0, draw 2.0/2.0/2.0'
+    )
+
+
+def test_export_appends_csv_and_json(tmp_path):
+    tracker = LatencyTracker()
+    tracker.enable()
+    tracker.record(STAGE_INFERENCE, 0.004)
+    csv_path, json_path = tmp_path / 'latency.csv', tmp_path / 'latency.jsonl'
+
+    for _ in range(2):
+        tracker.export(csv_path)
+        tracker.export(json_path)
+
+    with csv_path.open(encoding='utf-8', newline='') as report_file:
+        rows = list(csv.DictReader(report_file))
+    assert [row['stage'] for row in rows] == [STAGE_INFERENCE] * 2
+    assert float(rows[0]['p95_ms']) == 4.0
+    entries = [json.loads(line) for line in json_path.read_text(encoding='utf-8').splitlines()]
+    assert len(entries) == 2
+    assert entries[0]['stages'][STAGE_INFERENCE]['samples'] == 1
@@ -0,0 +1,19 @@
+from app.latency_harness import ScriptStep, measure
+from app.state import Gesture
+
+
+def test_pointing_latency_is_measured_per_step():
+    script = (
+        ScriptStep(Gesture.NO_HAND, 0.3),
+        ScriptStep(Gesture.POINTING, 0.5),
+        ScriptStep(Gesture.FIST, 0.5),
+    )
+    results = measure(script, repeats=3)
+    pointing = results[Gesture.POINTING]
+    assert pointing.missed == 0
+    assert len(pointing.action_ms) == len(pointing.photon_ms) == 3
+    assert all(0.0 < action <= 200.0 for action in pointing.action_ms)
+    pairs = zip(pointing.action_ms, pointing.photon_ms, strict=True)
+    assert all(photon >= action for action, photon in pairs)
+    # Zatrzymanie obrotu nie zmienia obrazu, więc nie ma opóźnienia "do obrazu"
+    assert results[Gesture.FIST].photon_ms == []
@@ -0,0 +1,21 @@
+import numpy as np
+import pytest
+
+from app.meshes import SHAPE_MESHES, face_normals, get_mesh
+
+
+@pytest.mark.parametrize('shape', list(SHAPE_MESHES))
+def test_face_normals_point_outwards(shape):
+    mesh = get_mesh(shape)
+    centroids = mesh.polygons().mean(axis=1)
+    assert mesh.vertices.dtype == np.float32 and mesh.faces.dtype == np.int32
+    assert np.all((face_normals(mesh) * centroids).sum(axis=1) > 0)
+
+
+def test_get_mesh_is_built_once():
+    assert get_mesh('SPHERE') is get_mesh('SPHERE')
+
+
+def test_get_mesh_rejects_unknown_shape():
+    with pytest.raises(ValueError):
+        get_mesh('TORUS')
@@ -0,0 +1,131 @@
+import os
+
+import numpy as np
+import pytest
+
+from app import meshes
+from app.meshes import Mesh, decimate, face_normals, sphere_mesh
+from app.model_loader import STL_RECORD, load_model, load_obj, load_stl
+
+CUBE_OBJ = '''# cube with quads and negative indices
+v 0 0 0
+v 2 0 0
+v 2 2 0
+v 0 2 0
+v 0 0 2
+v 2 0 2
+v 2 2 2
+v 0 2 2
+f 1 4 3 2
+f 5/1 6/1 7/1 8/1
+f 1//1 2//1 6//1 5//1
+f 3 4 8 7
+f 1 5 8 4
+f -7 -6 -2 -3
+'''
+
+
+def _write_binary_stl(path, triangles):
+    records = np.zeros(len(triangles), STL_RECORD)
+    records['vertices'] = triangles
+    with path.open('wb') as stl_file:
+        stl_file.write(b'\0' * 80 + np.uint32(len(triangles)).tobytes() + records.tobytes())
+
+
+def _dense_sphere(u_steps, v_steps):
+    mesh = sphere_mesh(u_steps, v_steps)
+    quads = mesh.faces
+    return Mesh(mesh.vertices, np.concatenate([quads[:, [0, 1, 2]], quads[:, [0, 2, 3]]]))
+
+
+def test_load_obj_triangulates_polygons(tmp_path):
+    path = tmp_path / 'cube.obj'
+    path.write_text(CUBE_OBJ)
+    mesh = load_obj(path)
+    assert mesh.vertices.shape == (8, 3) and mesh.faces.shape == (12, 3)
+    assert mesh.faces.max() == 7
+
+
+def test_load_stl_binary_and_ascii_merge_shared_vertices(tmp_path):
+    triangles = np.array(
+        [[[0, 0, 0], [1, 0, 0], [0, 1, 0]], [[1, 0, 0], [1, 1, 0], [0, 1, 0]]], np.float32
+    )
+    binary_path = tmp_path / 'quad.stl'
+    _write_binary_stl(binary_path, triangles)
+    ascii_path = tmp_path / 'quad_ascii.stl'
+    facets = ''.join(
+        'facet normal 0 0 1\nouter loop\n'
+        + ''.join(f'vertex {x} {y} {z}\n' for x, y, z in triangle)
+        + 'endloop\nendfacet\n'
+        for triangle in triangles
+    )
+    ascii_path.write_text(f'solid quad\n{facets}endsolid quad\n')
+
+    for path in (binary_path, ascii_path):
+        mesh = load_stl(path)
+        assert mesh.vertices.shape == (4, 3) and mesh.faces.shape == (2, 3)
+        assert np.array_equal(mesh.vertices[mesh.faces], triangles)
+
+
+def test_decimate_reduces_faces_and_keeps_shape():
+    dense = _dense_sphere(120, 80)
+    simplified = decimate(dense, 2000)
+    assert 200 < len(simplified.faces) <= 2000
+    radius = np.linalg.norm(simplified.vertices, axis=1)
+    assert np.all(np.abs(radius - 0.5) < 0.05)
+    centroids = simplified.polygons().mean(axis=1)
+    assert np.mean((face_normals(simplified) * centroids).sum(axis=1) > 0) > 0.95
+
+
+def test_load_model_normalizes_and_uses_memory_mapped_cache(tmp_path):
+    path = tmp_path / 'cube.obj'
+    path.write_text(CUBE_OBJ)
+    cache_dir = tmp_path / 'cache'
+
+    first = load_model(path, 5000, cache_dir)
+    assert np.allclose(first.vertices.min(axis=0), -0.5)
+    assert np.allclose(first.vertices.max(axis=0), 0.5)
+
+    cached = load_model(path, 5000, cache_dir)
+    assert isinstance(cached.vertices, np.memmap)
+    assert np.array_equal(cached.faces, first.faces)
+
+    path.write_text(CUBE_OBJ + 'f 1 2 3\n')
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert len(load_model(path, 5000, cache_dir).faces) == 13
+    assert len(list(cache_dir.glob('*.npy'))) == 2
+
+
+def test_models_with_the_same_name_have_separate_cache_entries(tmp_path):
+    cache_dir = tmp_path / 'cache'
+    paths = [tmp_path / 'a' / 'chair.obj', tmp_path / 'b' / 'chair.obj', tmp_path / 'chair_2.obj']
+    for extra_faces, path in enumerate(paths):
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(CUBE_OBJ + 'f 1 2 3\n' * extra_faces)
+    for path in paths:
+        load_model(path, 5000, cache_dir)
+    assert len(list(cache_dir.glob('*.npy'))) == 2 * len(paths)
+
+    cached = [load_model(path, 5000, cache_dir) for path in paths]
+    assert all(isinstance(mesh.faces, np.memmap) for mesh in cached)
+    assert [len(mesh.faces) for mesh in cached] == [12, 13, 14]
+
+
+def test_load_model_rejects_unknown_format(tmp_path):
+    path = tmp_path / 'model.ply'
+    path.write_text('ply\n')
+    with pytest.raises(ValueError):
+        load_model(path, 5000, tmp_path)
+
+
+def test_get_mesh_loads_configured_model(tmp_path, monkeypatch):
+    path = tmp_path / 'cube.obj'
+    path.write_text(CUBE_OBJ)
+    monkeypatch.setitem(meshes.OBJECT_CONFIG.model_paths, 'PRODUCT', str(path))
+    monkeypatch.setattr('app.model_loader.MODEL_CACHE_DIR', tmp_path / 'cache')
+    meshes.get_mesh.cache_clear()
+    try:
+        assert meshes.get_mesh('PRODUCT').faces.shape == (12, 3)
+    finally:
+        meshes.get_mesh.cache_clear()
@@ -0,0 +1,53 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from app.preview import VideoPreview, fit_size
+
+
+class FakeLabel:
+    def __init__(self):
+        self.bindings = {}
+
+    def configure(self, **_options):
+        pass
+
+    def bind(self, sequence, callback):
+        self.bindings[sequence] = callback
+
+    def resize(self, width, height):
+        self.bindings['<Configure>'](SimpleNamespace(width=width, height=height))
+
+
+def test_fit_size_keeps_aspect_ratio():
+    assert fit_size((640, 480), (320, 480)) == (320, 240)
+    assert fit_size((640, 480), (1000, 600)) == (800, 600)
+
+
+def test_prepare_scales_into_reused_buffer_after_configure():
+    label = FakeLabel()
+    preview = VideoPreview(label)
+    frame = np.full((480, 640, 3), 200, np.uint8)
+    assert preview.prepare(frame, now=0.0) is frame
+
+    label.resize(320, 400)
+    first = preview.prepare(frame, now=1.0)
+    second = preview.prepare(frame, now=2.0)
+    assert first.shape == (240, 320, 3)
+    assert second is first
+    assert np.all(first == 200)
+
+
+def test_prepare_ignores_unlaid_out_label():
+    label = FakeLabel()
+    preview = VideoPreview(label)
+    label.resize(1, 1)
+    frame = np.zeros((48, 64, 3), np.uint8)
+    assert preview.prepare(frame, now=0.0) is frame
+
+
+def test_prepare_throttles_refresh():
+    preview = VideoPreview(FakeLabel(), max_fps=10.0)
+    frame = np.zeros((48, 64, 3), np.uint8)
+    shown = [preview.prepare(frame, now=t * 0.04) is not None for t in range(6)]
+    assert shown == [True, False, False, True, False, False]
@@ -0,0 +1,99 @@
+import random
+import time
+
+import mediapipe as mp
+import numpy as np
+
+import camera_handler
+from app.config import CameraConfig
+from app.reconnect import ReconnectSupervisor, backoff_delay
+from app.state import CameraStatus, Gesture
+from app.synthetic import SyntheticHands
+
+FAST_RECONNECT = {
+    'reconnect_initial_delay_s': 0.001,
+    'reconnect_max_delay_s': 0.004,
+    'reconnect_max_attempts': 3,
+}
+
+
+class FakeSource:
+    def __init__(self, devices):
+        self.devices = devices
+
+    @property
+    def finished(self):
+        return False
+
+    def open(self):
+        return self.devices['plugged']
+
+    def read(self):
+        if not self.devices['plugged']:
+            return False, None
+        return True, np.zeros((48, 64, 3), np.uint8)
+
+    def release(self):
+        pass
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        assert time.perf_counter() < deadline
+        time.sleep(0.001)
+
+
+def test_backoff_grows_exponentially_and_is_capped():
+    config = CameraConfig(
+        reconnect_initial_delay_s=0.5, reconnect_max_delay_s=3.0, reconnect_jitter=0.0
+    )
+    rng = random.Random(0)
+    assert [backoff_delay(i, config, rng) for i in range(4)] == [0.5, 1.0, 2.0, 3.0]
+
+
+def test_backoff_jitter_stays_within_bounds():
+    config = CameraConfig(reconnect_initial_delay_s=1.0, reconnect_jitter=0.2)
+    rng = random.Random(0)
+    delays = [backoff_delay(0, config, rng) for _ in range(200)]
+    assert min(delays) >= 0.8 and max(delays) <= 1.2
+    assert len(set(delays)) > 1
+
+
+def test_supervisor_reports_failed_then_available():
+    devices = {'plugged': False}
+    supervisor = ReconnectSupervisor(
+        lambda: FakeSource(devices) if devices['plugged'] else None,
+        CameraConfig(**FAST_RECONNECT),
+    )
+    supervisor.start()
+    assert supervisor.take_source() is None
+    _wait_for(lambda: supervisor.status is CameraStatus.FAILED)
+
+    devices['plugged'] = True
+    _wait_for(lambda: supervisor.status is CameraStatus.AVAILABLE)
+    assert isinstance(supervisor.take_source(), FakeSource)
+    assert supervisor.take_source() is None
+    supervisor.stop()
+
+
+def test_handler_reconnects_in_background_and_keeps_hands_model(monkeypatch):
+    devices = {'plugged': True}
+    config = CameraConfig(threaded_capture=False, **FAST_RECONNECT)
+    monkeypatch.setattr(camera_handler, 'CAMERA_CONFIG', config)
+    monkeypatch.setattr(camera_handler, 'create_frame_source', lambda _config: FakeSource(devices))
+    monkeypatch.setattr(mp.solutions.hands, 'Hands', lambda **_kwargs: SyntheticHands())
+    handler = camera_handler.CameraHandler()
+    hands = handler.hands
+    assert handler.process_frame().gesture is Gesture.NO_HAND
+
+    devices['plugged'] = False
+    assert handler.process_frame().gesture is Gesture.ERROR
+    assert handler.process_frame().gesture is Gesture.NO_CAMERA
+    assert handler.camera_status in (CameraStatus.RECONNECTING, CameraStatus.FAILED)
+
+    devices['plugged'] = True
+    _wait_for(lambda: handler.process_frame().gesture is Gesture.NO_HAND)
+    assert handler.camera_status is CameraStatus.AVAILABLE
+    assert handler.hands is hands
+    handler.release()
@@ -0,0 +1,35 @@
+from app.render_scheduler import RenderScheduler
+from app.state import AppState
+
+
+def test_first_frame_is_always_drawn():
+    assert RenderScheduler(0.1).needs_redraw(AppState())
+
+
+def test_idle_scene_is_not_redrawn():
+    scheduler = RenderScheduler(0.1)
+    state = AppState()
+    scheduler.mark_drawn(state)
+    state.angle_y += 0.05
+    assert not scheduler.needs_redraw(state)
+    assert scheduler.skipped_frames == 1
+
+
+def test_small_steps_accumulate_until_redraw():
+    scheduler = RenderScheduler(0.1)
+    state = AppState()
+    scheduler.mark_drawn(state)
+    for _ in range(3):
+        state.angle_x += 0.04
+    assert scheduler.needs_redraw(state)
+
+
+def test_shape_and_color_changes_force_redraw():
+    scheduler = RenderScheduler(0.1)
+    state = AppState()
+    scheduler.mark_drawn(state)
+    state.next_color()
+    assert scheduler.needs_redraw(state)
+    scheduler.mark_drawn(state)
+    state.next_shape()
+    assert scheduler.needs_redraw(state)
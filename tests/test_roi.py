@@ -0,0 +1,40 @@
+import numpy as np
+
+from app.roi import RegionOfInterest, RoiTracker, compute_roi, remap_landmarks
+from app.state import Gesture
+from app.synthetic import make_gesture_hand
+
+FRAME_SHAPE = (480, 640, 3)
+
+
+def test_compute_roi_contains_hand_with_padding():
+    hand = make_gesture_hand(Gesture.OPEN_HAND)[np.newaxis]
+    roi = compute_roi(hand, FRAME_SHAPE, padding=0.25)
+    pixels = hand[0, :, :2] * (640, 480)
+    assert roi.x0 < pixels[:, 0].min() and pixels[:, 0].max() < roi.x1
+    assert roi.y0 < pixels[:, 1].min() and pixels[:, 1].max() < roi.y1
+    assert roi.width == roi.height or roi.y1 == 480
+
+
+def test_compute_roi_skips_large_or_empty_regions():
+    assert compute_roi(np.empty((0, 21, 3)), FRAME_SHAPE, padding=0.5) is None
+    corners = np.array([[[0.05, 0.05, 0.0], [0.95, 0.95, 0.0]]])
+    assert compute_roi(corners, FRAME_SHAPE, padding=0.1) is None
+
+
+def test_remap_landmarks_to_full_frame():
+    roi = RegionOfInterest(100, 50, 300, 250)
+    landmarks = np.array([[[0.0, 0.0, 0.1], [0.5, 1.0, -0.2]]], dtype=np.float32)
+    remap_landmarks(landmarks, roi, FRAME_SHAPE)
+    np.testing.assert_allclose(landmarks[0, :, 0], [100 / 640, 200 / 640])
+    np.testing.assert_allclose(landmarks[0, :, 1], [50 / 480, 250 / 480])
+    np.testing.assert_allclose(landmarks[0, :, 2], [0.1 * 200 / 640, -0.2 * 200 / 640])
+
+
+def test_tracker_periodically_uses_full_frame():
+    tracker = RoiTracker(padding=0.5, full_frame_interval=2)
+    assert tracker.next_region() is None
+    tracker.update(make_gesture_hand(Gesture.FIST)[np.newaxis], FRAME_SHAPE)
+    assert tracker.next_region() is not None
+    assert tracker.next_region() is not None
+    assert tracker.next_region() is None
@@ -0,0 +1,54 @@
+import pytest
+
+from app.config import ANIMATION_CONFIG
+from app.controller import smoothing_step
+from app.scheduler import MultiRateScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_stages_run_at_their_own_rates():
+    clock = FakeClock()
+    scheduler = MultiRateScheduler(clock)
+    calls = {'fast': 0, 'slow': 0}
+    scheduler.add_stage('fast', 100.0, lambda _dt: calls.__setitem__('fast', calls['fast'] + 1))
+    scheduler.add_stage('slow', 25.0, lambda _dt: calls.__setitem__('slow', calls['slow'] + 1))
+
+    while clock.now < 0.2:
+        clock.now += scheduler.run_due()
+    assert calls == {'fast': 20, 'slow': 5}
+    assert scheduler.rates()['fast'] == pytest.approx(100.0)
+
+
+def test_late_ticks_are_coalesced_and_report_elapsed_time():
+    clock = FakeClock()
+    scheduler = MultiRateScheduler(clock)
+    elapsed = []
+    scheduler.add_stage('render', 10.0, elapsed.append)
+    scheduler.run_due()
+
+    clock.now = 0.35
+    delay = scheduler.run_due()
+    scheduler.run_due()
+
+    assert elapsed == [pytest.approx(0.1), pytest.approx(0.35)]
+    assert scheduler.stages['render'].coalesced_ticks == 2
+    assert delay == pytest.approx(0.05)
+
+
+def test_add_stage_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        MultiRateScheduler().add_stage('broken', 0.0, lambda _dt: None)
+
+
+def test_smoothing_does_not_depend_on_tick_rate():
+    one_step = smoothing_step(0.03, ANIMATION_CONFIG)
+    two_steps = 1.0 - (1.0 - smoothing_step(0.015, ANIMATION_CONFIG)) ** 2
+    assert one_step == pytest.approx(two_steps)
+    assert smoothing_step(0.015, ANIMATION_CONFIG) == pytest.approx(0.08)
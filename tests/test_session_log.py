@@ -0,0 +1,93 @@
+import time
+
+import numpy as np
+import pytest
+
+from app.config import AnimationConfig, CameraConfig
+from app.gesture_recognizer import GESTURE_CODES, GestureRecognizer
+from app.gesture_stabilizer import GestureStabilizer
+from app.session_log import RECORD_DTYPE, SessionLog, SessionRecorder, replay
+from app.state import Gesture
+from app.synthetic import make_gesture_hand
+
+FRAME_S = 1 / 30
+SCRIPT = [Gesture.NO_HAND] * 5 + [Gesture.POINTING] * 10 + [Gesture.FIST] * 10
+
+
+def record_session(path, gestures=SCRIPT, batch=4):
+    '''Zapisuje sesję tak, jak robi to AppController.process_gestures.'''
+    recognizer = GestureRecognizer()
+    stabilizer = GestureStabilizer(AnimationConfig())
+    # Zegar sesji zaczyna się od 10 s, jak perf_counter w nowym procesie
+    with SessionRecorder(path, batch=batch, clock=lambda: 10.0) as recorder:
+        for i, gesture in enumerate(gestures):
+            landmarks = None if gesture is Gesture.NO_HAND else make_gesture_hand(gesture)
+            raw = Gesture.NO_HAND if landmarks is None else recognizer.recognize(landmarks)
+            event = stabilizer.update(raw, landmarks, 10.0 + i * FRAME_S)
+            recorder.record(10.0 + i * FRAME_S, raw, stabilizer.stable_gesture, event, landmarks)
+
+
+def test_recorded_session_round_trips(tmp_path):
+    path = tmp_path / 'session.kcks'
+    record_session(path)
+    log = SessionLog(path)
+    assert len(log) == len(SCRIPT)
+    assert log.duration_s == pytest.approx((len(SCRIPT) - 1) * FRAME_S)
+    records = log.records
+    assert not records['has_hand'][:5].any()
+    np.testing.assert_allclose(records['landmarks'][5], make_gesture_hand(Gesture.POINTING))
+    assert log.gesture_codes(records['raw_gesture'])[5] == GESTURE_CODES[Gesture.POINTING]
+    # Przed pierwszym stabilnym gestem zapisywany jest brak gestu
+    assert records['stable_gesture'][0] == -1
+
+
+def test_slicing_by_time(tmp_path):
+    path = tmp_path / 'session.kcks'
+    record_session(path)
+    log = SessionLog(path)
+    sliced = log.between(5 * FRAME_S - 1e-6, 15 * FRAME_S - 1e-6)
+    assert len(sliced) == 10
+    assert sliced['has_hand'].all()
+
+
+def test_appending_drops_partial_record(tmp_path):
+    path = tmp_path / 'session.kcks'
+    record_session(path)
+    with path.open('ab') as file:
+        file.write(b'\x00' * (RECORD_DTYPE.itemsize // 2))
+    assert len(SessionLog(path)) == len(SCRIPT)
+    record_session(path)
+    assert len(SessionLog(path)) == 2 * len(SCRIPT)
+
+
+def test_timestamps_are_wall_clock_and_never_decrease_across_sessions(tmp_path):
+    path = tmp_path / 'session.kcks'
+    before = time.time()
+    record_session(path)
+    # Druga sesja z zegarem, który zaczął od nowa (np. po restarcie), trafia za pierwszą
+    record_session(path)
+    timestamps = SessionLog(path).records['timestamp']
+    assert before <= timestamps[0] <= time.time() + 1.0
+    assert np.all(np.diff(timestamps) >= 0.0)
+    assert len(SessionLog(path).between(0.0, None)) == 2 * len(SCRIPT)
+
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / 'other.bin'
+    path.write_bytes(b'not a session log at all')
+    with pytest.raises(ValueError, match='Not a session log'):
+        SessionLog(path)
+
+
+def test_replay_reproduces_recording_and_reacts_to_thresholds(tmp_path):
+    path = tmp_path / 'session.kcks'
+    record_session(path)
+    log = SessionLog(path)
+    result = replay(log, chunk_size=7)
+    records = log.records
+    np.testing.assert_array_equal(result.raw_gestures, log.gesture_codes(records['raw_gesture']))
+    np.testing.assert_array_equal(result.events, log.gesture_codes(records['event']))
+
+    # Wszystko "proste" - zgięte palce pięści przestają być rozpoznawane
+    strict = replay(log, camera_config=CameraConfig(finger_bent_angle_threshold=0.0))
+    assert GESTURE_CODES[Gesture.FIST] not in strict.raw_gestures.tolist()
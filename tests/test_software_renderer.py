@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from app.config import OBJECT_CONFIG
+from app.software_renderer import SoftwareView, view_rotation
+from app.state import AppState
+
+
+def test_view_rotation_is_orthonormal_and_faces_the_eye():
+    rotation = view_rotation(30.0, 45.0)
+    assert np.allclose(rotation @ rotation.T, np.eye(3), atol=1e-6)
+    eye = np.array([np.cos(np.radians(30)) * np.cos(np.radians(45)),
+                    np.cos(np.radians(30)) * np.sin(np.radians(45)),
+                    np.sin(np.radians(30))])
+    assert np.allclose(rotation @ eye, (0.0, 0.0, 1.0), atol=1e-6)
+
+
+@pytest.mark.parametrize('shape', OBJECT_CONFIG.shapes)
+def test_draw_renders_shape_in_current_color(shape):
+    view = SoftwareView(160, 120)
+    state = AppState()
+    state.shape_index = OBJECT_CONFIG.shapes.index(shape)
+    state.color_index = OBJECT_CONFIG.colors.index('#FF0000')
+    view.draw(state)
+
+    red, green, blue = np.moveaxis(view.image.astype(int), -1, 0)
+    covered = np.any(view.image != 0xF0, axis=-1)
+    shaded_red = (red > 80) & (green < 10) & (blue < 10)
+    assert covered.mean() > 0.03
+    assert shaded_red.sum() > 0.75 * covered.sum()
+    assert tuple(view.image[0, 0]) == (0xF0, 0xF0, 0xF0)
+
+
+def test_top_view_of_cube_is_centered_square():
+    view = SoftwareView(200, 200)
+    state = AppState()
+    state.angle_x, state.angle_y = 90.0, 0.0
+    view.draw(state)
+
+    covered = np.argwhere(np.any(view.image != 0xF0, axis=-1))
+    (top, left), (bottom, right) = covered.min(axis=0), covered.max(axis=0)
+    assert abs((top + bottom) / 2 - 100) <= 1 and abs((left + right) / 2 - 100) <= 1
+    assert abs((bottom - top) - (right - left)) <= 2
@@ -0,0 +1,45 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from app.startup import MARK_FIRST_FRAME, MARK_WINDOW_SHOWN, StartupTimer
+
+
+def test_mark_keeps_first_occurrence():
+    timer = StartupTimer()
+    timer.mark(MARK_WINDOW_SHOWN)
+    first = timer.marks[MARK_WINDOW_SHOWN]
+    timer.mark(MARK_WINDOW_SHOWN)
+    assert timer.marks[MARK_WINDOW_SHOWN] == first
+    assert first >= 0.0
+
+
+def test_report_appends_json_line_once(tmp_path):
+    report_path = tmp_path / 'startup.jsonl'
+    timer = StartupTimer(report_path=report_path)
+    timer.mark(MARK_WINDOW_SHOWN)
+    timer.mark(MARK_FIRST_FRAME)
+    timer.report()
+    timer.report()
+
+    lines = report_path.read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 1
+    entry = json.loads(lines[0])
+    assert list(entry['marks_ms']) == [MARK_WINDOW_SHOWN, MARK_FIRST_FRAME]
+
+
+def test_main_window_import_does_not_load_camera_modules():
+    # Osobny interpreter - w procesie testów cv2 i mediapipe są już załadowane
+    code = (
+        'import sys, app.main_window; '
+        'print(sorted(m for m in ("cv2", "mediapipe") if m in sys.modules))'
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == '[]'
@@ -1,5 +1,5 @@
 import pytest
-from app.state import AppState, Gesture
+from app.state import AppState, CameraStatus, Gesture, StateChange
 from app.config import OBJECT_CONFIG
 
 def test_initial_state():
@@ -38,3 +38,37 @@ def test_get_current_shape():
     assert state.get_current_shape() == OBJECT_CONFIG.shapes[state.shape_index]
     state.next_shape()
     assert state.get_current_shape() == OBJECT_CONFIG.shapes[state.shape_index]
+
+def test_changes_are_published_once_per_flush():
+    state = AppState()
+    seen = []
+    state.subscribe(StateChange.COLOR, lambda s: seen.append(('color', s.color_index)))
+    state.subscribe(StateChange.SHAPE, lambda s: seen.append(('shape', s.shape_index)))
+    state.next_color()
+    state.next_color()
+    assert seen == []
+    state.flush_changes()
+    assert seen == [('color', 2)]
+    state.flush_changes()
+    assert seen == [('color', 2)]
+
+def test_unchanged_values_are_not_published():
+    state = AppState()
+    seen = []
+    state.subscribe(StateChange.GESTURE, lambda s: seen.append(s.current_stable_gesture))
+    state.subscribe(StateChange.CAMERA_STATUS, lambda s: seen.append(s.camera_status))
+    state.set_stable_gesture(None)
+    assert not state.set_camera_status(CameraStatus.STARTING)
+    state.flush_changes()
+    assert seen == []
+    state.set_stable_gesture(Gesture.FIST)
+    assert state.set_camera_status(CameraStatus.AVAILABLE)
+    state.flush_changes()
+    assert seen == [Gesture.FIST, CameraStatus.AVAILABLE]
+
+def test_previous_color_and_shape_wrap_around():
+    state = AppState()
+    state.previous_color()
+    state.previous_shape()
+    assert state.color_index == len(OBJECT_CONFIG.colors) - 1
+    assert state.shape_index == len(OBJECT_CONFIG.shapes) - 1
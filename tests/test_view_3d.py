@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+
+from app.state import AppState
+from app.view_3d import ThreeDView
+
+
+def _view():
+    return ThreeDView(Figure().add_subplot(111, projection='3d'))
+
+
+def test_draw_reuses_artists_and_only_toggles_visibility():
+    view = _view()
+    state = AppState()
+    view.draw(state)
+    cube = view._artists['CUBE']
+
+    state.next_shape()
+    view.draw(state)
+    assert not cube.get_visible()
+    assert view._artists['PYRAMID'].get_visible()
+
+    state.shape_index = 0
+    view.draw(state)
+    assert view._artists['CUBE'] is cube and cube.get_visible()
+    assert len(view.ax.collections) == 2
+
+
+def test_draw_updates_color_and_angles():
+    view = _view()
+    state = AppState()
+    state.shape_index = state.shapes.index('SPHERE')
+    view.draw(state)
+    state.next_color()
+    state.angle_x, state.angle_y = 10.0, 20.0
+    view.draw(state)
+
+    colors = view._artists['SPHERE'].get_facecolor()
+    brightest = colors[np.argmax(colors[:, :3].sum(axis=1))]
+    assert np.allclose(brightest[:3], (1.0, 0.0, 0.0), atol=0.01)
+    assert (view.ax.elev, view.ax.azim) == (10.0, 20.0)
+
+
+def _draw_reference(ax, state):
+    '''Pierwotny renderer: scena budowana od nowa w każdej klatce.'''
+    ax.cla()
+    shape, color = state.get_current_shape(), state.get_current_color()
+    if shape == 'SPHERE':
+        u, v = np.mgrid[0:2 * np.pi:30j, 0:np.pi:20j]
+        x, y, z = 0.5 * np.cos(u) * np.sin(v), 0.5 * np.sin(u) * np.sin(v), 0.5 * np.cos(v)
+        ax.plot_surface(x, y, z, color=color, alpha=0.9)
+    else:
+        if shape == 'CUBE':
+            v = np.array([[-.5, -.5, -.5], [.5, -.5, -.5], [.5, .5, -.5], [-.5, .5, -.5],
+                          [-.5, -.5, .5], [.5, -.5, .5], [.5, .5, .5], [-.5, .5, .5]])
+            faces = [[0, 1, 2, 3], [4, 5, 6, 7], [0, 1, 5, 4],
+                     [2, 3, 7, 6], [0, 3, 7, 4], [1, 2, 6, 5]]
+        else:
+            v = np.array([[-.5, -.5, -.5], [.5, -.5, -.5], [.5, .5, -.5], [-.5, .5, -.5],
+                          [0, 0, .5]])
+            faces = [[0, 1, 4], [1, 2, 4], [2, 3, 4], [3, 0, 4], [0, 1, 2, 3]]
+        ax.add_collection3d(Poly3DCollection(
+            [[v[i] for i in face] for face in faces],
+            facecolors=color, linewidths=1, edgecolors='k', alpha=0.9,
+        ))
+    ax.set_facecolor('#f0f0f0')
+    ax.set_xlabel('OŚ X', color='red')
+    ax.set_ylabel('OŚ Y', color='green')
+    ax.set_zlabel('OŚ Z', color='blue')
+    ax.set_xlim(-0.7, 0.7)
+    ax.set_ylim(-0.7, 0.7)
+    ax.set_zlim(-0.7, 0.7)
+    ax.view_init(elev=state.angle_x, azim=state.angle_y)
+
+
+def _render(draw, states):
+    figure = Figure(figsize=(3, 3), dpi=80)
+    canvas = FigureCanvasAgg(figure)
+    ax = figure.add_subplot(111, projection='3d')
+    images = []
+    for state in states:
+        draw(ax, state)
+        canvas.draw()
+        images.append(np.asarray(canvas.buffer_rgba()).copy())
+    return images
+
+
+@pytest.mark.parametrize('shape', ['CUBE', 'PYRAMID', 'SPHERE'])
+def test_retained_view_is_pixel_identical_to_reference(shape):
+    states = []
+    for angles, colors in [((30.0, 45.0), 0), ((10.0, -60.0), 1), ((-20.0, 200.0), 2)]:
+        state = AppState()
+        state.shape_index = state.shapes.index(shape)
+        state.color_index = colors
+        state.angle_x, state.angle_y = angles
+        states.append(state)
+
+    views = {}
+
+    def draw_retained(ax, state):
+        views.setdefault('view', ThreeDView(ax)).draw(state)
+
+    expected = _render(_draw_reference, states)
+    actual = _render(draw_retained, states)
+    for reference, image in zip(expected, actual, strict=True):
+        np.testing.assert_array_equal(image, reference)
@@ -0,0 +1,60 @@
+import os
+
+from PIL import Image
+
+from app.state import Gesture
+from app.widgets import GestureHighlighter, load_icon
+
+
+def _write_icon(path, color):
+    Image.new('RGBA', (256, 256), color).save(path)
+
+
+def test_load_icon_resizes_and_caches(tmp_path):
+    icon_path = tmp_path / 'fist.png'
+    cache_dir = tmp_path / 'cache'
+    _write_icon(icon_path, (255, 0, 0, 255))
+
+    icon = load_icon(icon_path, (48, 48), cache_dir)
+    assert icon.size == (48, 48)
+    cached = list(cache_dir.iterdir())
+    assert len(cached) == 1
+
+    assert load_icon(icon_path, (48, 48), cache_dir).getpixel((24, 24)) == (255, 0, 0, 255)
+
+
+def test_load_icon_invalidates_cache_when_source_changes(tmp_path):
+    icon_path = tmp_path / 'fist.png'
+    cache_dir = tmp_path / 'cache'
+    _write_icon(icon_path, (255, 0, 0, 255))
+    load_icon(icon_path, (48, 48), cache_dir)
+
+    _write_icon(icon_path, (0, 0, 255, 255))
+    stat = icon_path.stat()
+    os.utime(icon_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_icon(icon_path, (48, 48), cache_dir).getpixel((24, 24)) == (0, 0, 255, 255)
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+class FakeWidget:
+    def __init__(self):
+        self.styles = []
+
+    def config(self, style):
+        self.styles.append(style)
+
+
+def test_highlighter_restyles_only_on_change():
+    gestures = [Gesture.FIST, Gesture.POINTING, Gesture.UNKNOWN]
+    frames = {gesture: FakeWidget() for gesture in gestures}
+    labels = {gesture: FakeWidget() for gesture in gestures}
+    highlighter = GestureHighlighter(frames, labels)
+
+    highlighter.show(Gesture.FIST)
+    highlighter.show(Gesture.FIST)
+    highlighter.show(Gesture.NO_HAND)
+
+    assert frames[Gesture.FIST].styles == ['Highlight.TFrame', 'TFrame']
+    assert labels[Gesture.UNKNOWN].styles == ['Highlight.TLabel']
+    assert frames[Gesture.POINTING].styles == []